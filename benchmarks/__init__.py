@@ -0,0 +1,4 @@
+"""Benchmarks of hot paths of Selenium Libraries.
+
+Run `python -m benchmarks --output result.json` to measure against the local fixture server without network.
+"""
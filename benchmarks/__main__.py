@@ -0,0 +1,79 @@
+"""Runs the benchmarks and writes the results as JSON.
+
+Compare the results of two commits to find regressions, for example:
+    python -m benchmarks --output before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.cases import BENCHMARKS
+from benchmarks.cases import Context
+from benchmarks.server import FixtureServer
+from seleniumlibraries.browser import Browser
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--output", type=Path, help="The path to write results. Defaults to standard output.")
+    parser.add_argument("--repeat", type=int, default=5, help="How many times to measure each operation.")
+    parser.add_argument(
+        "names",
+        nargs="*",
+        help=f"The benchmarks to run from: {', '.join(BENCHMARKS)}. Defaults to all.",
+    )
+    arguments = parser.parse_args()
+    unknown = set(arguments.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+    return arguments
+
+
+def get_commit() -> str | None:
+    try:
+        # Reason: Fixed command without user input.
+        process = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+        )  # nosec B603 B607
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return process.stdout.strip()
+
+
+def main() -> None:
+    arguments = parse_arguments()
+    results = {}
+    with FixtureServer() as server, Browser() as browser, tempfile.TemporaryDirectory() as directory:
+        context = Context(server, browser, Path(directory), arguments.repeat)
+        for name in arguments.names or BENCHMARKS:
+            results[name] = BENCHMARKS[name](context)
+    report = json.dumps(
+        {
+            "commit": get_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": arguments.repeat,
+            "results": results,
+        },
+        indent=2,
+    )
+    if arguments.output is None:
+        sys.stdout.write(report + "\n")
+    else:
+        arguments.output.write_text(report + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""The benchmarks of hot paths."""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+
+from selenium.webdriver.common.by import By
+
+from seleniumlibraries.browser import Browser
+from seleniumlibraries.browser import DownloadWaiter
+from seleniumlibraries.element import get_text
+from seleniumlibraries.extract import Column
+from seleniumlibraries.extract import extract_rows
+from seleniumlibraries.interaction import Step
+from seleniumlibraries.memory import measure_rss
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from benchmarks.server import FixtureServer
+
+# Seconds between samples of RSS of Chrome.
+INTERVAL_RSS = 0.05
+
+
+@dataclass
+class Context:
+    """The environment shared by benchmarks.
+
+    Args:
+        server: The fixture server.
+        browser: The browser which benchmarks except startup use.
+        directory: The directory to write files into.
+        repeat: How many times to measure each operation.
+    """
+
+    server: FixtureServer
+    browser: Browser
+    directory: Path
+    repeat: int
+
+
+def summarize(samples: list[float]) -> dict[str, Any]:
+    return {
+        "count": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "max": max(samples),
+    }
+
+
+def measure(function: Callable[[], object], repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def measure_peak_rss(pid: int | None, function: Callable[[], object]) -> int | None:
+    """Runs the function while sampling RSS of Chrome in a thread, returns the peak, None when it can't be measured."""
+    if pid is None:
+        function()
+        return None
+    samples: list[int] = []
+    stopped = threading.Event()
+
+    def sample() -> None:
+        while True:
+            rss = measure_rss(pid)
+            if rss is not None:
+                samples.append(rss)
+            if stopped.wait(INTERVAL_RSS):
+                return
+
+    thread = threading.Thread(target=sample)
+    thread.start()
+    try:
+        function()
+    finally:
+        stopped.set()
+        thread.join()
+    return max(samples, default=None)
+
+
+def benchmark_startup(context: Context) -> dict[str, Any]:
+    """Seconds to launch and quit Browser."""
+    starts, quits = [], []
+    for _ in range(context.repeat):
+        start = time.perf_counter()
+        browser = Browser()
+        started = time.perf_counter()
+        browser.__exit__(None, None, None)
+        starts.append(started - start)
+        quits.append(time.perf_counter() - started)
+    return {"start": summarize(starts), "quit": summarize(quits)}
+
+
+def benchmark_wait_for(context: Context) -> dict[str, Any]:
+    """Seconds from the element appears until wait_for() returns."""
+    driver = context.browser.driver
+    result = {}
+    for observe in (True, False):
+        latencies = []
+        for _ in range(context.repeat):
+            driver.get(context.server.url("/delayed?ms=200"))
+            context.browser.wait_for(By.ID, "delayed", observe=observe)
+            returned = time.time()
+            appeared = driver.execute_script(
+                "return performance.timeOrigin + performance.getEntriesByName('appeared')[0].startTime;",
+            )
+            latencies.append(returned - appeared / 1000)
+        result["observe" if observe else "poll"] = summarize(latencies)
+    return result
+
+
+def benchmark_get_texts(context: Context) -> dict[str, Any]:
+    """Throughput of getting texts element by element, at once and extracting rows."""
+    elements = 1000
+    rows = 5000
+    driver = context.browser.driver
+    driver.get(context.server.url(f"/texts?elements={elements}"))
+    items = driver.find_elements(By.CSS_SELECTOR, "li.item")
+    text = measure(lambda: [get_text(item) for item in items], context.repeat)
+    texts = measure(lambda: context.browser.get_texts(By.CSS_SELECTOR, "li.item"), context.repeat)
+    context.browser.driver.get(context.server.url(f"/table?rows={rows}"))
+    table = context.browser.driver.find_element(By.ID, "items")
+    columns = [Column("td:nth-child(1)"), Column("a", "href"), Column("td:nth-child(3)")]
+    extract = measure(lambda: extract_rows(table, "tr", columns), context.repeat)
+    return {
+        "get_text": {**summarize(text), "elements_per_second": elements / statistics.median(text)},
+        "get_texts": {**summarize(texts), "elements_per_second": elements / statistics.median(texts)},
+        "extract_rows": {**summarize(extract), "rows_per_second": rows / statistics.median(extract)},
+    }
+
+
+def benchmark_save_as_pdf(context: Context) -> dict[str, Any]:
+    """Seconds and peak memory to save a large document as PDF.
+
+    The peak of Chrome is sampled RSS including its child processes, None when /proc isn't available.
+    The peak of Python is traced by tracemalloc, which doesn't count Chrome.
+    """
+    context.browser.driver.get(context.server.url("/document?pages=50"))
+    path = context.directory / "document.pdf"
+    samples, peaks_python, peaks_chrome = [], [], []
+    for _ in range(context.repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        peaks_chrome.append(measure_peak_rss(context.browser.pid, lambda: context.browser.save_as_pdf(path)))
+        samples.append(time.perf_counter() - start)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks_python.append(peak)
+    measured = [peak for peak in peaks_chrome if peak is not None]
+    return {
+        **summarize(samples),
+        "python_peak_memory": max(peaks_python),
+        "chrome_peak_rss": max(measured, default=None),
+        "size": path.stat().st_size,
+    }
+
+
+def benchmark_wait_for_download(context: Context) -> dict[str, Any]:
+    """Seconds to detect completed downloads."""
+    delay = 0.1
+    latencies = []
+    for number in range(context.repeat):
+        directory = context.directory / f"detection-{number}"
+        directory.mkdir()
+        downloading = directory / "file.bin.crdownload"
+        downloading.touch()
+        timer = threading.Timer(delay, downloading.rename, args=(directory / "file.bin",))
+        start = time.perf_counter()
+        timer.start()
+        DownloadWaiter(directory).wait(10)
+        latencies.append(time.perf_counter() - start - delay)
+        timer.join()
+    count = 5
+    size = 1024 * 1024
+
+    def download() -> None:
+        context.browser.reset()
+        for number in range(count):
+            context.browser.driver.get(context.server.url(f"/download/{number}.bin?size={size}"))
+        context.browser.wait_for_download(60, number_of_files=count)
+
+    return {"detection": summarize(latencies), "downloads": summarize(measure(download, context.repeat))}
+
+
+def benchmark_form(context: Context) -> dict[str, Any]:
+    """Seconds to fill and submit a form field by field with WebDriver commands and with run_steps()."""
+    fields = 10
+    browser = context.browser
+
+    def commands() -> float:
+        browser.driver.get(context.server.url(f"/form?fields={fields}"))
+        start = time.perf_counter()
+        for number in range(fields):
+            element = browser.wait_for(By.NAME, f"field-{number}")
+            element.clear()
+            element.send_keys(f"Value {number}")
+        browser.scroll_and_click(By.ID, "submit")
+        browser.wait_for(By.XPATH, "//p[@id='submitted' and text()]")
+        return time.perf_counter() - start
+
+    def steps() -> float:
+        browser.driver.get(context.server.url(f"/form?fields={fields}"))
+        start = time.perf_counter()
+        browser.run_steps(
+            [
+                *(Step.fill(By.NAME, f"field-{number}", f"Value {number}") for number in range(fields)),
+                Step.click(By.ID, "submit"),
+                Step.wait_for(By.XPATH, "//p[@id='submitted' and text()]"),
+            ],
+        )
+        return time.perf_counter() - start
+
+    return {
+        name: summarize([function() for _ in range(context.repeat)])
+        for name, function in (("commands", commands), ("run_steps", steps))
+    }
+
+
+BENCHMARKS: dict[str, Callable[[Context], dict[str, Any]]] = {
+    "startup": benchmark_startup,
+    "wait_for": benchmark_wait_for,
+    "get_texts": benchmark_get_texts,
+    "save_as_pdf": benchmark_save_as_pdf,
+    "wait_for_download": benchmark_wait_for_download,
+    "form": benchmark_form,
+}
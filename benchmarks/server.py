@@ -0,0 +1,140 @@
+"""The local HTTP server which serves generated pages for benchmarks."""
+
+from __future__ import annotations
+
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+
+def page(title: str, body: str, script: str = "") -> str:
+    return f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>{body}<script>{script}</script></body>
+</html>
+"""
+
+
+def table(rows: int) -> str:
+    cells = "".join(
+        f"<tr><td>{number}</td><td><a href='/items/{number}'>Item {number}</a></td><td>{number * 100}</td></tr>"
+        for number in range(rows)
+    )
+    return page("Table", f"<table id='items'><tbody>{cells}</tbody></table>")
+
+
+def texts(elements: int) -> str:
+    items = "".join(f"<li class='item'>Text of item {number}</li>" for number in range(elements))
+    return page("Texts", f"<ul>{items}</ul>")
+
+
+def delayed(milliseconds: int) -> str:
+    script = f"""setTimeout(() => {{
+  const element = document.createElement("div");
+  element.id = "delayed";
+  element.textContent = "Appeared";
+  document.body.appendChild(element);
+  performance.mark("appeared");
+}}, {milliseconds});"""
+    return page("Delayed", "<p>Waiting</p>", script)
+
+
+def document(pages: int) -> str:
+    paragraph = "<p>" + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 40 + "</p>"
+    sections = "".join(
+        f"<section style='page-break-after: always'><h1>Page {number}</h1>{paragraph * 3}</section>"
+        for number in range(pages)
+    )
+    return page("Document", sections)
+
+
+def form(fields: int) -> str:
+    inputs = "".join(f"<input name='field-{number}'>" for number in range(fields))
+    script = """document.getElementById("form").addEventListener("submit", (event) => {
+  event.preventDefault();
+  document.getElementById("submitted").textContent = "Submitted";
+});"""
+    return page(
+        "Form",
+        f"<form id='form'>{inputs}<button id='submit' type='submit'>Submit</button></form><p id='submitted'></p>",
+        script,
+    )
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves the generated pages.
+
+    - /table?rows=N: A table of N rows with links.
+    - /texts?elements=N: A list of N elements with texts.
+    - /delayed?ms=N: An element with id "delayed" appears N milliseconds after loading.
+    - /document?pages=N: A printable document of N pages.
+    - /form?fields=N: A form of N text inputs which shows "Submitted" without navigation.
+    - /download/<name>?size=M: A file of M bytes as attachment.
+    """
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        query = {key: int(values[0]) for key, values in parse_qs(url.query).items()}
+        if url.path.startswith("/download/"):
+            self.send_body(b"\0" * query.get("size", 1024), "application/octet-stream", attachment=True)
+            return
+        pages = {
+            "/table": lambda: table(query.get("rows", 1000)),
+            "/texts": lambda: texts(query.get("elements", 1000)),
+            "/delayed": lambda: delayed(query.get("ms", 200)),
+            "/document": lambda: document(query.get("pages", 50)),
+            "/form": lambda: form(query.get("fields", 10)),
+        }
+        generate = pages.get(url.path)
+        if generate is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        self.send_body(generate().encode(), "text/html; charset=utf-8")
+
+    def send_body(self, body: bytes, content_type: str, *, attachment: bool = False) -> None:
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if attachment:
+            self.send_header("Content-Disposition", "attachment")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Keeps the output of benchmarks clean."""
+
+
+class FixtureServer:
+    """The server running in a background thread on a free port of localhost."""
+
+    def __init__(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, name="fixture-server", daemon=True)
+
+    def __enter__(self) -> Self:
+        self.thread.start()
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def url(self, path: str) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host!s}:{port}{path}"
@@ -1,12 +1,99 @@
-"""Top-level package for Selenium Libraries."""
+"""Top-level package for Selenium Libraries.
 
-from seleniumlibraries.browser import *  # noqa: F403
-from seleniumlibraries.element import *  # noqa: F403
-from seleniumlibraries.page import *  # noqa: F403
+Modules are imported on the first access to their attributes, so that importing the package doesn't load Selenium.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from seleniumlibraries.asynchronous import *  # noqa: F403
+    from seleniumlibraries.batch import *  # noqa: F403
+    from seleniumlibraries.blocking import *  # noqa: F403
+    from seleniumlibraries.browser import *  # noqa: F403
+    from seleniumlibraries.cache import *  # noqa: F403
+    from seleniumlibraries.devtools import *  # noqa: F403
+    from seleniumlibraries.download import *  # noqa: F403
+    from seleniumlibraries.element import *  # noqa: F403
+    from seleniumlibraries.extract import *  # noqa: F403
+    from seleniumlibraries.instrumentation import *  # noqa: F403
+    from seleniumlibraries.interaction import *  # noqa: F403
+    from seleniumlibraries.memory import *  # noqa: F403
+    from seleniumlibraries.network import *  # noqa: F403
+    from seleniumlibraries.page import *  # noqa: F403
+    from seleniumlibraries.pool import *  # noqa: F403
+    from seleniumlibraries.profiles import *  # noqa: F403
+    from seleniumlibraries.runner import *  # noqa: F403
+    from seleniumlibraries.service import *  # noqa: F403
+    from seleniumlibraries.snapshot import *  # noqa: F403
+    from seleniumlibraries.tab import *  # noqa: F403
 
 __version__ = "0.1.0"
 
-__all__ = []
-__all__ += browser.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
-__all__ += element.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
-__all__ += page.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
+# The module of each public attribute, which has to match `__all__` of the module.
+MODULES = {
+    "AsyncBrowser": "asynchronous",
+    "PdfJob": "batch",
+    "PdfResult": "batch",
+    "render_pdfs": "batch",
+    "ResourceBlocking": "blocking",
+    "Browser": "browser",
+    "HttpCache": "cache",
+    "HttpCacheInterceptor": "cache",
+    "DevToolsConnection": "devtools",
+    "DevToolsSession": "devtools",
+    "Download": "download",
+    "DownloadTracker": "download",
+    "get_text": "element",
+    "get_texts": "element",
+    "Column": "extract",
+    "extract_rows": "extract",
+    "iter_rows": "extract",
+    "Instrumentation": "instrumentation",
+    "Measurement": "instrumentation",
+    "Step": "interaction",
+    "StepResult": "interaction",
+    "run_steps": "interaction",
+    "MemoryUsage": "memory",
+    "NetworkMonitor": "network",
+    "Locator": "page",
+    "WebPage": "page",
+    "BrowserPool": "pool",
+    "copy_profile": "profiles",
+    "load_cookies": "profiles",
+    "save_profile": "profiles",
+    "Checkpoint": "runner",
+    "JobResult": "runner",
+    "run_jobs": "runner",
+    "DriverService": "service",
+    "Snapshot": "snapshot",
+    "SnapshotElement": "snapshot",
+    "Tab": "tab",
+    "load_in_tabs": "tab",
+}
+
+__all__ = list(MODULES)
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Imports the module of the attribute on the first access.
+
+    - PEP 562 - Module __getattr__ and __dir__
+      https://peps.python.org/pep-0562/
+    """
+    if name in MODULES.values():
+        return importlib.import_module(f"{__name__}.{name}")
+    if name not in MODULES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f"{__name__}.{MODULES[name]}"), name)
+    # Reason: Caches so that the next access doesn't call __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,255 @@
+"""The module about driving browsers from asyncio event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import TypeVar
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.wait import POLL_FREQUENCY
+from typing_extensions import Self
+
+from seleniumlibraries.browser import Browser
+from seleniumlibraries.browser import DownloadWaiter
+from seleniumlibraries.browser import TabWaiter
+from seleniumlibraries.interaction import run_steps
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from concurrent.futures import Executor
+    from pathlib import Path
+    from types import TracebackType
+
+    from selenium.webdriver.remote.webelement import WebElement
+
+    from seleniumlibraries.cache import HttpCache
+    from seleniumlibraries.cache import HttpCacheInterceptor
+    from seleniumlibraries.download import DownloadTracker
+    from seleniumlibraries.interaction import Step
+    from seleniumlibraries.interaction import StepResult
+    from seleniumlibraries.memory import MemoryUsage
+    from seleniumlibraries.network import NetworkMonitor
+    from seleniumlibraries.snapshot import Snapshot
+    from seleniumlibraries.tab import Tab
+
+__all__ = ["AsyncBrowser"]
+
+T = TypeVar("T")
+
+
+class AsyncBrowser:
+    """Awaitable facade of Browser so that one event loop can drive many sessions concurrently.
+
+    Blocking calls to WebDriver run in the executor one by one per session. Waits await on the event loop without
+    occupying any thread or the session: they poll with short commands, sleeping on the event loop between them, or wake
+    up on events of the file system and DevTools Protocol.
+    Methods of the returned objects, like Tab or DownloadTracker, block, so call them through run().
+
+    Usage:
+        async with AsyncBrowser() as browser:
+            await browser.get("https://example.com/")
+            await browser.save_as_pdf(Path("example.pdf"))
+
+    Args:
+        executor: The executor to run blocking calls. When omitted, the default executor of the event loop is used.
+        **kwargs: The arguments of Browser.
+    """
+
+    def __init__(self, *, executor: Executor | None = None, **kwargs: Any) -> None:  # noqa: ANN401
+        self.executor = executor
+        self.kwargs = kwargs
+        self._browser: Browser | None = None
+        self._lock: asyncio.Lock | None = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    @property
+    def browser(self) -> Browser:
+        """The underlying Browser. Don't call its methods on the event loop since they block."""
+        if self._browser is None:
+            msg = "The browser is not started."
+            raise RuntimeError(msg)
+        return self._browser
+
+    async def start(self) -> None:
+        self._lock = asyncio.Lock()
+        self._browser = await self.run(functools.partial(Browser, **self.kwargs))
+
+    async def close(self) -> None:
+        browser = self.browser
+        try:
+            await self.run(browser.__exit__, None, None, None)
+        finally:
+            self._browser = None
+
+    async def run(self, function: Callable[..., T], *args: Any) -> T:  # noqa: ANN401
+        """Runs the blocking function in the executor after the preceding calls of this session finish.
+
+        WebDriver doesn't support concurrent commands in one session.
+        """
+        if self._lock is None:
+            msg = "The browser is not started."
+            raise RuntimeError(msg)
+        async with self._lock:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    async def get(self, url: str) -> None:
+        await self.run(self.browser.driver.get, url)
+
+    async def execute_script(self, script: str, *args: Any) -> Any:  # noqa: ANN401
+        return await self.run(self.browser.driver.execute_script, script, *args)
+
+    async def reset(self) -> None:
+        await self.run(self.browser.reset)
+
+    async def wait_for(
+        self,
+        by: str,
+        value: str,
+        *,
+        timeout: float | None = None,
+        poll_frequency: float = POLL_FREQUENCY,
+    ) -> WebElement:
+        """Waits for the element to be present, see Browser.wait_for().
+
+        Finds elements with one command at a time, sleeping poll_frequency seconds on the event loop between them.
+        """
+        deadline = time.monotonic() + (timeout or self.browser.timeout)
+        while True:
+            elements = await self.run(self.browser.driver.find_elements, by, value)
+            if elements:
+                return elements[0]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                msg = f"Timeout waiting for element: {by}={value}"
+                raise TimeoutException(msg)
+            await asyncio.sleep(min(poll_frequency, remaining))
+
+    async def get_texts(self, by: str, value: str) -> list[str]:
+        return await self.run(self.browser.get_texts, by, value)
+
+    async def scroll_and_click(self, by: str, value: str) -> None:
+        await self.run(self.browser.scroll_and_click, by, value)
+
+    async def save_as_pdf(self, path: Path, *, options: dict[str, Any] | None = None) -> Path:
+        return await self.run(functools.partial(self.browser.save_as_pdf, path, options=options))
+
+    async def run_steps(
+        self,
+        steps: Iterable[Step],
+        *,
+        timeout: float | None = None,
+        poll_frequency: float = POLL_FREQUENCY,
+    ) -> list[StepResult]:
+        """Runs the interaction in the page, see Browser.run_steps().
+
+        Each script checks elements without waiting, and the steps from the one whose element is missing run again
+        after sleeping poll_frequency seconds on the event loop.
+        """
+        deadline = time.monotonic() + (timeout or self.browser.timeout)
+        results: list[StepResult] = []
+        pending = list(steps)
+        while True:
+            batch = await self.run(functools.partial(run_steps, self.browser.driver, pending, timeout=0))
+            failed = next((index for index, result in enumerate(batch) if not result.succeeded), None)
+            remaining = deadline - time.monotonic()
+            if failed is None or not batch[failed].timed_out or remaining <= 0:
+                return [*results, *batch]
+            results.extend(batch[:failed])
+            pending = pending[failed:]
+            await asyncio.sleep(min(poll_frequency, remaining))
+
+    async def snapshot(self) -> Snapshot:
+        return await self.run(self.browser.snapshot)
+
+    async def wait_for_download(self, timeout: float, number_of_files: int | None = None) -> list[Path]:
+        """Waits for downloads on the event loop, see Browser.wait_for_download()."""
+        waiter = DownloadWaiter(self.browser.directory_download, number_of_files)
+        return await waiter.wait_async(timeout)
+
+    async def track_downloads(self) -> DownloadTracker:
+        """See Browser.track_downloads(). Its methods block, so enter and wait on it through run()."""
+        return await self.run(self.browser.track_downloads)
+
+    async def cache_http(self, cache: HttpCache, *, mode: str = "auto") -> HttpCacheInterceptor:
+        """See Browser.cache_http(). Its methods block, so enter it through run()."""
+        return await self.run(functools.partial(self.browser.cache_http, cache, mode=mode))
+
+    async def monitor_network(self) -> NetworkMonitor:
+        """See Browser.monitor_network(). Await its wait_for_idle_async() and wait_for_load_state_async()."""
+        return await self.run(self.browser.monitor_network)
+
+    async def wait_for_network_idle(
+        self,
+        idle_ms: int = 500,
+        max_inflight: int = 0,
+        *,
+        timeout: float | None = None,
+    ) -> None:
+        """Waits for network idle of the current tab, see Browser.wait_for_network_idle()."""
+        monitor = await self.monitor_network()
+        await monitor.wait_for_idle_async(idle_ms / 1000, max_inflight, timeout=timeout or self.browser.timeout)
+
+    async def wait_for_load_state(self, state: str = "load", *, timeout: float | None = None) -> None:
+        """Waits for the load state of the current tab, see Browser.wait_for_load_state()."""
+        monitor = await self.monitor_network()
+        await monitor.wait_for_load_state_async(state, timeout=timeout or self.browser.timeout)
+
+    async def wait_for_closing_tab(self, expected_number_of_tabs: int, timeout: float) -> None:
+        """Waits for closing tab, see Browser.wait_for_closing_tab()."""
+        waiter = await self.create_tab_waiter()
+        handles = await waiter.wait_async(lambda handles: len(handles) <= expected_number_of_tabs, timeout, self.run)
+        if handles is not None:
+            return
+        await self.run(self.browser.driver.close)
+        if await self.count_tabs() > expected_number_of_tabs:
+            msg = "Timeout waiting for closing tab."
+            raise TimeoutError(msg)
+
+    async def wait_for_new_tab(self, known_handles: Iterable[str], timeout: float) -> str:
+        """Waits for a new tab, see Browser.wait_for_new_tab()."""
+        known = set(known_handles)
+        waiter = await self.create_tab_waiter()
+        handles = await waiter.wait_async(lambda handles: not known.issuperset(handles), timeout, self.run)
+        if handles is None:
+            msg = "Timeout waiting for new tab."
+            raise TimeoutError(msg)
+        return next(handle for handle in handles if handle not in known)
+
+    async def create_tab_waiter(self) -> TabWaiter:
+        devtools = await self.run(lambda: self.browser.devtools)
+        return TabWaiter(self.browser.driver, devtools)
+
+    async def open_tab(self) -> Tab:
+        """See Browser.open_tab(). Methods of the returned Tab block, so call them through run()."""
+        return await self.run(self.browser.open_tab)
+
+    async def count_tabs(self) -> int:
+        return len(await self.run(lambda: self.browser.driver.window_handles))
+
+    async def memory_usage(self) -> MemoryUsage:
+        return await self.run(self.browser.memory_usage)
+
+    async def recycle(self) -> bool:
+        return await self.run(self.browser.recycle)
+
+    async def restart(self) -> None:
+        await self.run(self.browser.restart)
+
+    async def save_profile(self, template: Path) -> None:
+        await self.run(self.browser.save_profile, template)
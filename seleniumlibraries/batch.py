@@ -0,0 +1,131 @@
+"""The module about rendering many pages as PDF in parallel."""
+
+from __future__ import annotations
+
+import itertools
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+from selenium.common.exceptions import WebDriverException
+
+from seleniumlibraries.pool import BrowserPool
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+__all__ = ["PdfJob", "PdfResult", "render_pdfs"]
+
+
+class PdfJob(NamedTuple):
+    """The page to render as PDF.
+
+    Plain tuples of (url, path, options) are also accepted by render_pdfs().
+    A relative path is resolved against the current directory when the job is read.
+    """
+
+    url: str
+    path: Path
+    options: dict[str, Any] | None = None
+
+
+@dataclass
+class PdfResult:
+    """The result of PdfJob.
+
+    Args:
+        job: The job.
+        path: The path of the saved PDF, None when the job failed.
+        error: The error of the last attempt when the job failed.
+        attempts: How many times the job was tried.
+    """
+
+    job: PdfJob
+    path: Path | None
+    error: Exception | None
+    attempts: int
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+def render_pdfs(
+    jobs: Iterable[PdfJob | tuple[Any, ...]],
+    *,
+    concurrency: int = 4,
+    retries: int = 2,
+    pool: BrowserPool | None = None,
+) -> Iterator[PdfResult]:
+    """Renders pages as PDF across browsers in parallel and yields results in the order of completion.
+
+    Each browser runs in its own Chrome processes, so that threads are enough to use all cores.
+    Jobs are read lazily, so that jobs can be a generator of huge number of pages.
+
+    Usage:
+        for result in render_pdfs(jobs, concurrency=8):
+            if not result.succeeded:
+                logger.error("Failed to render %s", result.job.url, exc_info=result.error)
+
+    Args:
+        jobs: The pages to render.
+        concurrency: How many browsers render at once.
+        retries: How many times to retry a failed job.
+        pool: The pool to check out browsers. When omitted, the pool of concurrency browsers is created and closed.
+    """
+    own_pool = pool is None
+    pool = BrowserPool(max_size=concurrency) if pool is None else pool
+    iterator = (to_job(job) for job in jobs)
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="render-pdf") as executor:
+            pending: set[Future[PdfResult]] = {
+                executor.submit(render, pool, job, retries) for job in itertools.islice(iterator, concurrency)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+                pending |= {
+                    executor.submit(render, pool, job, retries) for job in itertools.islice(iterator, len(done))
+                }
+    finally:
+        if own_pool:
+            pool.close()
+
+
+def to_job(job: PdfJob | tuple[Any, ...]) -> PdfJob:
+    """Resolves the path against the current directory.
+
+    Browser.save_as_pdf() resolves a relative path against its download directory, which is removed on returning the
+    browser to the pool.
+    """
+    job = PdfJob(*job)
+    return job._replace(path=Path(job.path).resolve())
+
+
+def render(pool: BrowserPool, job: PdfJob, retries: int) -> PdfResult:
+    errors: list[Exception] = []
+    for attempt in range(1, retries + 2):
+        path = render_once(pool, job, errors)
+        if path is not None:
+            return PdfResult(job, path, None, attempt)
+        getLogger(__name__).warning("Failed to render %s (attempt %d).", job.url, attempt, exc_info=errors[-1])
+    return PdfResult(job, None, errors[-1], retries + 1)
+
+
+def render_once(pool: BrowserPool, job: PdfJob, errors: list[Exception]) -> Path | None:
+    try:
+        with pool.checkout() as browser:
+            browser.driver.get(job.url)
+            return browser.save_as_pdf(job.path, options=job.options)
+    except (WebDriverException, OSError) as error:
+        errors.append(error)
+        return None
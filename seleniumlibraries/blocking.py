@@ -0,0 +1,66 @@
+"""The module about blocking resources to load pages faster."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+__all__ = ["ResourceBlocking"]
+
+
+@dataclass(frozen=True)
+class ResourceBlocking:
+    """Resources which the browser doesn't load.
+
+    Scraping text and printing PDF rarely need them, and skipping them cuts both page-load latency and bandwidth.
+
+    Args:
+        images: Whether to block images.
+        fonts: Whether to block web fonts.
+        media: Whether to block audio and video.
+        trackers: Whether to block well-known analytics and advertisement services.
+        url_patterns: Additional URL patterns to block. Wildcards ("*") are allowed.
+    """
+
+    images: bool = True
+    fonts: bool = True
+    media: bool = True
+    trackers: bool = True
+    url_patterns: tuple[str, ...] = ()
+
+    EXTENSIONS_FONT = ("woff", "woff2", "ttf", "otf", "eot")
+    EXTENSIONS_MEDIA = ("mp3", "mp4", "m4a", "ogg", "wav", "webm", "mov", "avi")
+    PATTERNS_TRACKER = (
+        "*://*.google-analytics.com/*",
+        "*://*.googletagmanager.com/*",
+        "*://*.googlesyndication.com/*",
+        "*://*.doubleclick.net/*",
+        "*://*.amazon-adsystem.com/*",
+        "*://connect.facebook.net/*",
+        "*://*.hotjar.com/*",
+        "*://*.scorecardresearch.com/*",
+    )
+
+    def prefs(self) -> dict[str, Any]:
+        """The preferences of Chrome.
+
+        The content setting blocks images more reliably than URL patterns since images have various extensions.
+        """
+        # Reason: 2 means "block" in content settings.
+        return {"profile.managed_default_content_settings.images": 2} if self.images else {}
+
+    def patterns(self) -> list[str]:
+        """The URL patterns for Network.setBlockedURLs of DevTools Protocol."""
+        patterns = list(self.url_patterns)
+        if self.fonts:
+            patterns.extend(self.to_patterns(self.EXTENSIONS_FONT))
+        if self.media:
+            patterns.extend(self.to_patterns(self.EXTENSIONS_MEDIA))
+        if self.trackers:
+            patterns.extend(self.PATTERNS_TRACKER)
+        return patterns
+
+    @staticmethod
+    def to_patterns(extensions: tuple[str, ...]) -> list[str]:
+        """The patterns of URLs with the extensions, with or without query."""
+        return [pattern for extension in extensions for pattern in (f"*.{extension}", f"*.{extension}?*")]
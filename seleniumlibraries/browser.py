@@ -4,68 +4,296 @@ from __future__ import annotations
 
 import base64
 import getpass
+import shutil
+import tempfile
+import threading
 import time
+from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import BinaryIO
+from typing import Callable
 
+from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver import ActionChains
 from selenium.webdriver import Chrome
 from selenium.webdriver import ChromeOptions
+from selenium.webdriver.remote.command import Command
 from selenium.webdriver.support.expected_conditions import presence_of_element_located
+from selenium.webdriver.support.wait import POLL_FREQUENCY
 from selenium.webdriver.support.wait import WebDriverWait
 from typing_extensions import Self
 
+from seleniumlibraries.cache import HttpCacheInterceptor
+from seleniumlibraries.devtools import ChangeCondition
+from seleniumlibraries.devtools import DevToolsConnection
+from seleniumlibraries.download import DownloadTracker
+from seleniumlibraries.element import get_texts
+from seleniumlibraries.instrumentation import measured
+from seleniumlibraries.interaction import run_steps
+from seleniumlibraries.locator import JAVASCRIPT_FUNCTION_WAIT_FOR_ELEMENT
+from seleniumlibraries.memory import MemoryUsage
+from seleniumlibraries.memory import find_browser_process
+from seleniumlibraries.memory import measure_rss
+from seleniumlibraries.network import NetworkMonitor
+from seleniumlibraries.profiles import copy_profile
+from seleniumlibraries.profiles import load_cookies
+from seleniumlibraries.profiles import save_profile
+from seleniumlibraries.snapshot import JAVASCRIPT_SNAPSHOT
+from seleniumlibraries.snapshot import Snapshot
+from seleniumlibraries.tab import Tab
+from seleniumlibraries.watcher import watch
+
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
     from types import TracebackType
 
     from selenium.webdriver.remote.webelement import WebElement
 
+    from seleniumlibraries.blocking import ResourceBlocking
+    from seleniumlibraries.cache import HttpCache
+    from seleniumlibraries.devtools import Message
+    from seleniumlibraries.instrumentation import Instrumentation
+    from seleniumlibraries.interaction import Step
+    from seleniumlibraries.interaction import StepResult
+    from seleniumlibraries.service import DriverService
+    from seleniumlibraries.watcher import DirectoryWatcher
+
 __all__ = ["Browser"]
 
+# Resolves as soon as the element appears, instead of polling over HTTP.
+JAVASCRIPT_WAIT_FOR = f"""{JAVASCRIPT_FUNCTION_WAIT_FOR_ELEMENT}
+const [by, value, timeout, callback] = arguments;
+waitForElement(by, value, Date.now() + timeout).then(callback);
+"""
+
 
 class DownloadWaiter:
     """Waiter for download.
 
+    Wakes up as soon as files in the download directory change instead of sleeping fixed intervals.
+
     - Answer: python selenium, find out when a download has completed? - Stack Overflow
       https://stackoverflow.com/a/51949811/12721873
     """
 
     def __init__(self, directory_download: Path, nfiles: int | None = None) -> None:
-        self.seconds = 0
         self.waiting = True
         self.directory_download = directory_download
         self.nfiles = nfiles
 
-    def wait(self, timeout: int) -> None:
-        while self.waiting and self.seconds < timeout:
-            self._wait()
+    def wait(self, timeout: float) -> list[Path]:
+        """Waits until downloads finish or timeout (in seconds) elapses.
+
+        Returns: The paths of the completed files.
+        """
+        with watch(self.directory_download) as watcher:
+            for remaining in self._intervals(watcher, timeout):
+                watcher.wait(remaining)
+            return self._completed(watcher)
+
+    async def wait_async(self, timeout: float) -> list[Path]:
+        """Awaitable version of wait() which doesn't block the event loop."""
+        with watch(self.directory_download) as watcher:
+            for remaining in self._intervals(watcher, timeout):
+                await watcher.wait_async(remaining)
+            return self._completed(watcher)
+
+    def _intervals(self, watcher: DirectoryWatcher, timeout: float) -> Iterator[float]:
+        """Yields how many seconds to wait for the next change until downloads finish or timeout elapses."""
+        deadline = time.monotonic() + timeout
+        self._check(watcher.names)
+        while self.waiting:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            yield remaining
+            self._check(watcher.names)
+
+    def _completed(self, watcher: DirectoryWatcher) -> list[Path]:
+        return sorted(self.directory_download / name for name in watcher.names if not self._is_downloading(name))
+
+    def _check(self, names: set[str]) -> None:
+        self.waiting = (
+            not names
+            or (self.nfiles is not None and len(names) != self.nfiles)
+            or any(self._is_downloading(name) for name in names)
+        )
+
+    @staticmethod
+    def _is_downloading(name: str) -> bool:
+        return name.endswith(".crdownload")
+
+
+class TabWaiter:
+    """Waiter for tabs to open or close.
+
+    Wakes up as soon as Chrome reports a target is created or destroyed instead of sleeping fixed intervals.
 
-    def _wait(self) -> None:
-        time.sleep(0.5)
-        self.waiting = False
-        files = list(self.directory_download.iterdir())
-        if self.nfiles and len(files) != self.nfiles:
-            self.waiting = True
-        for fname in files:
-            if str(fname).endswith(".crdownload"):
-                self.waiting = True
-        self.seconds += 1
+    - Target.targetCreated
+      https://chromedevtools.github.io/devtools-protocol/tot/Target/#event-targetCreated
+    - Target.targetDestroyed
+      https://chromedevtools.github.io/devtools-protocol/tot/Target/#event-targetDestroyed
+    """
+
+    METHODS = ("Target.targetCreated", "Target.targetDestroyed")
+    # Checks window handles also at this interval in seconds, in case Chromedriver lags behind the events.
+    INTERVAL_CHECK = 0.5
+
+    def __init__(self, driver: Chrome, devtools: DevToolsConnection) -> None:
+        self.driver = driver
+        self.devtools = devtools
+        self.changed = ChangeCondition()
+        self.changes = 0
+
+    def wait(self, predicate: Callable[[list[str]], bool], timeout: float) -> list[str] | None:
+        """Waits until predicate accepts window handles or timeout (in seconds) elapses.
+
+        Returns: The accepted window handles, None when timeout.
+        """
+        deadline = time.monotonic() + timeout
+        handles: list[str] = self.driver.window_handles
+        if predicate(handles):
+            return handles
+        try:
+            self._start()
+            while True:
+                with self.changed:
+                    changes = self.changes
+                handles = self.driver.window_handles
+                if predicate(handles):
+                    return handles
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                with self.changed:
+                    if self.changes == changes:
+                        self.changed.wait(min(remaining, self.INTERVAL_CHECK))
+        finally:
+            self._stop()
+
+    async def wait_async(
+        self,
+        predicate: Callable[[list[str]], bool],
+        timeout: float,
+        run: Callable[[Callable[[], Any]], Awaitable[Any]],
+    ) -> list[str] | None:
+        """Awaitable version of wait() which doesn't block the event loop.
+
+        Args:
+            predicate: Accepts window handles.
+            timeout: How many seconds to wait.
+            run: Runs blocking calls to WebDriver and DevTools Protocol, for example, AsyncBrowser.run().
+        """
+        deadline = time.monotonic() + timeout
+        with self.changed.subscribe() as changed:
+            handles: list[str] = await run(lambda: self.driver.window_handles)
+            if predicate(handles):
+                return handles
+            try:
+                await run(self._start)
+                while True:
+                    handles = await run(lambda: self.driver.window_handles)
+                    if predicate(handles):
+                        return handles
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    await self.changed.wait_async(changed, min(remaining, self.INTERVAL_CHECK))
+            finally:
+                await run(self._stop)
+
+    def _start(self) -> None:
+        # Reason: _stop() removes all listeners, so add them before the command which may fail.
+        for method in self.METHODS:
+            self.devtools.add_listener(method, self._notify)
+        self.devtools.execute("Target.setDiscoverTargets", {"discover": True})
+
+    def _stop(self) -> None:
+        for method in self.METHODS:
+            self.devtools.remove_listener(method, self._notify)
+
+    def _notify(self, params: Message) -> None:
+        if params.get("targetInfo", {}).get("type", "page") != "page":
+            return
+        with self.changed:
+            self.changes += 1
+            self.changed.notify_all()
 
 
 class Browser:
-    """The browser."""
+    """The browser.
 
-    DIRECTORY_DOWNLOAD = Path("/workspace/downloads")
+    Each instance has its own profile directory and download directory, and Chrome chooses a free port for remote
+    debugging, so that many instances can run side by side on one host. The temporary directories are removed on exit.
 
-    def __init__(self) -> None:
+    Args:
+        directory_download: The directory to download files into. It is kept on exit. When omitted, a temporary
+            directory is used and removed on exit.
+        resource_blocking: The resources not to load, for example, images and fonts.
+        page_load_strategy: "normal" waits for the load event, "eager" waits for DOMContentLoaded,
+            "none" doesn't wait on navigation.
+        profile_template: The profile to start from, for example, with logged in cookies, local storage and HTTP cache.
+            It is copied, so that instances don't change it. Create it by save_profile().
+        instrumentation: Measures WebDriver commands and methods of Browser when provided.
+        memory_limit: The resident set size in bytes of Chrome over which recycle() restarts it.
+        service: The chromedriver to share with other instances. When omitted, each instance launches its own.
+    """
+
+    # The size in bytes to read stream of DevTools Protocol at once.
+    SIZE_CHUNK = 1024 * 1024
+    # The minimum interval in seconds to measure memory usage in recycle(), since it reads every process in /proc.
+    INTERVAL_MEMORY_CHECK = 5.0
+    # The commands after which elements found before belong to another document.
+    COMMANDS_NAVIGATION = frozenset(
+        (
+            Command.GET,
+            Command.GO_BACK,
+            Command.GO_FORWARD,
+            Command.REFRESH,
+            Command.NEW_WINDOW,
+            Command.SWITCH_TO_WINDOW,
+            Command.SWITCH_TO_FRAME,
+            Command.SWITCH_TO_PARENT_FRAME,
+        ),
+    )
+
+    # Reason: Each argument is an independent option of Chrome. pylint: disable-next=too-many-arguments
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        directory_download: Path | None = None,
+        resource_blocking: ResourceBlocking | None = None,
+        page_load_strategy: str = "normal",
+        profile_template: Path | None = None,
+        instrumentation: Instrumentation | None = None,
+        memory_limit: int | None = None,
+        service: DriverService | None = None,
+    ) -> None:
         if getpass.getuser() == "root":
             msg = (
                 "Selenium can't be run as root and shouldn't be used with option: `--no-sandbox` for security. "
                 "Use command `sudo -u <user> pipenv run pytest`."
             )
             raise RuntimeError(msg)
+        self.logger = getLogger(__name__)
+        self.temporary_directories: list[Path] = []
+        self._devtools: DevToolsConnection | None = None
+        self.directory_profile = self._create_temporary_directory("seleniumlibraries-profile-")
+        if directory_download is None:
+            directory_download = self._create_temporary_directory("seleniumlibraries-download-")
+        self.directory_download = directory_download
+        self.resource_blocking = resource_blocking
+        self.instrumentation = instrumentation
+        # Serializes switching tabs, see Tab.
+        self.lock = threading.RLock()
+        self.tab_loaded = threading.Condition()
         options = ChromeOptions()
+        options.page_load_strategy = page_load_strategy
         # Reason: URL too long.
         # - herokuでselenium利用時にクラッシュする場合の解決方法 #Python - Qiita
         #   https://qiita.com/kozasa/items/8a9d181e43fa0a85f6e5#%EF%BC%91-selenium%E3%81%AE%E5%BC%95%E6%95%B0%E3%81%AB%E7%9C%81%E3%83%A1%E3%83%A2%E3%83%AA%E5%8C%96%E3%81%99%E3%82%8B%E3%81%9F%E3%82%81%E3%81%AE%E5%BC%95%E6%95%B0%E3%82%92%E3%81%A4%E3%81%91%E3%82%8B)  pylint: disable=line-too-long
@@ -74,7 +302,8 @@ class Browser:
         options.add_argument("--disable-dev-shm-usage")
         # PDF印刷設定
         options.add_argument("--kiosk-printing")
-        options.add_argument("--remote-debugging-port=9222")
+        # Chromedriver lets Chrome choose a free port for remote debugging when no port is specified.
+        options.add_argument(f"--user-data-dir={self.directory_profile}")
         # User-Agent を設定しないと WAON のページがエラーページを表示する仕様になっていました
         # User-Agent の設定方法は次を参考にしました:
         # - Selenium User-Agent Guide: Changing and Rotating Headers
@@ -86,8 +315,8 @@ class Browser:
         options.add_argument(f"--user-agent={custom_user_agent}")
         prefs = {
             # To download files
-            "download.default_directory": str(self.DIRECTORY_DOWNLOAD),
-            "savefile.default_directory": str(self.DIRECTORY_DOWNLOAD),
+            "download.default_directory": str(self.directory_download),
+            "savefile.default_directory": str(self.directory_download),
             # # PDF印刷設定
             # "download.directory_upgrade": True,
             "download.prompt_for_download": False,
@@ -95,10 +324,183 @@ class Browser:
             "plugins.always_open_pdf_externally": True,
             # "printing.print_preview_sticky_settings.appState": json.dumps(appState),
         }
+        if resource_blocking is not None:
+            prefs.update(resource_blocking.prefs())
         options.add_experimental_option("prefs", prefs)
-        self.driver = Chrome(options=options)
-        self.driver.set_window_size(480, 600)
-        self.wait = WebDriverWait(self.driver, 10)
+        self.options = options
+        self.service = service
+        self.navigations = 0
+        self.timeout = 10.0
+        self.memory_limit = memory_limit
+        self.memory_checked = time.monotonic()
+        self._pid: int | None = None
+        try:
+            if profile_template is not None:
+                copy_profile(profile_template, self.directory_profile)
+            self._start()
+        except BaseException:
+            self._remove_temporary_directories()
+            raise
+        if profile_template is not None:
+            try:
+                self._restore_cookies(profile_template)
+            except BaseException:
+                self.__exit__(None, None, None)
+                raise
+
+    def _start(self) -> None:
+        self.driver = (
+            Chrome(options=self.options) if self.service is None else self.service.create_driver(self.options)
+        )
+        self.wait = WebDriverWait(self.driver, self.timeout)
+        # The default of WebDriver.
+        self.script_timeout = 30.0
+        # Sessions of DevTools belong to the connection to this Chrome, see monitor_network().
+        self.network_monitors: dict[str, NetworkMonitor] = {}
+        try:
+            self._count_navigations()
+            if self.instrumentation is not None:
+                self.instrumentation.wrap_driver(self.driver)
+            self.driver.set_window_size(480, 600)
+            self.block_resources()
+        except BaseException:
+            self.driver.quit()
+            raise
+
+    def _count_navigations(self) -> None:
+        """Counts commands which change the document to locate elements in, see WebPage."""
+        execute = self.driver.execute
+
+        def execute_counting(driver_command: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+            try:
+                response: dict[str, Any] = execute(driver_command, params)
+            finally:
+                if driver_command in self.COMMANDS_NAVIGATION:
+                    self.navigations += 1
+            return response
+
+        # Reason: To count commands issued by any method of WebDriver.
+        self.driver.execute = execute_counting  # type: ignore[method-assign,assignment]
+
+    def block_resources(self) -> None:
+        """Blocks the URL patterns of resource_blocking in the current tab.
+
+        Network.setBlockedURLs applies per tab, so call this after switching to a new tab.
+        """
+        if self.resource_blocking is None:
+            return
+        patterns = self.resource_blocking.patterns()
+        if patterns:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+    def open_tab(self) -> Tab:
+        """Opens a blank tab.
+
+        WebDriver stays on the current tab, use methods of the returned Tab to act on the new one.
+        """
+        with self.lock:
+            handle_current = self.driver.current_window_handle
+            self.driver.switch_to.new_window("tab")
+            handle = self.driver.current_window_handle
+            self.block_resources()
+            self.driver.switch_to.window(handle_current)
+        return Tab(self, handle)
+
+    def _restore_cookies(self, profile_template: Path) -> None:
+        cookies = load_cookies(profile_template)
+        if cookies:
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+
+    def save_profile(self, template: Path) -> None:
+        """Saves the current profile as the template for profile_template, replacing the existing one.
+
+        Call it after the state to keep, for example, logging in, is settled. The old template is removed, so don't
+        start other instances from the template while saving.
+        """
+        cookies = self.driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        save_profile(self.directory_profile, template, cookies)
+
+    def _create_temporary_directory(self, prefix: str) -> Path:
+        directory = Path(tempfile.mkdtemp(prefix=prefix))
+        self.temporary_directories.append(directory)
+        return directory
+
+    def _remove_temporary_directories(self) -> None:
+        for directory in self.temporary_directories:
+            shutil.rmtree(directory, ignore_errors=True)
+        self.temporary_directories.clear()
+
+    @property
+    def debugger_address(self) -> str:
+        """The host and port of the DevTools endpoint which Chrome chose."""
+        return str(self.driver.capabilities["goog:chromeOptions"]["debuggerAddress"])
+
+    @property
+    def devtools(self) -> DevToolsConnection:
+        """The connection to DevTools Protocol to receive events, connected on first access."""
+        if self._devtools is None:
+            self._devtools = DevToolsConnection.connect(self.debugger_address, instrumentation=self.instrumentation)
+        return self._devtools
+
+    @property
+    def pid(self) -> int | None:
+        """The process ID of Chrome, None when it can't be inspected through /proc."""
+        if self._pid is None:
+            self._pid = find_browser_process(f"--user-data-dir={self.directory_profile}")
+        return self._pid
+
+    def memory_usage(self) -> MemoryUsage:
+        """Measures memory usage of Chrome."""
+        # https://chromedevtools.github.io/devtools-protocol/tot/Runtime/#method-getHeapUsage
+        heap = self.driver.execute_cdp_cmd("Runtime.getHeapUsage", {})
+        pid = self.pid
+        return MemoryUsage(
+            rss=None if pid is None else measure_rss(pid),
+            js_heap_used=int(heap["usedSize"]),
+            js_heap_total=int(heap["totalSize"]),
+        )
+
+    def recycle(self) -> bool:
+        """Restarts Chrome when its resident set size exceeds memory_limit, see restart().
+
+        WebPage calls this before each operation. Memory is measured at most once in INTERVAL_MEMORY_CHECK.
+
+        Returns: True when restarted.
+        """
+        if self.memory_limit is None or time.monotonic() - self.memory_checked < self.INTERVAL_MEMORY_CHECK:
+            return False
+        self.memory_checked = time.monotonic()
+        pid = self.pid
+        rss = None if pid is None else measure_rss(pid)
+        if rss is None or rss <= self.memory_limit:
+            return False
+        self.logger.info("Restarting Chrome since its RSS %d bytes exceeds %d bytes", rss, self.memory_limit)
+        self.restart()
+        return True
+
+    def restart(self) -> None:
+        """Restarts Chrome with the same profile, then restores cookies and the URL of the current tab.
+
+        Other tabs are closed, and elements, Tab and sessions of DevTools obtained before become invalid.
+        """
+        with self.lock:
+            url = self.driver.current_url
+            cookies = self.driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+            self._quit()
+            self._pid = None
+            self._start()
+            if cookies:
+                self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            self.driver.get(url)
+
+    def _quit(self) -> None:
+        try:
+            if self._devtools is not None:
+                self._devtools.close()
+        finally:
+            self._devtools = None
+            self.driver.quit()
 
     def __enter__(self) -> Self:
         return self
@@ -109,45 +511,256 @@ class Browser:
         _exc_value: BaseException | None,
         _traceback: TracebackType | None,
     ) -> None:
-        self.driver.quit()
+        try:
+            self._quit()
+        finally:
+            self._remove_temporary_directories()
 
-    def wait_for(self, by: str, value: str, *, timeout: float | None = None) -> WebElement:
+    @measured("Browser.reset")
+    def reset(self) -> None:
+        """Resets the session so that the next job starts from a clean state.
+
+        Closes all tabs except the first one, clears cookies, storage of the origins opened in the tabs and the files
+        in the download directory, then opens a blank page. Raises WebDriverException when the session is dead.
+        """
+        handles = self.driver.window_handles
+        for handle in reversed(handles):
+            self.driver.switch_to.window(handle)
+            self._clear_storage()
+            if handle != handles[0]:
+                self.driver.close()
+                self._stop_monitoring_network(handle)
+        self.driver.switch_to.window(handles[0])
+        self.driver.get("about:blank")
+        self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for path in self.directory_download.glob("*"):
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+
+    def _clear_storage(self) -> None:
+        origin = self.driver.execute_script("return window.location.origin;")
+        # Reason: Opaque origins like about:blank are reported as "null".
+        if origin and origin != "null":
+            self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+
+    @measured("Browser.wait_for")
+    def wait_for(
+        self,
+        by: str,
+        value: str,
+        *,
+        timeout: float | None = None,
+        observe: bool = True,
+        poll_frequency: float = POLL_FREQUENCY,
+    ) -> WebElement:
+        """Waits for the element to be present.
+
+        Args:
+            by: Locator strategy.
+            value: Locator.
+            timeout: How many seconds to wait until timing out.
+            observe: Whether to watch the DOM with MutationObserver in one round trip. When the page navigates
+                during the wait, falls back to polling.
+            poll_frequency: How many seconds to sleep between polling.
+        """
+        timeout = timeout or self.timeout
+        deadline = time.monotonic() + timeout
+        if observe:
+            try:
+                element = self._observe(by, value, timeout)
+            except WebDriverException:
+                # Reason: The script is interrupted by navigation, then the element may appear on the next page.
+                pass
+            else:
+                if element is None:
+                    msg = f"Timeout waiting for element: {by}={value}"
+                    raise TimeoutException(msg)
+                return element
+        wait = WebDriverWait(self.driver, max(deadline - time.monotonic(), 0), poll_frequency=poll_frequency)
         # Reason: Certainly returns WebElement.
-        wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
         return wait.until(presence_of_element_located((by, value)))
 
+    def _observe(self, by: str, value: str, timeout: float) -> WebElement | None:
+        self._extend_script_timeout(timeout)
+        element: WebElement | None = self.driver.execute_async_script(JAVASCRIPT_WAIT_FOR, by, value, timeout * 1000)
+        return element
+
+    def _extend_script_timeout(self, timeout: float) -> None:
+        # Reason: The script times out itself, so WebDriver should wait longer than it.
+        script_timeout = timeout + 5
+        if script_timeout > self.script_timeout:
+            self.driver.set_script_timeout(script_timeout)
+            self.script_timeout = script_timeout
+
+    @measured("Browser.get_texts")
+    def get_texts(self, by: str, value: str) -> list[str]:
+        """Gets texts of all elements matching the locator in two round trips regardless of the number of elements."""
+        return get_texts(self.driver.find_elements(by, value))
+
+    @measured("Browser.snapshot")
+    def snapshot(self) -> Snapshot:
+        """Captures the document of the current tab in one round trip to query and get texts without WebDriver."""
+        return Snapshot(self.driver.execute_script(JAVASCRIPT_SNAPSHOT))
+
+    @measured("Browser.scroll_and_click")
     def scroll_and_click(self, by: str, value: str) -> None:
         """Scroll to element and click it."""
         chains = ActionChains(self.driver)
         chains.move_to_element(self.wait_for(by, value)).click().perform()
 
-    def save_as_pdf(self, path: Path, *, options: dict[str, Any] | None = None) -> None:
-        """Since window.print() didn't work and couldn't debug no more."""
+    @measured("Browser.run_steps")
+    def run_steps(self, steps: Iterable[Step], *, timeout: float | None = None) -> list[StepResult]:
+        """Runs the interaction in the page, for example, fills and submits the form.
+
+        Takes one round trip for all steps, plus one for each click through W3C Actions and one to continue after it,
+        instead of several WebDriver commands for each field. See run_steps() of interaction.py for details.
+
+        Args:
+            steps: The steps, see Step.
+            timeout: How many seconds to wait for elements of all steps in total.
+        Returns: The results of all steps in the order of steps.
+        """
+        timeout = timeout or self.timeout
+        self._extend_script_timeout(timeout)
+        return run_steps(self.driver, steps, timeout=timeout)
+
+    @measured("Browser.save_as_pdf")
+    def save_as_pdf(self, path: Path, *, options: dict[str, Any] | None = None) -> Path:
+        """Since window.print() didn't work and couldn't debug no more.
+
+        The PDF is transferred as a stream in chunks and written incrementally, so that memory usage doesn't depend on
+        the size of the PDF. To transfer it at once, specify `{"transferMode": "ReturnAsBase64"}` in options.
+
+        Args:
+            path: The path to save PDF. A relative path is resolved from the download directory.
+            options: The parameters of Page.printToPDF.
+
+        Returns: The path of the saved PDF.
+        """
         # https://timvdlippe.github.io/devtools-protocol/tot/Page#method-printToPDF
-        options = options or {}
-        pdf_base64 = self.driver.execute_cdp_cmd("Page.printToPDF", options)
-        with (self.DIRECTORY_DOWNLOAD / path).open("wb") as file:
-            file.write(base64.b64decode(pdf_base64["data"]))
+        options = {"transferMode": "ReturnAsStream", **(options or {})}
+        path = self.directory_download / path
+        result = self.driver.execute_cdp_cmd("Page.printToPDF", options)
+        with path.open("wb") as file:
+            if options["transferMode"] == "ReturnAsStream":
+                self._read_stream(result["stream"], file)
+            else:
+                file.write(base64.b64decode(result["data"]))
+        return path
 
-    def wait_for_download(self, timeout: int, number_of_files: int | None = None) -> None:
+    def _read_stream(self, handle: str, file: BinaryIO) -> None:
+        # https://chromedevtools.github.io/devtools-protocol/tot/IO/#method-read
+        try:
+            while True:
+                chunk = self.driver.execute_cdp_cmd("IO.read", {"handle": handle, "size": self.SIZE_CHUNK})
+                data = chunk["data"]
+                file.write(base64.b64decode(data) if chunk.get("base64Encoded") else data.encode())
+                if chunk.get("eof"):
+                    return
+        finally:
+            self.driver.execute_cdp_cmd("IO.close", {"handle": handle})
+
+    @measured("Browser.wait_for_download")
+    def wait_for_download(self, timeout: float, number_of_files: int | None = None) -> list[Path]:
         """Wait for downloads to finish with a specified timeout.
 
         Args:
-            directory: The path to the folder where the files will be downloaded.
             timeout: How many seconds to wait until timing out.
             number_of_files: If provided, also wait for the expected number of files.
+
+        Returns: The paths of the completed files in the download directory.
         """
-        waiter = DownloadWaiter(self.DIRECTORY_DOWNLOAD, number_of_files)
-        waiter.wait(timeout)
+        waiter = DownloadWaiter(self.directory_download, number_of_files)
+        return waiter.wait(timeout)
 
-    def wait_for_closing_tab(self, expected_number_of_tabs: int, timeout: int) -> None:
-        """Wait for closing tab."""
-        seconds = 0
-        while len(self.driver.window_handles) > expected_number_of_tabs:
-            time.sleep(0.5)
-            seconds += 1
-            if seconds == timeout:
-                self.driver.close()
-            if seconds > timeout:
-                msg = "Timeout waiting for closing tab."
-                raise TimeoutError(msg)
+    def monitor_network(self) -> NetworkMonitor:
+        """The monitor of requests and the load state of the current tab, started on the first call for the tab.
+
+        Call it before the action which loads the page, so that the monitor counts all of its requests.
+        """
+        handle = self.driver.current_window_handle
+        monitor = self.network_monitors.get(handle)
+        if monitor is None:
+            monitor = NetworkMonitor(self.devtools.attach(handle))
+            monitor.start()
+            self.network_monitors[handle] = monitor
+        return monitor
+
+    def _stop_monitoring_network(self, handle: str) -> None:
+        monitor = self.network_monitors.pop(handle, None)
+        if monitor is not None:
+            monitor.stop()
+
+    @measured("Browser.wait_for_network_idle")
+    def wait_for_network_idle(
+        self,
+        idle_ms: int = 500,
+        max_inflight: int = 0,
+        *,
+        timeout: float | None = None,
+    ) -> None:
+        """Waits until requests in flight of the current tab stay max_inflight or less for idle_ms milliseconds.
+
+        Raises TimeoutError when timeout (in seconds) elapses. See monitor_network() to count all requests.
+        """
+        self.monitor_network().wait_for_idle(idle_ms / 1000, max_inflight, timeout=timeout or self.timeout)
+
+    @measured("Browser.wait_for_load_state")
+    def wait_for_load_state(self, state: str = "load", *, timeout: float | None = None) -> None:
+        """Waits until the document of the current tab reaches "domcontentloaded" or "load".
+
+        Returns immediately when it already has. Raises TimeoutError when timeout (in seconds) elapses.
+        """
+        self.monitor_network().wait_for_load_state(state, timeout=timeout or self.timeout)
+
+    def track_downloads(self) -> DownloadTracker:
+        """Creates the tracker of downloads based on events of DevTools Protocol.
+
+        Use it as a context manager to start and stop tracking.
+        """
+        return DownloadTracker(self.devtools, self.directory_download)
+
+    def cache_http(self, cache: HttpCache, *, mode: str = "auto") -> HttpCacheInterceptor:
+        """Creates the interceptor to record and replay HTTP responses of the current tab.
+
+        Use it as a context manager to start and stop intercepting.
+        Replay mode serves only recorded responses, so that repeated runs and tests skip the network.
+
+        Args:
+            cache: The archive of responses.
+            mode: "record", "replay" or "auto". See HttpCacheInterceptor.
+        """
+        session = self.devtools.attach(self.driver.current_window_handle)
+        return HttpCacheInterceptor(session, cache, mode)
+
+    @measured("Browser.wait_for_closing_tab")
+    def wait_for_closing_tab(self, expected_number_of_tabs: int, timeout: float) -> None:
+        """Waits until the number of tabs decreases to expected_number_of_tabs.
+
+        Returns immediately when it already has. When timeout (in seconds) elapses, closes the current tab.
+        """
+        waiter = TabWaiter(self.driver, self.devtools)
+        if waiter.wait(lambda handles: len(handles) <= expected_number_of_tabs, timeout) is not None:
+            return
+        self.driver.close()
+        if len(self.driver.window_handles) > expected_number_of_tabs:
+            msg = "Timeout waiting for closing tab."
+            raise TimeoutError(msg)
+
+    @measured("Browser.wait_for_new_tab")
+    def wait_for_new_tab(self, known_handles: Iterable[str], timeout: float) -> str:
+        """Waits for a tab which isn't in known_handles, for example, a popup of printing or downloading.
+
+        Take known_handles before the action which opens the tab, so that a tab opened quickly isn't missed.
+
+        Returns: The window handle of the new tab.
+        """
+        known = set(known_handles)
+        waiter = TabWaiter(self.driver, self.devtools)
+        handles = waiter.wait(lambda handles: not known.issuperset(handles), timeout)
+        if handles is None:
+            msg = "Timeout waiting for new tab."
+            raise TimeoutError(msg)
+        return next(handle for handle in handles if handle not in known)
@@ -0,0 +1,280 @@
+"""The module about recording and replaying HTTP responses."""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from seleniumlibraries.devtools import DevToolsSession
+    from seleniumlibraries.devtools import Message
+
+__all__ = ["HttpCache", "HttpCacheInterceptor"]
+
+
+@dataclass
+class CachedResponse:
+    """Response stored in HttpCache."""
+
+    status: int
+    headers: list[dict[str, str]]
+    body: bytes
+
+
+@dataclass
+class Entry:
+    """Metadata of the response in the index of HttpCache."""
+
+    method: str
+    url: str
+    status: int
+    headers: list[dict[str, str]]
+    size: int
+    accessed: float
+
+
+class HttpCache:
+    """On-disk archive of HTTP responses keyed by method, URL and hash of request body.
+
+    The least recently used responses are evicted when the total size of bodies exceeds max_bytes.
+    Each change of the index is appended to the journal, which save() merges into the index.
+
+    Args:
+        directory: The directory to store the index and bodies. It can be shared between runs.
+        max_bytes: The upper limit of the total size of bodies.
+    """
+
+    NAME_INDEX = "index.json"
+    NAME_JOURNAL = "journal.jsonl"
+
+    def __init__(self, directory: Path, *, max_bytes: int = 512 * 1024 * 1024) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        directory.mkdir(parents=True, exist_ok=True)
+        path_index = directory / self.NAME_INDEX
+        index = json.loads(path_index.read_text(encoding="utf-8")) if path_index.exists() else {}
+        self.index = {key: Entry(**entry) for key, entry in index.items()}
+        self._replay_journal()
+
+    @staticmethod
+    def create_key(method: str, url: str, body: bytes | None = None) -> str:
+        digest = hashlib.sha256(f"{method} {url}\n".encode())
+        digest.update(body or b"")
+        return digest.hexdigest()
+
+    def get(self, method: str, url: str, body: bytes | None = None) -> CachedResponse | None:
+        key = self.create_key(method, url, body)
+        with self.lock:
+            entry = self.index.get(key)
+            if entry is None:
+                return None
+            entry.accessed = time.time()
+        try:
+            content = (self.directory / key).read_bytes()
+        except FileNotFoundError:
+            return None
+        return CachedResponse(entry.status, entry.headers, content)
+
+    def put(self, method: str, url: str, body: bytes | None, response: CachedResponse) -> None:
+        key = self.create_key(method, url, body)
+        (self.directory / key).write_bytes(response.body)
+        entry = Entry(method, url, response.status, response.headers, len(response.body), time.time())
+        with self.lock:
+            self.index[key] = entry
+            evicted = self._evict()
+            self._append([(key, entry), *((key_evicted, None) for key_evicted in evicted)])
+
+    def save(self) -> None:
+        """Saves the index including access times to keep the order of eviction."""
+        with self.lock:
+            self._save()
+
+    def _evict(self) -> list[str]:
+        """Returns: The keys of evicted responses."""
+        evicted: list[str] = []
+        total = sum(entry.size for entry in self.index.values())
+        for key, entry in sorted(self.index.items(), key=lambda item: item[1].accessed):
+            if total <= self.max_bytes:
+                break
+            del self.index[key]
+            with contextlib.suppress(FileNotFoundError):
+                (self.directory / key).unlink()
+            total -= entry.size
+            evicted.append(key)
+        return evicted
+
+    def _append(self, changes: list[tuple[str, Entry | None]]) -> None:
+        """Appends changes of the index to the journal instead of rewriting the whole index, None means removal."""
+        with (self.directory / self.NAME_JOURNAL).open("a", encoding="utf-8") as file:
+            file.writelines(
+                json.dumps([key, None if entry is None else asdict(entry)]) + "\n" for key, entry in changes
+            )
+
+    def _replay_journal(self) -> None:
+        try:
+            lines = (self.directory / self.NAME_JOURNAL).read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                key, entry = json.loads(line)
+            except ValueError:
+                # Reason: The last line may be incomplete when the run was interrupted.
+                continue
+            if entry is None:
+                self.index.pop(key, None)
+            else:
+                self.index[key] = Entry(**entry)
+
+    def _save(self) -> None:
+        # Reason: Writes atomically so that an interrupted run doesn't break the index.
+        file_descriptor, path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            json.dump({key: asdict(entry) for key, entry in self.index.items()}, file)
+        Path(path).replace(self.directory / self.NAME_INDEX)
+        # Reason: The index includes all changes in the journal now.
+        with contextlib.suppress(FileNotFoundError):
+            (self.directory / self.NAME_JOURNAL).unlink()
+
+
+class HttpCacheInterceptor:
+    """Records responses into HttpCache and replays them through Fetch domain of DevTools Protocol.
+
+    Modes:
+        "record": Always loads from network and records responses.
+        "replay": Loads only from the cache, and fails requests which aren't recorded, so that no network is needed.
+        "auto": Replays recorded responses, and loads and records the others.
+
+    - Fetch Domain - Chrome DevTools Protocol
+      https://chromedevtools.github.io/devtools-protocol/tot/Fetch/
+    """
+
+    MODES = ("record", "replay", "auto")
+    # These headers describe the encoded body, while Fetch.getResponseBody returns the decoded body.
+    HEADERS_EXCLUDED = ("content-encoding", "content-length", "transfer-encoding")
+
+    def __init__(self, session: DevToolsSession, cache: HttpCache, mode: str = "auto") -> None:
+        if mode not in self.MODES:
+            msg = f"Unsupported mode: {mode}"
+            raise ValueError(msg)
+        self.logger = getLogger(__name__)
+        self.session = session
+        self.cache = cache
+        self.mode = mode
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        stages = ["Request"] if self.mode == "replay" else ["Request", "Response"]
+        self.session.add_listener("Fetch.requestPaused", self._on_request_paused)
+        patterns = [{"urlPattern": "*", "requestStage": stage} for stage in stages]
+        self.session.execute("Fetch.enable", {"patterns": patterns})
+
+    def stop(self) -> None:
+        self.session.execute("Fetch.disable")
+        self.session.remove_listener("Fetch.requestPaused", self._on_request_paused)
+        self.cache.save()
+
+    def _on_request_paused(self, params: Message) -> None:
+        if "responseStatusCode" in params or "responseErrorReason" in params:
+            self._on_response(params)
+        else:
+            self._on_request(params)
+
+    def _on_request(self, params: Message) -> None:
+        request_id = params["requestId"]
+        try:
+            if self._replay(params):
+                return
+        except Exception:
+            # Reason: The paused request hangs the page until continued or failed.
+            self.logger.exception("Failed to replay the response of %s", params["request"]["url"])
+        if self.mode == "replay":
+            self.session.execute("Fetch.failRequest", {"requestId": request_id, "errorReason": "InternetDisconnected"})
+            return
+        self.session.execute("Fetch.continueRequest", {"requestId": request_id})
+
+    def _replay(self, params: Message) -> bool:
+        """Fulfills the request with the recorded response, returns False when there is nothing to replay."""
+        if self.mode == "record":
+            return False
+        request = params["request"]
+        response = self.cache.get(request["method"], request["url"], self._get_post_data(request))
+        if response is None:
+            return False
+        self.session.execute("Fetch.fulfillRequest", self._to_fulfill(params["requestId"], response))
+        return True
+
+    def _on_response(self, params: Message) -> None:
+        request_id = params["requestId"]
+        try:
+            if "responseStatusCode" in params:
+                self._record(params)
+        except Exception:
+            # Reason: The page should load even when failing to record.
+            self.logger.exception("Failed to record the response of %s", params["request"]["url"])
+        finally:
+            # Reason: The paused request hangs the page until continued.
+            self.session.execute("Fetch.continueRequest", {"requestId": request_id})
+
+    def _record(self, params: Message) -> None:
+        request = params["request"]
+        response = CachedResponse(
+            params["responseStatusCode"],
+            [
+                header
+                for header in params.get("responseHeaders", [])
+                if header["name"].lower() not in self.HEADERS_EXCLUDED
+            ],
+            self._get_body(params["requestId"], params["responseStatusCode"]),
+        )
+        self.cache.put(request["method"], request["url"], self._get_post_data(request), response)
+
+    def _get_body(self, request_id: str, status: int) -> bytes:
+        # Reason: Redirect responses have no body to get.
+        if 300 <= status < 400:  # noqa: PLR2004
+            return b""
+        result = self.session.execute("Fetch.getResponseBody", {"requestId": request_id})
+        body: str = result["body"]
+        return base64.b64decode(body) if result.get("base64Encoded") else body.encode()
+
+    @staticmethod
+    def _get_post_data(request: dict[str, Any]) -> bytes | None:
+        post_data: str | None = request.get("postData")
+        return None if post_data is None else post_data.encode()
+
+    @staticmethod
+    def _to_fulfill(request_id: str, response: CachedResponse) -> Message:
+        return {
+            "requestId": request_id,
+            "responseCode": response.status,
+            "responseHeaders": response.headers,
+            "body": base64.b64encode(response.body).decode(),
+        }
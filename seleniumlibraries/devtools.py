@@ -0,0 +1,264 @@
+"""The module about Chrome DevTools Protocol."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import queue
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextlib import suppress
+from logging import getLogger
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Dict
+from urllib.request import urlopen
+
+from selenium.common.exceptions import WebDriverException
+from typing_extensions import Self
+from websocket import WebSocketException
+from websocket import create_connection
+
+from seleniumlibraries.instrumentation import measure_size
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+
+    from seleniumlibraries.instrumentation import Instrumentation
+
+__all__ = ["DevToolsConnection", "DevToolsSession"]
+
+# Reason: Python 3.7 and 3.8 can't subscript dict at runtime.
+Message = Dict[str, Any]
+Listener = Callable[[Message], None]
+
+
+class ChangeCondition(threading.Condition):
+    """Condition which listeners notify of changes, waking up coroutines as well as threads.
+
+    Listeners run on the thread of DevToolsConnection, so coroutines are woken up through their event loops.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.subscribers: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    def notify_all(self) -> None:
+        super().notify_all()
+        for loop, event in self.subscribers:
+            loop.call_soon_threadsafe(event.set)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Event]:
+        """Creates the event which is set on each change until exit, call it on the event loop."""
+        event = asyncio.Event()
+        subscriber = (asyncio.get_running_loop(), event)
+        with self:
+            self.subscribers.append(subscriber)
+        try:
+            yield event
+        finally:
+            with self:
+                self.subscribers.remove(subscriber)
+
+    @staticmethod
+    async def wait_async(event: asyncio.Event, timeout: float) -> None:
+        """Waits until the event is set or timeout (in seconds) elapses, then clears it for the next change."""
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(event.wait(), timeout)
+        event.clear()
+
+
+class DevToolsConnection:
+    """Connection to the browser target of Chrome DevTools Protocol.
+
+    Chromedriver only relays commands of DevTools Protocol, so this connects to Chrome directly to receive events.
+    Listeners are called in a dedicated thread so that they can execute commands.
+    Commands are measured as "devtools.<method>" when instrumentation is provided.
+
+    - Chrome DevTools Protocol
+      https://chromedevtools.github.io/devtools-protocol/
+    """
+
+    def __init__(self, url: str, *, instrumentation: Instrumentation | None = None) -> None:
+        self.logger = getLogger(__name__)
+        self.instrumentation = instrumentation
+        # Reason: Chrome rejects WebSocket connections with the Origin header unless `--remote-allow-origins` is set.
+        self.websocket = create_connection(url, suppress_origin=True, enable_multithread=True)
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+        self.pending: dict[int, Future[Message]] = {}
+        self.listeners: defaultdict[tuple[str | None, str], list[Listener]] = defaultdict(list)
+        self.events: queue.Queue[Message | None] = queue.Queue()
+        self.closed = False
+        self.reader = threading.Thread(target=self._read, name="devtools-reader", daemon=True)
+        self.dispatcher = threading.Thread(target=self._dispatch, name="devtools-dispatcher", daemon=True)
+        self.reader.start()
+        self.dispatcher.start()
+
+    @classmethod
+    def connect(cls, debugger_address: str, *, instrumentation: Instrumentation | None = None) -> Self:
+        """Connects to the browser target of Chrome listening on debugger_address ("host:port")."""
+        # Reason: The URL is built from the address which Chrome reported.
+        with urlopen(f"http://{debugger_address}/json/version") as response:  # nosec B310
+            version = json.load(response)
+        return cls(version["webSocketDebuggerUrl"], instrumentation=instrumentation)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def execute(
+        self,
+        method: str,
+        params: Message | None = None,
+        *,
+        session_id: str | None = None,
+        timeout: float | None = 30,
+    ) -> Message:
+        """Executes the command and returns its result.
+
+        Raises WebDriverException when DevTools Protocol returns an error, same as `Chrome.execute_cdp_cmd()`.
+        """
+        if self.instrumentation is None:
+            return self._execute(method, params, session_id=session_id, timeout=timeout)
+        start = time.perf_counter()
+        try:
+            result = self._execute(method, params, session_id=session_id, timeout=timeout)
+        except BaseException:
+            self.instrumentation.record(f"devtools.{method}", time.perf_counter() - start, failed=True)
+            raise
+        self.instrumentation.record(f"devtools.{method}", time.perf_counter() - start, size=measure_size(result))
+        return result
+
+    def _execute(
+        self,
+        method: str,
+        params: Message | None,
+        *,
+        session_id: str | None,
+        timeout: float | None,
+    ) -> Message:
+        message: Message = {"id": next(self.ids), "method": method, "params": params or {}}
+        if session_id is not None:
+            message["sessionId"] = session_id
+        future: Future[Message] = Future()
+        with self.lock:
+            if self.closed:
+                msg = "The connection to DevTools is closed."
+                raise WebDriverException(msg)
+            self.pending[message["id"]] = future
+        try:
+            self.websocket.send(json.dumps(message))
+            response = future.result(timeout)
+        finally:
+            with self.lock:
+                self.pending.pop(message["id"], None)
+        if "error" in response:
+            msg = f"{method}: {response['error'].get('message')}"
+            raise WebDriverException(msg)
+        result: Message = response.get("result", {})
+        return result
+
+    def add_listener(self, method: str, listener: Listener, *, session_id: str | None = None) -> None:
+        """Calls the listener with the params of each event of the method.
+
+        Events of the browser target have no session ID, events of attached targets have the session ID.
+        """
+        with self.lock:
+            self.listeners[(session_id, method)].append(listener)
+
+    def remove_listener(self, method: str, listener: Listener, *, session_id: str | None = None) -> None:
+        with self.lock:
+            listeners = self.listeners[(session_id, method)]
+            if listener in listeners:
+                listeners.remove(listener)
+
+    def attach(self, target_id: str) -> DevToolsSession:
+        """Attaches to the target.
+
+        The window handles of Chromedriver are the target IDs.
+        """
+        result = self.execute("Target.attachToTarget", {"targetId": target_id, "flatten": True})
+        return DevToolsSession(self, result["sessionId"])
+
+    def close(self) -> None:
+        with self.lock:
+            self.closed = True
+        self.websocket.close()
+        self.events.put(None)
+        self.reader.join()
+        # Reason: A listener may close the connection.
+        if threading.current_thread() is not self.dispatcher:
+            self.dispatcher.join()
+
+    def _read(self) -> None:
+        while True:
+            try:
+                message = json.loads(self.websocket.recv())
+            except (WebSocketException, OSError, ValueError):
+                break
+            if "id" in message:
+                with self.lock:
+                    future = self.pending.get(message["id"])
+                if future is not None:
+                    future.set_result(message)
+            else:
+                self.events.put(message)
+        with self.lock:
+            self.closed = True
+            pending = list(self.pending.values())
+        for future in pending:
+            future.set_exception(WebDriverException("The connection to DevTools is closed."))
+        self.events.put(None)
+
+    def _dispatch(self) -> None:
+        while True:
+            message = self.events.get()
+            if message is None:
+                return
+            with self.lock:
+                listeners = list(self.listeners.get((message.get("sessionId"), message["method"]), []))
+            for listener in listeners:
+                self._call(listener, message)
+
+    def _call(self, listener: Listener, message: Message) -> None:
+        try:
+            listener(message.get("params", {}))
+        # Reason: A broken listener shouldn't stop other listeners. pylint: disable-next=broad-exception-caught
+        except Exception:
+            self.logger.exception("Listener of %s failed.", message["method"])
+
+
+class DevToolsSession:
+    """Session of the target attached through DevToolsConnection, for example, a tab."""
+
+    def __init__(self, connection: DevToolsConnection, session_id: str) -> None:
+        self.connection = connection
+        self.session_id = session_id
+
+    def execute(self, method: str, params: Message | None = None, *, timeout: float | None = 30) -> Message:
+        return self.connection.execute(method, params, session_id=self.session_id, timeout=timeout)
+
+    def add_listener(self, method: str, listener: Listener) -> None:
+        self.connection.add_listener(method, listener, session_id=self.session_id)
+
+    def remove_listener(self, method: str, listener: Listener) -> None:
+        self.connection.remove_listener(method, listener, session_id=self.session_id)
+
+    def detach(self) -> None:
+        """Detaches from the target, so that Chrome stops sending its events."""
+        self.connection.execute("Target.detachFromTarget", {"sessionId": self.session_id})
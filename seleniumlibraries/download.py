@@ -0,0 +1,162 @@
+"""The module about tracking downloads through Chrome DevTools Protocol."""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from seleniumlibraries.devtools import DevToolsConnection
+    from seleniumlibraries.devtools import Message
+
+__all__ = ["Download", "DownloadTracker"]
+
+
+@dataclass
+class Download:
+    """Download reported by Chrome.
+
+    The state is one of "inProgress", "completed" and "canceled".
+    """
+
+    guid: str
+    url: str
+    suggested_filename: str
+    total_bytes: float = 0
+    received_bytes: float = 0
+    state: str = "inProgress"
+    future: Future[Path] = field(default_factory=Future, repr=False)
+
+    def wait(self, timeout: float | None = None) -> Path:
+        """Waits until the download completes and returns the path of the file.
+
+        Raises CancelledError when the download is canceled and TimeoutError when timeout elapses, both of which are
+        defined in concurrent.futures, and the error of renaming the file, for example, OSError.
+        """
+        return self.future.result(timeout)
+
+
+class DownloadTracker:
+    """Tracks downloads with events of DevTools Protocol instead of watching the download directory.
+
+    Chrome saves each download as its GUID, then the tracker renames the file to the suggested filename once Chrome
+    reports completion, so that concurrent downloads never mix up.
+
+    Usage:
+        with browser.track_downloads() as tracker:
+            browser.scroll_and_click(By.ID, "download")
+            path = tracker.wait_for_begin(timeout=10).wait(timeout=60)
+
+    - Browser.downloadWillBegin - Chrome DevTools Protocol
+      https://chromedevtools.github.io/devtools-protocol/tot/Browser/#event-downloadWillBegin
+    """
+
+    def __init__(self, connection: DevToolsConnection, directory_download: Path) -> None:
+        self.connection = connection
+        self.directory_download = directory_download
+        self.downloads: dict[str, Download] = {}
+        self.begun: queue.Queue[Download] = queue.Queue()
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self.connection.add_listener("Browser.downloadWillBegin", self._on_will_begin)
+        self.connection.add_listener("Browser.downloadProgress", self._on_progress)
+        self._set_download_behavior("allowAndName", events_enabled=True)
+
+    def stop(self) -> None:
+        self._set_download_behavior("allow", events_enabled=False)
+        self.connection.remove_listener("Browser.downloadWillBegin", self._on_will_begin)
+        self.connection.remove_listener("Browser.downloadProgress", self._on_progress)
+
+    def wait_for_begin(self, timeout: float | None = None) -> Download:
+        """Waits for the next download which begins after the previous call.
+
+        Raises TimeoutError when no download begins within timeout seconds.
+        """
+        try:
+            return self.begun.get(timeout=timeout)
+        except queue.Empty as error:
+            msg = "Timeout waiting for download to begin."
+            raise TimeoutError(msg) from error
+
+    def wait_all(self, timeout: float | None = None) -> list[Path]:
+        """Waits until all downloads which have begun complete."""
+        with self.lock:
+            downloads = list(self.downloads.values())
+        return [download.wait(timeout) for download in downloads]
+
+    def _set_download_behavior(self, behavior: str, *, events_enabled: bool) -> None:
+        self.connection.execute(
+            "Browser.setDownloadBehavior",
+            {"behavior": behavior, "downloadPath": str(self.directory_download), "eventsEnabled": events_enabled},
+        )
+
+    def _on_will_begin(self, params: Message) -> None:
+        download = Download(params["guid"], params["url"], params["suggestedFilename"])
+        with self.lock:
+            self.downloads[download.guid] = download
+        self.begun.put(download)
+
+    def _on_progress(self, params: Message) -> None:
+        with self.lock:
+            download = self.downloads.get(params["guid"])
+        if download is None or download.future.done():
+            return
+        download.total_bytes = params["totalBytes"]
+        download.received_bytes = params["receivedBytes"]
+        download.state = params["state"]
+        if download.state == "completed":
+            try:
+                path = self._rename(download)
+            # Reason: Waiters would block forever otherwise. pylint: disable-next=broad-exception-caught
+            except Exception as error:  # noqa: BLE001
+                download.future.set_exception(error)
+            else:
+                download.future.set_result(path)
+        elif download.state == "canceled":
+            download.future.cancel()
+
+    def _rename(self, download: Download) -> Path:
+        """Renames the file named GUID to the suggested filename, adding " (n)" when it exists same as Chrome."""
+        source = self.directory_download / download.guid
+        suggested = Path(download.suggested_filename)
+        for number in itertools.count():
+            name = suggested.name if number == 0 else f"{suggested.stem} ({number}){suggested.suffix}"
+            destination = self.directory_download / name
+            try:
+                # Reason: Claims the name atomically against other downloads of the same name completing at once.
+                os.close(os.open(destination, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            except FileExistsError:
+                continue
+            break
+        try:
+            source.replace(destination)
+        except OSError:
+            with contextlib.suppress(FileNotFoundError):
+                destination.unlink()
+            raise
+        return destination
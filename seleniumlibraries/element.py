@@ -1,8 +1,50 @@
 """The module about element."""
 
-from selenium.webdriver.remote.webelement import WebElement
+from __future__ import annotations
 
-__all__ = ["get_text"]
+from typing import TYPE_CHECKING
+from typing import cast
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from selenium.webdriver.remote.webelement import WebElement
+
+__all__ = ["get_text", "get_texts"]
+
+# The same fallback as get_text() in the page.
+# getVisibleText() follows WebElement.text: elements which aren't rendered or are transparent have empty text, lines are
+# trimmed, blank lines are dropped, spaces are collapsed unless CSS white-space preserves them and no-break spaces
+# become spaces.
+JAVASCRIPT_FUNCTION_GET_TEXT = r"""
+function isShown(element) {
+  if (!element.getClientRects().length) {
+    return false;
+  }
+  for (let node = element; node; node = node.parentElement) {
+    if (getComputedStyle(node).opacity === "0") {
+      return false;
+    }
+  }
+  return true;
+}
+function getVisibleText(element) {
+  if (!isShown(element)) {
+    return "";
+  }
+  const collapse = ["normal", "nowrap"].includes(getComputedStyle(element).whiteSpace);
+  const trim = (line) => line.replace(/^[^\S\u00a0]+|[^\S\u00a0]+$/g, "");
+  return element.innerText
+    .split("\n")
+    .map((line) => trim(collapse ? line.replace(/[^\S\u00a0]+/g, " ") : line))
+    .filter((line) => line)
+    .join("\n")
+    .replace(/\u00a0/g, " ");
+}
+function getText(element) {
+  return getVisibleText(element) || element.innerText || element.textContent || "";
+}
+"""
 
 
 def get_text(element: WebElement) -> str:
@@ -24,3 +66,18 @@ def get_text(element: WebElement) -> str:
     if text_content:
         return text_content
     return ""
+
+
+def get_texts(elements: Sequence[WebElement]) -> list[str]:
+    """Gets texts of Selenium elements in one round trip.
+
+    Applies the same fallback as get_text() in the page, while get_text() takes up to three round trips per element.
+
+    Args:
+        elements: Selenium web elements of the same page
+    Returns: Texts of the elements
+    """
+    if not elements:
+        return []
+    script = f"{JAVASCRIPT_FUNCTION_GET_TEXT}return arguments[0].map(getText);"
+    return cast("list[str]", elements[0].parent.execute_script(script, list(elements)))
@@ -0,0 +1,130 @@
+"""The module about extracting structured data from tables and lists."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import cast
+
+from seleniumlibraries.element import JAVASCRIPT_FUNCTION_GET_TEXT
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+
+    from selenium.webdriver.remote.webelement import WebElement
+    from typing_extensions import TypeAlias
+
+    Cell: TypeAlias = "str | None"
+    Row: TypeAlias = "dict[str, Cell] | tuple[Cell, ...]"
+    Columns: TypeAlias = "Mapping[str, Column | str] | Sequence[Column | str]"
+
+__all__ = ["Column", "extract_rows", "iter_rows"]
+
+
+@dataclass(frozen=True)
+class Column:
+    """Column of the rows to extract.
+
+    Args:
+        selector: CSS selector of the cell relative to the row. None means the row itself.
+        attribute: Name of the property or attribute to extract, same as WebElement.get_attribute().
+            None means the text, same as get_text().
+    """
+
+    selector: str | None = None
+    attribute: str | None = None
+
+
+JAVASCRIPT_EXTRACT_ROWS = f"""{JAVASCRIPT_FUNCTION_GET_TEXT}
+function getValue(cell, attribute) {{
+  if (attribute === null) {{
+    return getText(cell);
+  }}
+  const property = cell[attribute];
+  if (property !== undefined && property !== null && typeof property !== "object" && typeof property !== "function") {{
+    return String(property);
+  }}
+  return cell.getAttribute(attribute);
+}}
+const [container, rowSelector, columns, offset, limit] = arguments;
+const rows = Array.prototype.slice.call(
+  container.querySelectorAll(rowSelector), offset, limit === null ? undefined : offset + limit
+);
+return rows.map((row) => columns.map(([selector, attribute]) => {{
+  const cell = selector === null ? row : row.querySelector(selector);
+  return cell === null ? null : getValue(cell, attribute);
+}}));
+"""
+
+
+def extract_rows(container: WebElement, row_selector: str, columns: Columns) -> list[Row]:
+    """Extracts all rows in one round trip instead of finding each cell.
+
+    Usage:
+        rows = extract_rows(
+            browser.wait_for(By.ID, "orders"),
+            "tbody > tr",
+            {"date": "td:nth-child(1)", "amount": "td:nth-child(2)", "link": Column("a", "href")},
+        )
+
+    Args:
+        container: Element which contains the rows, for example, table.
+        row_selector: CSS selector of the rows relative to the container.
+        columns: Columns of each row. A string means a CSS selector of the cell to get text.
+            Rows are dicts when columns is a mapping, tuples when columns is a sequence.
+            A missing cell is None.
+    Returns: Rows
+    """
+    return next(iter_rows(container, row_selector, columns, chunk_size=None), [])
+
+
+def iter_rows(
+    container: WebElement,
+    row_selector: str,
+    columns: Columns,
+    *,
+    chunk_size: int | None = 500,
+) -> Iterator[list[Row]]:
+    """Extracts rows in chunks so that very large tables don't have to be transferred at once.
+
+    Takes one round trip per chunk of chunk_size rows, all rows at once when it is None.
+    See extract_rows() for the other arguments.
+
+    Raises:
+        ValueError: When chunk_size is less than 1.
+    """
+    if chunk_size is not None and chunk_size < 1:
+        msg = f"Invalid chunk size: {chunk_size}"
+        raise ValueError(msg)
+    names = list(columns) if isinstance(columns, Mapping) else None
+    specs = [to_column(column) for column in (columns.values() if isinstance(columns, Mapping) else columns)]
+    arguments = [[spec.selector, spec.attribute] for spec in specs]
+    offset = 0
+    while True:
+        chunk = cast(
+            "list[list[Cell]]",
+            container.parent.execute_script(
+                JAVASCRIPT_EXTRACT_ROWS,
+                container,
+                row_selector,
+                arguments,
+                offset,
+                chunk_size,
+            ),
+        )
+        if chunk:
+            yield [to_row(names, cells) for cells in chunk]
+        if chunk_size is None or len(chunk) < chunk_size:
+            return
+        offset += chunk_size
+
+
+def to_column(column: Column | str) -> Column:
+    return Column(column) if isinstance(column, str) else column
+
+
+def to_row(names: list[str] | None, cells: list[Any]) -> Row:
+    return tuple(cells) if names is None else dict(zip(names, cells))
@@ -0,0 +1,241 @@
+"""The module about measuring operations of Browser."""
+
+from __future__ import annotations
+
+import functools
+import json
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import TypeVar
+
+from typing_extensions import Concatenate
+from typing_extensions import ParamSpec
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+__all__ = ["Instrumentation", "Measurement"]
+
+# The name of WebPage subclass whose method is running, see WebPage.__init_subclass__().
+PAGE: ContextVar[str | None] = ContextVar("page", default=None)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Measurement of an operation.
+
+    Args:
+        operation: "driver.<command>" for WebDriver commands, "cdp.<method>" for DevTools Protocol commands through
+            WebDriver, "devtools.<method>" for DevTools Protocol commands through DevToolsConnection, and
+            "Browser.<method>" for methods of Browser which may issue many commands or wait.
+        page: The name of WebPage subclass which issued the operation.
+        seconds: The elapsed time.
+        size: The number of characters in the response, which approximates the bytes transferred.
+        failed: Whether the operation raised an exception.
+    """
+
+    operation: str
+    page: str | None
+    seconds: float
+    size: int
+    failed: bool
+
+
+Hook = Callable[[Measurement], None]
+
+
+@dataclass
+class Statistics:
+    """Statistics of an operation in constant memory.
+
+    Percentiles are estimated from a uniform sample of SIZE_RESERVOIR measurements by reservoir sampling, so they are
+    exact until the count exceeds it.
+    """
+
+    SIZE_RESERVOIR = 1024
+
+    count: int = 0
+    failures: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = 0.0
+    size: int = 0
+    samples: list[float] = field(default_factory=list)
+
+    def add(self, seconds: float, size: int, *, failed: bool, generator: random.Random) -> None:
+        self.count += 1
+        self.failures += failed
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+        self.size += size
+        if len(self.samples) < self.SIZE_RESERVOIR:
+            self.samples.append(seconds)
+            return
+        # Reason: Algorithm R keeps each measurement in the sample with the same probability.
+        index = generator.randrange(self.count)
+        if index < self.SIZE_RESERVOIR:
+            self.samples[index] = seconds
+
+    def aggregate(self, percentiles: Iterable[int]) -> dict[str, Any]:
+        ordered = sorted(self.samples)
+        stats: dict[str, Any] = {
+            "count": self.count,
+            "failures": self.failures,
+            "total": self.total,
+            "min": self.minimum,
+            "max": self.maximum,
+        }
+        for percent in percentiles:
+            stats[f"p{percent}"] = percentile(ordered, percent)
+        stats["size"] = self.size
+        return stats
+
+
+class Instrumentation:
+    """Collects measurements of operations of Browser.
+
+    Pass it to Browser to opt in. Hooks are called synchronously in the thread of the operation, so keep them cheap.
+    Memory stays bounded however long it runs, see Statistics.
+
+    Usage:
+        instrumentation = Instrumentation()
+        with Browser(instrumentation=instrumentation) as browser:
+            ...
+        instrumentation.dump(Path("profile.json"))
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, *, hooks: Iterable[Hook] = ()) -> None:
+        self.hooks = list(hooks)
+        self.lock = threading.Lock()
+        # Reason: Sampling for statistics, not for security.
+        self.generator = random.Random()  # noqa: S311
+        self.operations: defaultdict[str, Statistics] = defaultdict(Statistics)
+        self.pages: defaultdict[tuple[str | None, str], Statistics] = defaultdict(Statistics)
+
+    def add_hook(self, hook: Hook) -> None:
+        self.hooks.append(hook)
+
+    def record(self, operation: str, seconds: float, *, size: int = 0, failed: bool = False) -> None:
+        measurement = Measurement(operation, PAGE.get(), seconds, size, failed)
+        with self.lock:
+            for statistics in (self.operations[operation], self.pages[(measurement.page, operation)]):
+                statistics.add(seconds, size, failed=failed, generator=self.generator)
+        for hook in self.hooks:
+            hook(measurement)
+
+    @contextmanager
+    def measure(self, operation: str) -> Iterator[None]:
+        start = time.perf_counter()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self.record(operation, time.perf_counter() - start, failed=failed)
+
+    def wrap_driver(self, driver: WebDriver) -> None:
+        """Measures every command which WebDriver sends to Chromedriver."""
+        execute = driver.execute
+
+        def execute_measured(driver_command: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+            operation = f"driver.{driver_command}"
+            if driver_command == "executeCdpCommand" and params is not None:
+                operation = f"cdp.{params['cmd']}"
+            start = time.perf_counter()
+            try:
+                response: dict[str, Any] = execute(driver_command, params)
+            except BaseException:
+                self.record(operation, time.perf_counter() - start, failed=True)
+                raise
+            self.record(operation, time.perf_counter() - start, size=measure_size(response.get("value")))
+            return response
+
+        # Reason: To measure commands issued by any method of WebDriver.
+        driver.execute = execute_measured  # type: ignore[method-assign,assignment]
+
+    def summary(self) -> dict[str, Any]:
+        """Aggregates the measurements per operation and per WebPage subclass.
+
+        Returns: {"operations": {operation: stats}, "pages": {page: {operation: stats}}}, where stats has count,
+            failures, total, min, max, p50, p95, p99 (in seconds) and size. Operations outside of WebPage are under
+            page "".
+        """
+        pages: defaultdict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
+        with self.lock:
+            items = sorted(self.pages.items(), key=lambda item: (item[0][0] or "", item[0][1]))
+            for (page, operation), statistics in items:
+                pages[page or ""][operation] = statistics.aggregate(self.PERCENTILES)
+            operations = {
+                operation: statistics.aggregate(self.PERCENTILES)
+                for operation, statistics in sorted(self.operations.items())
+            }
+        return {"operations": operations, "pages": dict(pages)}
+
+    def dump(self, path: Path) -> None:
+        path.write_text(json.dumps(self.summary(), indent=2), encoding="utf-8")
+
+
+def percentile(ordered: list[float], percent: int) -> float:
+    """The percentile by nearest-rank method."""
+    return ordered[max(math.ceil(len(ordered) * percent / 100) - 1, 0)]
+
+
+def measure_size(value: Any) -> int:  # noqa: ANN401
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(measure_size(item) for item in value.values())
+    if isinstance(value, list):
+        return sum(measure_size(item) for item in value)
+    return 0
+
+
+def measured(operation: str) -> Callable[[Callable[Concatenate[Any, P], R]], Callable[Concatenate[Any, P], R]]:
+    """Measures the method when the instance has instrumentation."""
+
+    def decorator(method: Callable[Concatenate[Any, P], R]) -> Callable[Concatenate[Any, P], R]:
+        @functools.wraps(method)
+        def wrapper(__instance: Any, *args: P.args, **kwargs: P.kwargs) -> R:  # noqa: ANN401
+            instrumentation: Instrumentation | None = __instance.instrumentation
+            if instrumentation is None:
+                return method(__instance, *args, **kwargs)
+            with instrumentation.measure(operation):
+                return method(__instance, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def attribute_to_page(name: str, method: Callable[P, R]) -> Callable[P, R]:
+    """Attributes the operations in the method to the WebPage subclass."""
+
+    @functools.wraps(method)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        token = PAGE.set(name)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            PAGE.reset(token)
+
+    return wrapper
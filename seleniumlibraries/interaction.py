@@ -0,0 +1,237 @@
+"""The module about running sequences of interactions in the page in a few round trips."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver import ActionChains
+
+from seleniumlibraries.locator import JAVASCRIPT_FUNCTION_WAIT_FOR_ELEMENT
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
+__all__ = ["Step", "StepResult", "run_steps"]
+
+# The actions of Step. "click" clicks through W3C Actions, "dispatch_click" calls HTMLElement.click() in the page.
+ACTIONS = ("wait_for", "scroll", "fill", "select", "click", "dispatch_click")
+ERROR_SKIPPED = "Skipped since the previous step failed."
+ERROR_TIMEOUT = "Error: Timeout waiting for element: "
+
+
+class Step(NamedTuple):
+    """The step of the interaction, created with the class methods.
+
+    Each step waits for its element to be present before acting on it.
+
+    Args:
+        action: One of ACTIONS.
+        by: Locator strategy.
+        value: Locator.
+        text: The text to fill, or the value or the text of the option to select.
+    """
+
+    action: str
+    by: str
+    value: str
+    text: str | None = None
+
+    @classmethod
+    def wait_for(cls, by: str, value: str) -> Step:
+        return cls("wait_for", by, value)
+
+    @classmethod
+    def scroll(cls, by: str, value: str) -> Step:
+        return cls("scroll", by, value)
+
+    @classmethod
+    def fill(cls, by: str, value: str, text: str) -> Step:
+        """Replaces the value of the input, the textarea or the content editable element, then fires change."""
+        return cls("fill", by, value, text)
+
+    @classmethod
+    def select(cls, by: str, value: str, option: str) -> Step:
+        """Selects the option of the select element by its value, or by its text when no value matches."""
+        return cls("select", by, value, option)
+
+    @classmethod
+    def click(cls, by: str, value: str, *, trusted: bool = True) -> Step:
+        """Clicks the element.
+
+        Args:
+            by: Locator strategy.
+            value: Locator.
+            trusted: Whether to click through W3C Actions, which takes one more round trip than HTMLElement.click()
+                but fires trusted pointer events same as scroll_and_click().
+        """
+        return cls("click" if trusted else "dispatch_click", by, value)
+
+
+@dataclass
+class StepResult:
+    """The result of Step.
+
+    Args:
+        step: The step.
+        error: The error of the step, None when the step succeeded.
+    """
+
+    step: Step
+    error: str | None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    @property
+    def timed_out(self) -> bool:
+        """Whether the element of the step didn't appear in time."""
+        return self.error is not None and self.error.startswith(ERROR_TIMEOUT)
+
+
+# Runs steps until the end, the failure or the step to click through W3C Actions, which it returns with its element.
+JAVASCRIPT_RUN_STEPS = f"""{JAVASCRIPT_FUNCTION_WAIT_FOR_ELEMENT}
+function fire(element, ...types) {{
+  types.forEach((type) => element.dispatchEvent(new Event(type, {{bubbles: true}})));
+}}
+function checkEnabled(element) {{
+  if (element.disabled || element.readOnly) {{
+    throw new Error("Element is not editable: " + element.tagName.toLowerCase());
+  }}
+}}
+function fill(element, text) {{
+  if (element.isContentEditable) {{
+    element.focus();
+    element.textContent = text;
+    fire(element, "input");
+    return;
+  }}
+  if (!(element instanceof HTMLInputElement || element instanceof HTMLTextAreaElement)) {{
+    throw new Error("Element is not fillable: " + element.tagName.toLowerCase());
+  }}
+  checkEnabled(element);
+  element.focus();
+  // Frameworks like React track the value through the setter of the prototype.
+  Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), "value").set.call(element, text);
+  fire(element, "input", "change");
+}}
+function select(element, text) {{
+  if (!(element instanceof HTMLSelectElement)) {{
+    throw new Error("Element is not select: " + element.tagName.toLowerCase());
+  }}
+  checkEnabled(element);
+  const options = Array.from(element.options);
+  const option = options.find((o) => o.value === text) || options.find((o) => o.text.trim() === text);
+  if (!option || option.disabled) {{
+    throw new Error("No option to select: " + text);
+  }}
+  element.focus();
+  option.selected = true;
+  fire(element, "input", "change");
+}}
+async function run(steps, deadline) {{
+  const errors = [];
+  for (const [action, by, value, text] of steps) {{
+    try {{
+      const element = await waitForElement(by, value, deadline);
+      if (element === null) {{
+        throw new Error("Timeout waiting for element: " + by + "=" + value);
+      }}
+      if (action !== "wait_for") {{
+        element.scrollIntoView({{block: "center", inline: "center"}});
+      }}
+      if (action === "fill") {{
+        fill(element, text);
+      }} else if (action === "select") {{
+        select(element, text);
+      }} else if (action === "click") {{
+        return {{errors, element}};
+      }} else if (action === "dispatch_click") {{
+        element.click();
+      }}
+    }} catch (error) {{
+      errors.push(String(error));
+      return {{errors, element: null}};
+    }}
+    errors.push(null);
+  }}
+  return {{errors, element: null}};
+}}
+const [steps, timeout, callback] = arguments;
+run(steps, Date.now() + timeout).then(callback);
+"""
+
+
+def run_steps(driver: WebDriver, steps: Iterable[Step], *, timeout: float) -> list[StepResult]:
+    """Runs steps in one script, plus one W3C Actions command for each trusted click and one script after it.
+
+    Stops at the first failure, and the following steps are reported as skipped.
+    When the script itself fails, the error is reported as the error of the first step which the script ran.
+    The script timeout of the driver has to be longer than timeout, see Browser.run_steps().
+    A step which navigates to another page has to be the last one or a trusted click.
+
+    Usage:
+        results = run_steps(
+            driver,
+            [
+                Step.fill(By.NAME, "email", "user@example.com"),
+                Step.select(By.NAME, "plan", "Pro"),
+                Step.click(By.CSS_SELECTOR, "button[type=submit]"),
+            ],
+            timeout=10,
+        )
+
+    Args:
+        driver: WebDriver.
+        steps: The steps.
+        timeout: How many seconds to wait for elements of all steps in total.
+    Returns: The results of all steps in the order of steps.
+    """
+    sequence = list(steps)
+    for step in sequence:
+        if step.action not in ACTIONS:
+            msg = f"Unsupported action: {step.action}"
+            raise ValueError(msg)
+    deadline = time.monotonic() + timeout
+    results: list[StepResult] = []
+    while len(results) < len(sequence):
+        pending = sequence[len(results) :]
+        remaining = max(deadline - time.monotonic(), 0)
+        try:
+            response = driver.execute_async_script(
+                JAVASCRIPT_RUN_STEPS,
+                [list(step) for step in pending],
+                remaining * 1000,
+            )
+        except WebDriverException as error:
+            # For example, the dispatched click navigates before the script returns, or the script times out.
+            results.append(StepResult(pending[0], format_error(error)))
+            break
+        results.extend(StepResult(step, error) for step, error in zip(pending, response["errors"]))
+        if response["element"] is None:
+            break
+        results.append(StepResult(pending[len(response["errors"])], click(driver, response["element"])))
+        if not results[-1].succeeded:
+            break
+    results.extend(StepResult(step, ERROR_SKIPPED) for step in sequence[len(results) :])
+    return results
+
+
+def click(driver: WebDriver, element: WebElement) -> str | None:
+    """Clicks the element through W3C Actions in one command, returns the error if any."""
+    try:
+        ActionChains(driver).move_to_element(element).click().perform()
+    except WebDriverException as error:
+        return format_error(error)
+    return None
+
+
+def format_error(error: WebDriverException) -> str:
+    return f"{type(error).__name__}: {error.msg}"
@@ -0,0 +1,61 @@
+"""The module about locators evaluated in the page."""
+
+from __future__ import annotations
+
+__all__: list[str] = []
+
+# Finds the element in the page same as WebDriver.find_element() but returns null when not found.
+# Arguments are values of selenium.webdriver.common.by.By.
+# - Locator strategies - WebDriver
+#   https://www.w3.org/TR/webdriver2/#locator-strategies
+JAVASCRIPT_FUNCTION_FIND_ELEMENT = """
+function findElement(root, by, value) {
+  switch (by) {
+    case "css selector":
+      return root.querySelector(value);
+    case "id":
+      return root.querySelector("#" + CSS.escape(value));
+    case "name":
+      return root.querySelector('[name="' + CSS.escape(value) + '"]');
+    case "class name":
+      return root.querySelector("." + CSS.escape(value));
+    case "tag name":
+      return root.querySelector(CSS.escape(value));
+    case "xpath":
+      return document.evaluate(value, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    case "link text":
+      return Array.from(root.querySelectorAll("a")).find((a) => a.innerText.trim() === value) || null;
+    case "partial link text":
+      return Array.from(root.querySelectorAll("a")).find((a) => a.innerText.includes(value)) || null;
+    default:
+      throw new Error("Unsupported locator strategy: " + by);
+  }
+}
+"""
+
+# Resolves the promise with the element as soon as it appears instead of polling, or with null at the deadline.
+# The deadline is the time in milliseconds since the epoch same as Date.now().
+JAVASCRIPT_FUNCTION_WAIT_FOR_ELEMENT = f"""{JAVASCRIPT_FUNCTION_FIND_ELEMENT}
+function waitForElement(by, value, deadline) {{
+  const found = findElement(document, by, value);
+  if (found) {{
+    return Promise.resolve(found);
+  }}
+  return new Promise((resolve) => {{
+    let timer;
+    const observer = new MutationObserver(() => {{
+      const element = findElement(document, by, value);
+      if (element) {{
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(element);
+      }}
+    }});
+    observer.observe(document, {{childList: true, subtree: true, attributes: true, characterData: true}});
+    timer = setTimeout(() => {{
+      observer.disconnect();
+      resolve(null);
+    }}, Math.max(deadline - Date.now(), 0));
+  }});
+}}
+"""
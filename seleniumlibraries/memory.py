@@ -0,0 +1,83 @@
+"""The module about memory usage of Chrome."""
+
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+
+__all__ = ["MemoryUsage"]
+
+DIRECTORY_PROC = Path("/proc")
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    """Memory usage of Chrome.
+
+    Args:
+        rss: The resident set size in bytes summed over the process tree of Chrome,
+            None when the processes can't be inspected through /proc, for example, on Windows and macOS.
+        js_heap_used: The used size in bytes of the JavaScript heap of the current tab.
+        js_heap_total: The allocated size in bytes of the JavaScript heap of the current tab.
+    """
+
+    rss: int | None
+    js_heap_used: int
+    js_heap_total: int
+
+
+def find_browser_process(argument: str) -> int | None:
+    """Finds the browser process of Chrome launched with the argument, for example, `--user-data-dir=...`.
+
+    Child processes of Chrome inherit the argument, so this returns the one whose parent doesn't have it.
+    """
+    if not DIRECTORY_PROC.is_dir():
+        return None
+    parents: dict[int, int] = {}
+    for directory in iter_processes():
+        with suppress(OSError, ValueError):
+            if argument in (directory / "cmdline").read_bytes().decode(errors="replace").split("\0"):
+                parents[int(directory.name)] = read_parent(directory)
+    return next((pid for pid, parent in parents.items() if parent not in parents), None)
+
+
+def measure_rss(pid: int) -> int | None:
+    """Sums the resident set size in bytes of the process and its descendants.
+
+    Returns: None when the process can't be inspected through /proc.
+    """
+    if not (DIRECTORY_PROC / str(pid)).is_dir():
+        return None
+    children: defaultdict[int, list[int]] = defaultdict(list)
+    for directory in iter_processes():
+        # Reason: The process may exit while reading.
+        with suppress(OSError, ValueError):
+            children[read_parent(directory)].append(int(directory.name))
+    size_page = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    pids = [pid]
+    while pids:
+        current = pids.pop()
+        with suppress(OSError, ValueError):
+            # - proc_pid_statm(5) - Linux manual page
+            #   https://man7.org/linux/man-pages/man5/proc_pid_statm.5.html
+            total += int((DIRECTORY_PROC / str(current) / "statm").read_text().split()[1]) * size_page
+        pids.extend(children[current])
+    return total
+
+
+def iter_processes() -> list[Path]:
+    return [directory for directory in DIRECTORY_PROC.iterdir() if directory.name.isdigit()]
+
+
+def read_parent(directory: Path) -> int:
+    """Reads the parent process ID from /proc/<pid>/stat.
+
+    - proc_pid_stat(5) - Linux manual page
+      https://man7.org/linux/man-pages/man5/proc_pid_stat.5.html
+    """
+    # Reason: The command name in parentheses may contain spaces and parentheses.
+    return int((directory / "stat").read_text().rsplit(")", 1)[1].split()[1])
@@ -0,0 +1,215 @@
+"""The module about waiting for network and loading of the page through Chrome DevTools Protocol."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+from typing import Callable
+
+from typing_extensions import Self
+
+from seleniumlibraries.devtools import ChangeCondition
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+
+    from seleniumlibraries.devtools import DevToolsSession
+    from seleniumlibraries.devtools import Message
+
+__all__ = ["NetworkMonitor"]
+
+# The load states in the order the page reaches.
+STATES = ("domcontentloaded", "load")
+# The load states for document.readyState.
+READY_STATES = {"loading": None, "interactive": "domcontentloaded", "complete": "load"}
+
+
+class NetworkMonitor:
+    """Monitors requests in flight and the load state of the tab to wait for them without sleeping.
+
+    Requests started before start() aren't counted, so start it before the action which loads the page.
+    Browser.monitor_network() starts one for each tab.
+
+    Usage:
+        with NetworkMonitor(browser.devtools.attach(browser.driver.current_window_handle)) as monitor:
+            browser.scroll_and_click(By.ID, "search")
+            monitor.wait_for_idle(0.5, 0, timeout=30)
+
+    - Network.requestWillBeSent
+      https://chromedevtools.github.io/devtools-protocol/tot/Network/#event-requestWillBeSent
+    - Page.loadEventFired
+      https://chromedevtools.github.io/devtools-protocol/tot/Page/#event-loadEventFired
+    """
+
+    # How many changes of the number of requests in flight to keep to decide idle.
+    SIZE_HISTORY = 1024
+
+    def __init__(self, session: DevToolsSession) -> None:
+        self.session = session
+        self.changed = ChangeCondition()
+        self.inflight: set[str] = set()
+        # The time and the number of requests in flight after each change.
+        self.history: deque[tuple[float, int]] = deque(maxlen=self.SIZE_HISTORY)
+        self.started_at = time.monotonic()
+        self.state: str | None = None
+        self.listeners = {
+            "Network.requestWillBeSent": self._on_request,
+            "Network.loadingFinished": self._on_finished,
+            "Network.loadingFailed": self._on_finished,
+            "Page.frameNavigated": self._on_frame_navigated,
+            "Page.domContentEventFired": self._on_dom_content_loaded,
+            "Page.loadEventFired": self._on_load,
+        }
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        for method, listener in self.listeners.items():
+            self.session.add_listener(method, listener)
+        self.session.execute("Network.enable")
+        self.session.execute("Page.enable")
+        result = self.session.execute("Runtime.evaluate", {"expression": "document.readyState", "returnByValue": True})
+        with self.changed:
+            self.started_at = time.monotonic()
+            # Reason: Events may have been dispatched while evaluating.
+            self.state = self._later(self.state, READY_STATES.get(result["result"]["value"]))
+            self.changed.notify_all()
+
+    def stop(self) -> None:
+        for method, listener in self.listeners.items():
+            self.session.remove_listener(method, listener)
+
+    def wait_for_idle(self, idle: float, max_inflight: int, *, timeout: float) -> None:
+        """Waits until requests in flight stay max_inflight or less for idle seconds.
+
+        Requests before start() are unknown, so it waits for idle seconds since start() at least.
+
+        Raises:
+            TimeoutError: When timeout (in seconds) elapses.
+        """
+        with self.changed:
+            for remaining in self._idle_intervals(idle, max_inflight, timeout):
+                self.changed.wait(remaining)
+
+    async def wait_for_idle_async(self, idle: float, max_inflight: int, *, timeout: float) -> None:
+        """Awaitable version of wait_for_idle() which doesn't block the event loop."""
+        with self.changed.subscribe() as changed:
+            for remaining in self._idle_intervals(idle, max_inflight, timeout):
+                await self.changed.wait_async(changed, remaining)
+
+    def wait_for_load_state(self, state: str, *, timeout: float) -> None:
+        """Waits until the current document reaches the load state, "domcontentloaded" or "load".
+
+        Returns immediately when the document has already reached it. The state is reset when the tab commits the
+        navigation to the next document.
+
+        Raises:
+            ValueError: When the state is unsupported.
+            TimeoutError: When timeout (in seconds) elapses.
+        """
+        with self.changed:
+            for remaining in self._load_state_intervals(state, timeout):
+                self.changed.wait(remaining)
+
+    async def wait_for_load_state_async(self, state: str, *, timeout: float) -> None:
+        """Awaitable version of wait_for_load_state() which doesn't block the event loop."""
+        with self.changed.subscribe() as changed:
+            for remaining in self._load_state_intervals(state, timeout):
+                await self.changed.wait_async(changed, remaining)
+
+    def _idle_intervals(self, idle: float, max_inflight: int, timeout: float) -> Iterator[float]:
+        """Yields how many seconds to wait for the next change until idle."""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self.changed:
+                now = time.monotonic()
+                since = self._quiet_since(max_inflight)
+            if since is not None and now - since >= idle:
+                return
+            if now >= deadline:
+                msg = "Timeout waiting for network idle."
+                raise TimeoutError(msg)
+            until = deadline if since is None else min(since + idle, deadline)
+            yield until - now
+
+    def _load_state_intervals(self, state: str, timeout: float) -> Iterator[float]:
+        """Yields how many seconds to wait for the next change until the document reaches the state."""
+        if state not in STATES:
+            msg = f"Unsupported load state: {state}"
+            raise ValueError(msg)
+        deadline = time.monotonic() + timeout
+        while True:
+            with self.changed:
+                reached = self._later(self.state, state) == self.state
+            if reached:
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                msg = f"Timeout waiting for load state: {state}"
+                raise TimeoutError(msg)
+            yield remaining
+
+    def _quiet_since(self, max_inflight: int) -> float | None:
+        """The time since which requests in flight have stayed max_inflight or less, None when they exceed now."""
+        if len(self.inflight) > max_inflight:
+            return None
+        # Reason: Older changes than the history are unknown.
+        since = self.history[0][0] if len(self.history) == self.history.maxlen else self.started_at
+        following = since
+        for changed_at, count in reversed(self.history):
+            if count > max_inflight:
+                # The number dropped at the change following this one.
+                return following
+            following = changed_at
+        return since
+
+    @staticmethod
+    def _later(state: str | None, other: str | None) -> str | None:
+        if state is None or other is None:
+            return state or other
+        return max(state, other, key=STATES.index)
+
+    def _on_request(self, params: Message) -> None:
+        # Reason: Redirects reuse the request ID.
+        if params["requestId"] not in self.inflight:
+            self._record(lambda: self.inflight.add(params["requestId"]))
+
+    def _on_finished(self, params: Message) -> None:
+        if params["requestId"] in self.inflight:
+            self._record(lambda: self.inflight.discard(params["requestId"]))
+
+    def _record(self, change: Callable[[], None]) -> None:
+        with self.changed:
+            change()
+            self.history.append((time.monotonic(), len(self.inflight)))
+            self.changed.notify_all()
+
+    def _on_frame_navigated(self, params: Message) -> None:
+        if params["frame"].get("parentId") is not None:
+            return
+        with self.changed:
+            self.state = None
+            self.changed.notify_all()
+
+    def _on_dom_content_loaded(self, _params: Message) -> None:
+        self._set_state("domcontentloaded")
+
+    def _on_load(self, _params: Message) -> None:
+        self._set_state("load")
+
+    def _set_state(self, state: str) -> None:
+        with self.changed:
+            self.state = self._later(self.state, state)
+            self.changed.notify_all()
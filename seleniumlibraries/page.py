@@ -1,10 +1,92 @@
 """The module of web page."""
 
+from __future__ import annotations
+
+import functools
+import inspect
 from logging import getLogger
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import TypeVar
+from typing import overload
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+from typing_extensions import Concatenate
+from typing_extensions import ParamSpec
+from typing_extensions import Self
+
+from seleniumlibraries.instrumentation import PAGE
+from seleniumlibraries.instrumentation import attribute_to_page
+from seleniumlibraries.locator import JAVASCRIPT_FUNCTION_FIND_ELEMENT
+
+if TYPE_CHECKING:
+    from seleniumlibraries.browser import Browser
+
+__all__ = ["Locator", "WebPage"]
+
+JAVASCRIPT_FIND_ELEMENTS = f"""{JAVASCRIPT_FUNCTION_FIND_ELEMENT}
+return arguments[0].map(([by, value]) => findElement(document, by, value));
+"""
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class CachedElement(WebElement):
+    """WebElement which locates itself again once when WebDriver reports it is stale."""
+
+    def __init__(self, element: WebElement, locate: Callable[[], WebElement]) -> None:
+        super().__init__(element.parent, element.id)
+        self.locate = locate
+
+    def _execute(self, command: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        try:
+            return self._execute_once(command, params)
+        except StaleElementReferenceException:
+            self._id = self.locate().id
+            return self._execute_once(command, params)
+
+    def _execute_once(self, command: str, params: dict[str, Any] | None) -> dict[str, Any]:
+        # Reason: WebElement isn't annotated.
+        response: dict[str, Any] = super()._execute(command, params)  # type: ignore[no-untyped-call]
+        return response
+
+
+class Locator:
+    """Descriptor of the element in WebPage, which is located once and cached until the next navigation.
+
+    Usage:
+        class LoginPage(WebPage):
+            username = Locator(By.ID, "username")
+
+            def log_in(self, username: str) -> None:
+                self.username.send_keys(username)
 
-from seleniumlibraries.browser import Browser
+    Args:
+        by: Locator strategy.
+        value: Locator.
+        timeout: How many seconds to wait for the element. Defaults to the timeout of Browser.
+    """
 
-__all__ = ["WebPage"]
+    def __init__(self, by: str, value: str, *, timeout: float | None = None) -> None:
+        self.by = by
+        self.value = value
+        self.timeout = timeout
+        self.name = f"{by}={value}"
+
+    def __set_name__(self, _owner: type[WebPage], name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, page: None, _owner: type[WebPage]) -> Self: ...
+
+    @overload
+    def __get__(self, page: WebPage, _owner: type[WebPage]) -> WebElement: ...
+
+    def __get__(self, page: WebPage | None, _owner: type[WebPage]) -> Self | WebElement:
+        return self if page is None else page.locate(self)
 
 
 # Reason: This is a base class. pylint: disable=too-few-public-methods
@@ -12,3 +94,72 @@ class WebPage:
     def __init__(self, browser: Browser) -> None:
         self.logger = getLogger(__name__)
         self.browser = browser
+        # The number of navigations of the browser and the element for each name of Locator.
+        self.elements: dict[str, tuple[int, WebElement]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Attributes operations of Browser in public methods to the subclass, see Instrumentation.
+
+        Also lets Browser recycle Chrome before each operation, see Browser.recycle().
+        """
+        super().__init_subclass__(**kwargs)
+        for name, member in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(member):
+                setattr(cls, name, recycle_browser(attribute_to_page(cls.__name__, member)))
+
+    @classmethod
+    def get_locators(cls) -> dict[str, Locator]:
+        """The locators declared in the class and its base classes."""
+        locators: dict[str, Locator] = {}
+        for klass in reversed(cls.__mro__):
+            locators.update({name: value for name, value in vars(klass).items() if isinstance(value, Locator)})
+        return locators
+
+    def locate(self, locator: Locator) -> WebElement:
+        """Waits for the element of the locator unless it is cached since the last navigation."""
+        cached = self.elements.get(locator.name)
+        if cached is not None and cached[0] == self.browser.navigations:
+            return cached[1]
+        navigations = self.browser.navigations
+        element = self.browser.wait_for(locator.by, locator.value, timeout=locator.timeout)
+        return self._cache(locator, element, navigations)
+
+    def locate_all(self) -> dict[str, WebElement | None]:
+        """Locates all declared locators in one round trip without waiting, and caches found elements.
+
+        Returns: The elements for each name of locator, None when not found.
+        """
+        locators = self.get_locators()
+        navigations = self.browser.navigations
+        elements: list[WebElement | None] = self.browser.driver.execute_script(
+            JAVASCRIPT_FIND_ELEMENTS,
+            [[locator.by, locator.value] for locator in locators.values()],
+        )
+        return {
+            name: None if element is None else self._cache(locator, element, navigations)
+            for (name, locator), element in zip(locators.items(), elements)
+        }
+
+    def invalidate(self) -> None:
+        """Forgets the cached elements, for example, after the page changes its DOM."""
+        self.elements.clear()
+
+    def _cache(self, locator: Locator, element: WebElement, navigations: int) -> WebElement:
+        cached = CachedElement(
+            element,
+            lambda: self.browser.wait_for(locator.by, locator.value, timeout=locator.timeout),
+        )
+        self.elements[locator.name] = (navigations, cached)
+        return cached
+
+
+def recycle_browser(method: Callable[Concatenate[WebPage, P], R]) -> Callable[Concatenate[WebPage, P], R]:
+    """Calls Browser.recycle() before the method unless another method of WebPage is running."""
+
+    @functools.wraps(method)
+    def wrapper(__page: WebPage, *args: P.args, **kwargs: P.kwargs) -> R:
+        if PAGE.get() is None:
+            __page.browser.recycle()
+        return method(__page, *args, **kwargs)
+
+    return wrapper
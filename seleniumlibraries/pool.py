@@ -0,0 +1,236 @@
+"""The module about pool of browsers."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from logging import getLogger
+from typing import TYPE_CHECKING
+from typing import Callable
+
+from typing_extensions import Self
+
+from seleniumlibraries.browser import Browser
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+
+__all__ = ["BrowserPool"]
+
+
+@dataclass
+class PooledBrowser:
+    """Browser with the statistics to decide recycling."""
+
+    browser: Browser
+    created_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+
+    def is_expired(self, max_uses: int | None, max_age: float | None) -> bool:
+        if max_uses is not None and self.uses >= max_uses:
+            return True
+        return max_age is not None and time.monotonic() - self.created_at >= max_age
+
+    def quit(self) -> None:
+        self.browser.__exit__(None, None, None)
+
+
+# Reason: Each argument is an independent knob of the pool. pylint: disable-next=too-many-instance-attributes
+class BrowserPool:
+    """Pool of warm browsers to avoid paying startup of Chrome and chromedriver for each job.
+
+    Browsers are reset at check-in (see `Browser.reset()`) and discarded when the reset fails, when they have been used
+    `max_uses` times or when they are older than `max_age` seconds.
+
+    Usage:
+        with BrowserPool(min_size=2, max_size=4) as pool, pool.checkout() as browser:
+            browser.driver.get("https://example.com/")
+    """
+
+    # Reason: Each argument is an independent knob of the pool. pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        *,
+        min_size: int = 0,
+        max_size: int = 4,
+        max_uses: int | None = None,
+        max_age: float | None = None,
+        factory: Callable[[], Browser] = Browser,
+    ) -> None:
+        if not 0 <= min_size <= max_size or max_size < 1:
+            msg = f"Invalid pool size: min_size={min_size}, max_size={max_size}"
+            raise ValueError(msg)
+        self.logger = getLogger(__name__)
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.factory = factory
+        self.condition = threading.Condition()
+        self.idle: deque[PooledBrowser] = deque()
+        self.in_use: dict[int, PooledBrowser] = {}
+        # Number of browsers which are idle, in use or being created.
+        self.size = 0
+        self.closed = False
+
+    def __enter__(self) -> Self:
+        self.fill()
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def fill(self) -> None:
+        """Starts browsers until the pool has `min_size` browsers."""
+        while True:
+            with self.condition:
+                if self.closed or self.size >= self.min_size:
+                    return
+                self.size += 1
+            self._add_idle(self._create())
+
+    def acquire(self, *, block: bool = True, timeout: float | None = None) -> Browser:
+        """Checks out a browser.
+
+        Args:
+            block: Whether to wait for a browser to be released when the pool is exhausted.
+            timeout: How many seconds to wait at most when block is True. None means to wait forever.
+
+        Returns: The browser which is not used by others.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        expired: list[PooledBrowser] = []
+        try:
+            browser = self._take(block=block, deadline=deadline, expired=expired)
+        finally:
+            # Reason: Quitting takes a while, so quit them after releasing the condition.
+            for pooled in expired:
+                self._quit(pooled)
+        if browser is not None:
+            return browser
+        pooled = self._create()
+        with self.condition:
+            return self._check_out(pooled)
+
+    def _take(self, *, block: bool, deadline: float | None, expired: list[PooledBrowser]) -> Browser | None:
+        """Checks out an idle browser, or reserves the slot to create one and returns None.
+
+        Args:
+            block: Whether to wait for a browser to be released when the pool is exhausted.
+            deadline: The time to give up waiting, None means to wait forever.
+            expired: Collects the expired browsers popped from idle ones to quit.
+        """
+        with self.condition:
+            while True:
+                if self.closed:
+                    msg = "The pool is closed."
+                    raise RuntimeError(msg)
+                pooled = self._pop_idle(expired)
+                if pooled is not None:
+                    return self._check_out(pooled)
+                if self.size < self.max_size:
+                    self.size += 1
+                    return None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    msg = "No browser is available in the pool."
+                    raise TimeoutError(msg)
+                self.condition.wait(remaining)
+
+    def release(self, browser: Browser) -> None:
+        """Checks in the browser after resetting it, or discards it when it should be recycled."""
+        with self.condition:
+            pooled = self.in_use.pop(id(browser))
+        if self.closed or pooled.is_expired(self.max_uses, self.max_age) or not self._reset(pooled):
+            self._discard(pooled)
+            self.fill()
+            return
+        self._add_idle(pooled)
+
+    @contextmanager
+    def checkout(self, *, block: bool = True, timeout: float | None = None) -> Iterator[Browser]:
+        """Checks out a browser and checks in it when the block exits."""
+        browser = self.acquire(block=block, timeout=timeout)
+        try:
+            yield browser
+        finally:
+            self.release(browser)
+
+    def close(self) -> None:
+        """Quits idle browsers.
+
+        Browsers in use are quit when they are released.
+        """
+        with self.condition:
+            self.closed = True
+            idle = list(self.idle)
+            self.idle.clear()
+            self.condition.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+
+    def _create(self) -> PooledBrowser:
+        try:
+            return PooledBrowser(self.factory())
+        except BaseException:
+            with self.condition:
+                self.size -= 1
+                self.condition.notify()
+            raise
+
+    def _pop_idle(self, expired: list[PooledBrowser]) -> PooledBrowser | None:
+        """Pops the most recently used browser, moving expired ones into expired for the caller to quit.
+
+        Must be called with the condition held.
+        """
+        while self.idle:
+            pooled = self.idle.pop()
+            if not pooled.is_expired(None, self.max_age):
+                return pooled
+            self.size -= 1
+            expired.append(pooled)
+        return None
+
+    def _check_out(self, pooled: PooledBrowser) -> Browser:
+        pooled.uses += 1
+        self.in_use[id(pooled.browser)] = pooled
+        return pooled.browser
+
+    def _add_idle(self, pooled: PooledBrowser) -> None:
+        with self.condition:
+            self.idle.append(pooled)
+            self.condition.notify()
+
+    def _reset(self, pooled: PooledBrowser) -> bool:
+        try:
+            pooled.browser.reset()
+        # Reason: For example, removing downloads raises OSError. pylint: disable-next=broad-exception-caught
+        except Exception:
+            self.logger.warning("Discard the browser since it failed to reset.", exc_info=True)
+            return False
+        return True
+
+    def _discard(self, pooled: PooledBrowser) -> None:
+        try:
+            self._quit(pooled)
+        finally:
+            with self.condition:
+                self.size -= 1
+                self.condition.notify()
+
+    def _quit(self, pooled: PooledBrowser) -> None:
+        try:
+            pooled.quit()
+        # Reason: The pool keeps working without the browser. pylint: disable-next=broad-exception-caught
+        except Exception:
+            self.logger.warning("Failed to quit the browser.", exc_info=True)
@@ -0,0 +1,106 @@
+"""The module about copying profiles of Chrome."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+if sys.platform != "win32":
+    import fcntl
+
+__all__ = ["copy_profile", "load_cookies", "save_profile"]
+
+NAME_COOKIES = "seleniumlibraries-cookies.json"
+# Chrome holds locks while running, and refuses the profile when it finds the lock of another process.
+NAMES_EXCLUDED = (
+    "SingletonLock",
+    "SingletonSocket",
+    "SingletonCookie",
+    "lockfile",
+    "RunningChromeVersion",
+    NAME_COOKIES,
+)
+# The keys of Network.CookieParam which Network.getAllCookies also returns.
+KEYS_COOKIE = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "priority", "sourceScheme")
+# Reason: _IOW(0x94, 9, int) in linux/fs.h.
+FICLONE = 0x40049409
+
+
+def copy_profile(source: Path, destination: Path) -> None:
+    """Copies the profile directory, sharing blocks of files on copy-on-write filesystems like Btrfs and XFS.
+
+    Hard links aren't used since Chrome updates databases in place, which would also change the source.
+    """
+    destination.mkdir(parents=True, exist_ok=True)
+    for path in source.iterdir():
+        if path.name in NAMES_EXCLUDED or path.is_symlink():
+            continue
+        if path.is_dir():
+            copy_profile(path, destination / path.name)
+        else:
+            clone_file(path, destination / path.name)
+
+
+def clone_file(source: Path, destination: Path) -> None:
+    """Clones the file by reflink, or copies it when the filesystem doesn't support reflink."""
+    if sys.platform != "win32":
+        with source.open("rb") as file_source, destination.open("wb") as file_destination:
+            try:
+                fcntl.ioctl(file_destination.fileno(), FICLONE, file_source.fileno())
+            except OSError:
+                pass
+            else:
+                shutil.copystat(source, destination)
+                return
+    shutil.copy2(source, destination)
+
+
+def save_profile(directory_profile: Path, template: Path, cookies: list[dict[str, Any]]) -> None:
+    """Replaces the template with the copy of the profile and the cookies.
+
+    Chrome writes cookies into its database only periodically, so the cookies from DevTools Protocol are saved
+    separately to restore the latest ones.
+    The template is swapped by renaming, but copying the old template at the same time may fail since it's removed.
+    The old template is restored when the swap fails.
+    """
+    template.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=template.parent, prefix=f".{template.name}-"))
+    try:
+        copy_profile(directory_profile, staging)
+        (staging / NAME_COOKIES).write_text(json.dumps(cookies), encoding="utf-8")
+        if template.exists():
+            backup = Path(tempfile.mkdtemp(dir=template.parent, prefix=f".{template.name}-"))
+            template.replace(backup / template.name)
+            try:
+                staging.replace(template)
+            except BaseException:
+                (backup / template.name).replace(template)
+                backup.rmdir()
+                raise
+            shutil.rmtree(backup)
+        else:
+            staging.replace(template)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def load_cookies(template: Path) -> list[dict[str, Any]]:
+    """Loads the cookies which save_profile() saved as parameters of Network.setCookies."""
+    path = template / NAME_COOKIES
+    if not path.exists():
+        return []
+    cookies: list[dict[str, Any]] = json.loads(path.read_text(encoding="utf-8"))
+    return [to_cookie_param(cookie) for cookie in cookies]
+
+
+def to_cookie_param(cookie: dict[str, Any]) -> dict[str, Any]:
+    param = {key: cookie[key] for key in KEYS_COOKIE if key in cookie}
+    # Reason: Session cookies have no expiration.
+    if not cookie.get("session", False) and "expires" in cookie:
+        param["expires"] = cookie["expires"]
+    return param
@@ -0,0 +1,362 @@
+"""The module about running jobs in worker processes with checkpoint."""
+
+from __future__ import annotations
+
+import json
+import math
+import multiprocessing
+import os
+import shutil
+import signal
+import sqlite3
+import sys
+import tempfile
+import time
+import traceback
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass
+from logging import getLogger
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+
+from selenium.common.exceptions import WebDriverException
+from typing_extensions import Self
+
+from seleniumlibraries.browser import Browser
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from multiprocessing.connection import Connection
+    from multiprocessing.context import SpawnContext
+    from multiprocessing.process import BaseProcess
+    from types import TracebackType
+
+__all__ = ["Checkpoint", "JobResult", "run_jobs"]
+
+Function = Callable[[Browser, Any], Any]
+Factory = Callable[[], Browser]
+
+
+@dataclass
+class JobResult:
+    """The result of the job.
+
+    Args:
+        job: The job.
+        result: The value which the function returned through JSON, None when the job failed.
+        error: The traceback or the reason of the last attempt when the job failed.
+        attempts: How many times the job was tried in this run.
+    """
+
+    job: Any
+    result: Any
+    error: str | None
+    attempts: int
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class Checkpoint:
+    """Jobs and their results in SQLite, so that completed jobs are skipped on resume.
+
+    Jobs are identified by their JSON, so that the same job added again is the same row.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.connection = sqlite3.connect(str(path))
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "key TEXT PRIMARY KEY, done INTEGER NOT NULL DEFAULT 0, result TEXT, error TEXT, attempts INTEGER"
+                ")",
+            )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def add(self, jobs: Iterable[Any]) -> list[tuple[str, Any]]:
+        """Adds jobs to the queue.
+
+        Returns: The keys and the jobs which aren't completed yet, without duplicates.
+        """
+        keys = dict.fromkeys(json.dumps(job, sort_keys=True) for job in jobs)
+        with self.connection:
+            self.connection.executemany("INSERT OR IGNORE INTO jobs (key) VALUES (?)", ((key,) for key in keys))
+        done = {key for (key,) in self.connection.execute("SELECT key FROM jobs WHERE done = 1")}
+        return [(key, json.loads(key)) for key in keys if key not in done]
+
+    def complete(self, key: str, result: str, attempts: int) -> None:
+        """Marks the job completed with the result serialized as JSON."""
+        with self.connection:
+            self.connection.execute(
+                "UPDATE jobs SET done = 1, result = ?, error = NULL, attempts = ? WHERE key = ?",
+                (result, attempts, key),
+            )
+
+    def fail(self, key: str, error: str, attempts: int) -> None:
+        with self.connection:
+            self.connection.execute(
+                "UPDATE jobs SET error = ?, attempts = ? WHERE key = ?",
+                (error, attempts, key),
+            )
+
+    def results(self) -> list[JobResult]:
+        """The results of completed jobs, including ones of previous runs."""
+        rows = self.connection.execute("SELECT key, result, attempts FROM jobs WHERE done = 1 ORDER BY rowid")
+        return [JobResult(json.loads(key), json.loads(result), None, attempts) for key, result, attempts in rows]
+
+
+def work(connection: Connection, function: Function, factory: Factory, directory: Path) -> None:
+    """Runs jobs received from the connection on Browser until receiving None.
+
+    Sends None each time Browser is ready, then the result of each job as JSON, so that a result which isn't JSON
+    serializable fails only its job. Chrome is started again when WebDriver fails, since it may have crashed.
+    """
+    if sys.platform != "win32":
+        # Reason: So that killing the process group kills chromedriver and Chrome together with the worker.
+        os.setsid()
+    # Reason: So that the temporary files of Browser and Chrome which killing leaves are removed with the directory.
+    tempfile.tempdir = str(directory)
+    os.environ["TMPDIR"] = str(directory)
+    while True:
+        with factory() as browser:
+            connection.send(None)
+            while True:
+                message = connection.recv()
+                if message is None:
+                    return
+                key, job = message
+                try:
+                    connection.send((key, json.dumps(function(browser, job)), None))
+                except WebDriverException:
+                    connection.send((key, None, traceback.format_exc()))
+                    break
+                # Reason: Reports any error of the job to the parent. pylint: disable-next=broad-exception-caught
+                except Exception:  # noqa: BLE001
+                    connection.send((key, None, traceback.format_exc()))
+
+
+@dataclass
+class Worker:
+    """Worker process and the job it runs."""
+
+    process: BaseProcess
+    connection: Connection
+    # The temporary directory of the worker.
+    directory: Path
+    key: str | None = None
+    job: Any = None
+    attempts: int = 0
+    # Until starting Browser, the deadline is for starting it.
+    deadline: float = math.inf
+    ready: bool = False
+
+    def assign(self, key: str, job: Any, attempts: int, timeout: float) -> None:  # noqa: ANN401
+        """Sends the job, whose deadline starts when Browser is ready if the worker is starting."""
+        self.key, self.job, self.attempts = key, job, attempts
+        if self.ready:
+            self.deadline = time.monotonic() + timeout
+        self.connection.send((key, job))
+
+    def start(self, timeout: float) -> None:
+        """Marks the worker ready since Browser started."""
+        self.ready = True
+        self.deadline = math.inf if self.key is None else time.monotonic() + timeout
+
+    def release(self) -> None:
+        self.key, self.job, self.attempts, self.deadline = None, None, 0, math.inf
+
+    def stop(self, timeout: float) -> None:
+        # Reason: The worker may have exited.
+        with suppress(OSError):
+            self.connection.send(None)
+        self.process.join(timeout)
+        self.kill()
+
+    def kill(self) -> None:
+        """Kills the worker with chromedriver and Chrome, which are in its process group, and removes temporary files."""
+        if sys.platform != "win32" and self.process.pid is not None:
+            # Reason: The worker may not have made its process group yet, or all of them may have exited.
+            with suppress(ProcessLookupError):
+                os.killpg(self.process.pid, signal.SIGKILL)
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class Dispatcher:
+    """Dispatches jobs to worker processes and replaces workers which crash or exceed the timeout."""
+
+    # How many seconds to wait for workers to start Browser.
+    TIMEOUT_START = 60.0
+    # How many seconds to wait for workers to quit Chrome.
+    TIMEOUT_STOP = 30.0
+
+    # Reason: Each argument is an independent knob of the run. pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        checkpoint: Checkpoint,
+        function: Function,
+        factory: Factory,
+        *,
+        timeout: float,
+        retries: int,
+    ) -> None:
+        self.logger = getLogger(__name__)
+        self.checkpoint = checkpoint
+        self.function = function
+        self.factory = factory
+        self.timeout = timeout
+        self.retries = retries
+        # Reason: Forking a process which runs threads of DevTools connections may deadlock.
+        self.context: SpawnContext = multiprocessing.get_context("spawn")
+        self.queue: deque[tuple[str, Any, int]] = deque()
+        self.workers: list[Worker] = []
+
+    def start_worker(self) -> Worker:
+        connection, connection_child = self.context.Pipe()
+        directory = Path(tempfile.mkdtemp(prefix="seleniumlibraries-worker-"))
+        process = self.context.Process(
+            target=work,
+            args=(connection_child, self.function, self.factory, directory),
+            name="seleniumlibraries-worker",
+            daemon=True,
+        )
+        process.start()
+        connection_child.close()
+        return Worker(process, connection, directory, deadline=time.monotonic() + self.TIMEOUT_START)
+
+    def run(self, jobs: Iterable[Any], workers: int) -> Iterator[JobResult]:
+        self.queue.extend((key, job, 1) for key, job in self.checkpoint.add(jobs))
+        self.workers = [self.start_worker() for _ in range(min(workers, len(self.queue)))]
+        try:
+            while self.queue or any(worker.key is not None for worker in self.workers):
+                for index, worker in enumerate(self.workers):
+                    if worker.key is None and self.queue:
+                        yield from self.dispatch(index, worker)
+                yield from self.collect()
+        finally:
+            for worker in self.workers:
+                worker.stop(self.TIMEOUT_STOP)
+
+    def dispatch(self, index: int, worker: Worker) -> Iterator[JobResult]:
+        try:
+            worker.assign(*self.queue.popleft(), self.timeout)
+        except OSError:
+            yield from self.handle_exit(index, worker)
+
+    def collect(self) -> Iterator[JobResult]:
+        """Waits until any worker finishes its job or starting, or the nearest deadline."""
+        waiting = [worker for worker in self.workers if worker.key is not None or not worker.ready]
+        remaining = min(worker.deadline for worker in waiting) - time.monotonic()
+        ready = wait([worker.connection for worker in waiting], max(remaining, 0))
+        for index, worker in enumerate(self.workers):
+            if worker.key is None and worker.ready:
+                continue
+            if worker.connection in ready:
+                yield from self.receive(index, worker)
+            elif time.monotonic() >= worker.deadline:
+                self.replace(index)
+                timeout = self.timeout if worker.ready else self.TIMEOUT_START
+                yield from self.finish(worker, f"Timeout after {timeout} seconds.")
+
+    def receive(self, index: int, worker: Worker) -> Iterator[JobResult]:
+        try:
+            message = worker.connection.recv()
+        except (EOFError, OSError):
+            yield from self.handle_exit(index, worker)
+            return
+        if message is None:
+            worker.start(self.timeout)
+            return
+        _key, result, error = message
+        yield from self.finish(worker, error, result)
+
+    def handle_exit(self, index: int, worker: Worker) -> Iterator[JobResult]:
+        worker.process.join(self.TIMEOUT_STOP)
+        self.replace(index)
+        yield from self.finish(worker, f"Worker exited with code {worker.process.exitcode}.")
+
+    def replace(self, index: int) -> None:
+        """Kills the worker and starts a new one with fresh Chrome."""
+        self.workers[index].kill()
+        self.workers[index] = self.start_worker()
+
+    def finish(self, worker: Worker, error: str | None, result: str = "null") -> Iterator[JobResult]:
+        """Records the job which the worker ran, whose result is serialized as JSON."""
+        key, job, attempts = worker.key, worker.job, worker.attempts
+        worker.release()
+        if key is None:
+            return
+        if error is None:
+            self.checkpoint.complete(key, result, attempts)
+            yield JobResult(job, json.loads(result), None, attempts)
+            return
+        self.checkpoint.fail(key, error, attempts)
+        if attempts <= self.retries:
+            self.logger.warning("Failed to run %s (attempt %d): %s", key, attempts, error)
+            self.queue.append((key, job, attempts + 1))
+            return
+        yield JobResult(job, None, error, attempts)
+
+
+# Reason: Each argument is an independent knob of the run. pylint: disable-next=too-many-arguments
+def run_jobs(  # noqa: PLR0913
+    path: Path,
+    function: Function,
+    jobs: Iterable[Any],
+    *,
+    workers: int = 4,
+    timeout: float = 300.0,
+    retries: int = 1,
+    factory: Factory = Browser,
+) -> Iterator[JobResult]:
+    """Runs jobs across worker processes, each with its own Browser, and yields results in the order of completion.
+
+    A crash or a hang of Chrome affects only its own job: the worker is killed and replaced with a new one.
+    Each result is saved in the checkpoint at once, so that jobs completed before are skipped when resuming with the
+    same path, see Checkpoint.results() for their results.
+
+    Usage:
+        def scrape(browser: Browser, url: str) -> str:
+            browser.driver.get(url)
+            return browser.driver.title
+
+        if __name__ == "__main__":
+            for result in run_jobs(Path("checkpoint.sqlite3"), scrape, urls, workers=8):
+                print(result.job, result.result)
+
+    Args:
+        path: The SQLite database to store the queue and results.
+        function: The function to run each job with Browser. It has to be defined at the top level of a module,
+            and jobs and results have to be JSON serializable.
+        jobs: The jobs.
+        workers: How many processes run jobs at once.
+        timeout: How many seconds each job can take before the worker is killed.
+        retries: How many times to retry a failed job.
+        factory: The factory to create Browser in each worker, which has to be defined at the top level of a module.
+    """
+    if workers < 1:
+        msg = f"Invalid number of workers: {workers}"
+        raise ValueError(msg)
+    with Checkpoint(path) as checkpoint:
+        yield from Dispatcher(checkpoint, function, factory, timeout=timeout, retries=retries).run(jobs, workers)
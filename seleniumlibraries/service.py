@@ -0,0 +1,114 @@
+"""The module about chromedriver shared by browsers."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from selenium.webdriver import Chrome
+from selenium.webdriver import ChromeOptions
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.remote.webdriver import WebDriver
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+__all__ = ["DriverService"]
+
+
+class SharedChrome(Chrome):
+    """Chrome driven through chromedriver which DriverService runs.
+
+    Chrome.__init__() starts chromedriver of its own and quit() stops it, so this skips both and keeps only the session.
+    Chrome is located same as Chrome.__init__() does, so that it starts same as the one with chromedriver of its own.
+    """
+
+    # Reason: To skip starting chromedriver. pylint: disable-next=super-init-not-called
+    def __init__(self, url: str, options: ChromeOptions) -> None:
+        browser_path = DriverFinder(Service(), options).get_browser_path()
+        if browser_path:
+            options.binary_location = browser_path
+            options.browser_version = None
+        executor = ChromiumRemoteConnection(
+            remote_server_addr=url,
+            vendor_prefix="goog",
+            browser_name="chrome",
+            keep_alive=True,
+            # Reason: Same as ChromiumDriver.__init__().
+            ignore_proxy=options._ignore_local_proxy,  # noqa: SLF001
+        )
+        # Reason: To skip starting chromedriver. pylint: disable-next=non-parent-init-called
+        WebDriver.__init__(self, command_executor=executor, options=options)
+        self._is_remote = False
+
+    def quit(self) -> None:
+        """Closes Chrome, keeping chromedriver running for other sessions."""
+        WebDriver.quit(self)
+
+
+class DriverService:
+    """Chromedriver shared by Browser instances, so that each Browser launches only Chrome.
+
+    Usage:
+        with DriverService() as service:
+            with Browser(service=service) as browser:
+                browser.driver.get("https://example.com/")
+
+    Args:
+        url: The URL of chromedriver already running, for example, "http://localhost:9515". When omitted, start()
+            launches chromedriver on a free port and stop() terminates it.
+    """
+
+    def __init__(self, url: str | None = None) -> None:
+        self.lock = threading.Lock()
+        self.service: Service | None = None
+        self._url = url
+
+    @property
+    def url(self) -> str:
+        """The URL of chromedriver."""
+        if self._url is None:
+            msg = "The service is not started."
+            raise RuntimeError(msg)
+        return self._url
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Launches chromedriver unless it is running."""
+        with self.lock:
+            if self._url is not None:
+                return
+            service = Service()
+            service.path = service.env_path() or DriverFinder(service, ChromeOptions()).get_driver_path()
+            service.start()
+            self.service = service
+            self._url = service.service_url
+
+    def stop(self) -> None:
+        """Terminates chromedriver if start() launched it. Quit browsers using it beforehand."""
+        with self.lock:
+            if self.service is None:
+                return
+            try:
+                self.service.stop()
+            finally:
+                self.service = None
+                self._url = None
+
+    def create_driver(self, options: ChromeOptions) -> Chrome:
+        """Starts Chrome through the shared chromedriver."""
+        return SharedChrome(self.url, options)
@@ -0,0 +1,408 @@
+"""The module about snapshot of DOM to query without round trips to WebDriver."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Union
+
+from selenium.common.exceptions import NoSuchElementException
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+
+__all__ = ["Snapshot", "SnapshotElement"]
+
+# Serializes elements and text nodes in document order,
+# elements as [parent, tag, attributes, visible, display] and text nodes as [parent, null, text].
+# Attribute "value" of form controls is their current value, same as WebElement.get_attribute().
+JAVASCRIPT_SNAPSHOT = """
+const nodes = [];
+const stack = [[document.documentElement, null]];
+while (stack.length) {
+  const [node, parent] = stack.pop();
+  if (node.nodeType === Node.TEXT_NODE) {
+    nodes.push([parent, null, node.data]);
+    continue;
+  }
+  const index = nodes.length;
+  const style = getComputedStyle(node);
+  const attributes = {};
+  for (const attribute of node.attributes) {
+    attributes[attribute.name] = attribute.value;
+  }
+  if (node instanceof HTMLInputElement || node instanceof HTMLTextAreaElement || node instanceof HTMLSelectElement) {
+    attributes.value = node.value;
+  }
+  const visible = node.getClientRects().length > 0 && style.visibility !== "hidden";
+  nodes.push([parent, node.localName, attributes, visible, style.display]);
+  const children = Array.from(node.childNodes).filter(
+    (child) => child.nodeType === Node.ELEMENT_NODE || child.nodeType === Node.TEXT_NODE
+  );
+  for (let i = children.length - 1; i >= 0; i--) {
+    stack.push([children[i], index]);
+  }
+}
+return nodes;
+"""
+
+TAG_DOCUMENT = "#document"
+WHITESPACE = re.compile(r"\s+")
+# The values of CSS display which innerText doesn't separate by line breaks.
+DISPLAYS_INLINE = ("inline", "contents", "ruby", "table-cell")
+
+Predicate = Callable[["SnapshotElement"], bool]
+# Filters nodes selected by a step of XPath.
+Filter = Callable[[List["SnapshotElement"]], List["SnapshotElement"]]
+Node = Union["SnapshotElement", str]
+
+
+class SnapshotElement:
+    """Element in Snapshot, which answers queries in process without WebDriver.
+
+    Attributes:
+        tag_name: The local name of the element.
+        attributes: The attributes of the element.
+        visible: Whether the element was rendered when the snapshot was captured.
+        display: The computed CSS display of the element.
+    """
+
+    # Reason: Each argument is a field of the serialized node. pylint: disable-next=too-many-arguments
+    def __init__(  # noqa: PLR0913
+        self,
+        index: int,
+        tag_name: str,
+        attributes: dict[str, str],
+        parent: SnapshotElement | None,
+        *,
+        visible: bool = False,
+        display: str = "",
+    ) -> None:
+        self.index = index
+        self.tag_name = tag_name
+        self.attributes = attributes
+        self.parent = parent
+        self.visible = visible
+        self.display = display
+        self.children: list[Node] = []
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.tag_name} {self.attributes}>"
+
+    @property
+    def elements(self) -> list[SnapshotElement]:
+        """The child elements."""
+        return [child for child in self.children if isinstance(child, SnapshotElement)]
+
+    def iter_descendants(self) -> Iterator[SnapshotElement]:
+        """Iterates descendant elements in document order."""
+        for child in self.elements:
+            yield child
+            yield from child.iter_descendants()
+
+    def get_attribute(self, name: str) -> str | None:
+        return self.attributes.get(name)
+
+    @property
+    def text_content(self) -> str:
+        """Same as textContent in the page."""
+        return "".join(child if isinstance(child, str) else child.text_content for child in self.children)
+
+    @property
+    def text(self) -> str:
+        """The text with the same fallback as get_text(), approximating innerText from the rendered descendants."""
+        text = self._render_text() if self.visible else ""
+        return text or self.text_content
+
+    def _render_text(self) -> str:
+        parts: list[str] = []
+        self._render(parts)
+        lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def _render(self, parts: list[str]) -> None:
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(WHITESPACE.sub(" ", child))
+            elif not child.visible:
+                continue
+            elif child.tag_name == "br":
+                parts.append("\n")
+            elif child.display.startswith(DISPLAYS_INLINE):
+                child._render(parts)  # noqa: SLF001
+                parts.append(" " if child.display == "table-cell" else "")
+            else:
+                parts.append("\n")
+                child._render(parts)  # noqa: SLF001
+                parts.append("\n")
+
+    def find_element(self, by: str, value: str) -> SnapshotElement:
+        """Same as WebElement.find_element() in the snapshot.
+
+        Raises:
+            NoSuchElementException: When not found.
+        """
+        elements = self.find_elements(by, value)
+        if not elements:
+            msg = f"Unable to locate element: {by}={value}"
+            raise NoSuchElementException(msg)
+        return elements[0]
+
+    def find_elements(self, by: str, value: str) -> list[SnapshotElement]:
+        """Same as WebElement.find_elements() in the snapshot.
+
+        Supports the subset of CSS selectors: type, universal, ID, class and attribute selectors combined by
+        descendant, child and sibling combinators, and the subset of XPath: steps of child and descendant axes with
+        name tests, ".", ".." and predicates of position, attribute, text(), contains() and starts-with().
+        """
+        if by == "xpath":
+            return evaluate_xpath(self, value)
+        predicate = parse_selector(value) if by == "css selector" else create_predicate(by, value)
+        return [element for element in self.iter_descendants() if predicate(element)]
+
+
+class Snapshot(SnapshotElement):
+    """Snapshot of the document captured in one round trip, see Browser.snapshot().
+
+    Queries and texts don't issue any WebDriver command, so they don't reflect changes after capturing.
+
+    Args:
+        nodes: The nodes serialized by JAVASCRIPT_SNAPSHOT.
+    """
+
+    def __init__(self, nodes: Sequence[Sequence[Any]]) -> None:
+        super().__init__(-1, TAG_DOCUMENT, {}, None)
+        elements: dict[int, SnapshotElement] = {}
+        for index, node in enumerate(nodes):
+            parent = self if node[0] is None else elements[node[0]]
+            if node[1] is None:
+                parent.children.append(node[2])
+                continue
+            element = SnapshotElement(index, node[1], node[2], parent, visible=node[3], display=node[4])
+            parent.children.append(element)
+            elements[index] = element
+
+
+def create_predicate(by: str, value: str) -> Predicate:
+    """Creates the predicate of locator strategies other than CSS selector and XPath."""
+    predicates: dict[str, Predicate] = {
+        "id": lambda element: element.attributes.get("id") == value,
+        "name": lambda element: element.attributes.get("name") == value,
+        "class name": lambda element: value in element.attributes.get("class", "").split(),
+        "tag name": lambda element: element.tag_name == value.lower(),
+        "link text": lambda element: element.tag_name == "a" and element.text.strip() == value,
+        "partial link text": lambda element: element.tag_name == "a" and value in element.text,
+    }
+    if by not in predicates:
+        msg = f"Unsupported locator strategy: {by}"
+        raise ValueError(msg)
+    return predicates[by]
+
+
+# Operators of attribute selectors.
+OPERATORS_CSS: dict[str, Callable[[str, str], bool]] = {
+    "=": lambda attribute, value: attribute == value,
+    "~=": lambda attribute, value: value in attribute.split(),
+    "|=": lambda attribute, value: attribute == value or attribute.startswith(f"{value}-"),
+    "^=": lambda attribute, value: bool(value) and attribute.startswith(value),
+    "$=": lambda attribute, value: bool(value) and attribute.endswith(value),
+    "*=": lambda attribute, value: bool(value) and value in attribute,
+}
+TOKEN_CSS = re.compile(
+    r"""\s*(?P<combinator>[>+~,])\s*"""
+    r"""|(?P<descendant>\s+)"""
+    r"""|(?P<tag>\*|[A-Za-z][\w-]*)"""
+    r"""|\#(?P<id>[\w-]+)"""
+    r"""|\.(?P<class>[\w-]+)"""
+    r"""|\[\s*(?P<attribute>[\w:-]+)\s*(?:(?P<operator>[~|^$*]?=)\s*(?P<value>"[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]""",
+)
+
+
+def create_attribute_condition(name: str, operator: str | None, value: str | None) -> Predicate:
+    if operator is None or value is None:
+        return lambda element: name in element.attributes
+    value = value[1:-1] if value[:1] in {'"', "'"} else value
+    compare = OPERATORS_CSS[operator]
+    return lambda element: name in element.attributes and compare(element.attributes[name], value)
+
+
+@dataclass
+class Compound:
+    """Compound selector, which is a sequence of simple selectors without combinators."""
+
+    tag: str | None = None
+    conditions: list[Predicate] | None = None
+
+    def matches(self, element: SnapshotElement) -> bool:
+        if element.tag_name == TAG_DOCUMENT or (self.tag not in {None, "*"} and element.tag_name != self.tag):
+            return False
+        return all(condition(element) for condition in self.conditions or [])
+
+    def add(self, condition: Predicate) -> None:
+        self.conditions = [*(self.conditions or []), condition]
+
+    @property
+    def empty(self) -> bool:
+        return self.tag is None and not self.conditions
+
+
+@dataclass
+class ComplexSelector:
+    """Compound selectors with combinators between them, from left to right."""
+
+    compounds: list[Compound]
+    combinators: list[str]
+
+    def matches(self, element: SnapshotElement, position: int | None = None) -> bool:
+        position = len(self.compounds) - 1 if position is None else position
+        if not self.compounds[position].matches(element):
+            return False
+        if position == 0:
+            return True
+        return any(self.matches(candidate, position - 1) for candidate in self._candidates(element, position))
+
+    def _candidates(self, element: SnapshotElement, position: int) -> list[SnapshotElement]:
+        combinator = self.combinators[position - 1]
+        if combinator in {">", " "}:
+            ancestors = []
+            parent = element.parent
+            while parent is not None:
+                ancestors.append(parent)
+                parent = parent.parent
+            return ancestors[:1] if combinator == ">" else ancestors
+        siblings = [] if element.parent is None else element.parent.elements
+        preceding = siblings[: siblings.index(element)]
+        return preceding[-1:] if combinator == "+" else preceding
+
+
+def parse_selector(selector: str) -> Predicate:
+    """Parses the subset of CSS selectors into the predicate of elements.
+
+    Raises:
+        ValueError: When the selector isn't supported.
+    """
+    groups: list[ComplexSelector] = [ComplexSelector([Compound()], [])]
+    text = selector.strip()
+    position = 0
+    while position < len(text):
+        match = TOKEN_CSS.match(text, position)
+        if match is None:
+            msg = f"Unsupported selector: {selector}"
+            raise ValueError(msg)
+        position = match.end()
+        apply_token(groups, match)
+    # Reason: An empty compound, for example, after the trailing comma, would match every element.
+    if any(compound.empty for group in groups for compound in group.compounds):
+        msg = f"Unsupported selector: {selector}"
+        raise ValueError(msg)
+    return lambda element: any(group.matches(element) for group in groups)
+
+
+def apply_token(groups: list[ComplexSelector], match: re.Match[str]) -> None:
+    current = groups[-1]
+    compound = current.compounds[-1]
+    combinator = match["combinator"] or (" " if match["descendant"] else None)
+    if combinator == ",":
+        groups.append(ComplexSelector([Compound()], []))
+    elif combinator is not None:
+        current.compounds.append(Compound())
+        current.combinators.append(combinator)
+    elif match["tag"] is not None:
+        compound.tag = match["tag"].lower()
+    elif match["id"] is not None:
+        compound.add(create_attribute_condition("id", "=", match["id"]))
+    elif match["class"] is not None:
+        compound.add(create_attribute_condition("class", "~=", match["class"]))
+    else:
+        compound.add(create_attribute_condition(match["attribute"], match["operator"], match["value"]))
+
+
+STEP_XPATH = re.compile(r"(?P<axis>//?)?(?P<test>\*|\.\.|\.|[A-Za-z_][\w.-]*)(?P<predicates>(?:\[[^\]]*\])*)")
+PREDICATE_XPATH = re.compile(r"\[([^\]]*)\]")
+OPERAND_XPATH = r"(?P<operand>@[\w:-]+|text\(\)|\.|normalize-space\(\.?\))"
+LITERAL_XPATH = r"(?P<literal>'[^']*'|\"[^\"]*\")"
+COMPARISON_XPATH = re.compile(rf"{OPERAND_XPATH}\s*=\s*{LITERAL_XPATH}")
+FUNCTION_XPATH = re.compile(rf"(?P<function>contains|starts-with)\(\s*{OPERAND_XPATH}\s*,\s*{LITERAL_XPATH}\s*\)")
+FUNCTIONS_XPATH: dict[str, Callable[[str, str], bool]] = {
+    "=": lambda operand, value: operand == value,
+    "contains": lambda operand, value: value in operand,
+    "starts-with": lambda operand, value: operand.startswith(value),
+}
+
+
+def evaluate_xpath(context: SnapshotElement, expression: str) -> list[SnapshotElement]:
+    """Evaluates the subset of XPath which selects elements.
+
+    Raises:
+        ValueError: When the expression isn't supported.
+    """
+    text = expression.strip()
+    if text.startswith("/"):
+        while context.parent is not None:
+            context = context.parent
+    nodes = [context]
+    position = 0
+    while position < len(text):
+        match = STEP_XPATH.match(text, position)
+        if match is None or (position > 0 and match["axis"] is None):
+            msg = f"Unsupported XPath: {expression}"
+            raise ValueError(msg)
+        position = match.end()
+        if match["axis"] == "//":
+            nodes = [descendant for node in nodes for descendant in (node, *node.iter_descendants())]
+        predicates = [
+            parse_predicate(predicate, expression) for predicate in PREDICATE_XPATH.findall(match["predicates"])
+        ]
+        selected = {id(element): element for node in nodes for element in select_step(node, match["test"], predicates)}
+        nodes = sorted(selected.values(), key=lambda element: element.index)
+    return [node for node in nodes if node.tag_name != TAG_DOCUMENT]
+
+
+def select_step(node: SnapshotElement, test: str, predicates: list[Filter]) -> list[SnapshotElement]:
+    if test == ".":
+        selected = [node]
+    elif test == "..":
+        selected = [] if node.parent is None else [node.parent]
+    else:
+        selected = [child for child in node.elements if test in {"*", child.tag_name}]
+    for predicate in predicates:
+        selected = predicate(selected)
+    return selected
+
+
+def parse_predicate(predicate: str, expression: str) -> Filter:
+    """Parses the predicate into the filter of the nodes selected by the step."""
+    predicate = predicate.strip()
+    if predicate.isdigit() or predicate == "last()":
+        return lambda nodes: nodes[int(predicate) - 1 : int(predicate)] if predicate.isdigit() else nodes[-1:]
+    if re.fullmatch(r"@[\w:-]+", predicate):
+        return lambda nodes: [node for node in nodes if predicate[1:] in node.attributes]
+    comparison = COMPARISON_XPATH.fullmatch(predicate)
+    function = FUNCTION_XPATH.fullmatch(predicate)
+    match = comparison or function
+    if match is None:
+        msg = f"Unsupported XPath: {expression}"
+        raise ValueError(msg)
+    compare = FUNCTIONS_XPATH[function["function"] if function else "="]
+    operand, value = match["operand"], match["literal"][1:-1]
+
+    def filter_nodes(nodes: list[SnapshotElement]) -> list[SnapshotElement]:
+        strings = ((node, get_operand(node, operand)) for node in nodes)
+        return [node for node, string in strings if string is not None and compare(string, value)]
+
+    return filter_nodes
+
+
+def get_operand(node: SnapshotElement, operand: str) -> str | None:
+    if operand.startswith("@"):
+        return node.attributes.get(operand[1:])
+    if operand == "text()":
+        return "".join(child for child in node.children if isinstance(child, str))
+    if operand == ".":
+        return node.text_content
+    return " ".join(node.text_content.split())
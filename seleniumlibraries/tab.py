@@ -0,0 +1,198 @@
+"""The module about using many tabs in one browser session."""
+
+from __future__ import annotations
+
+import itertools
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from typing import Any
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.wait import POLL_FREQUENCY
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from selenium.webdriver.remote.webelement import WebElement
+
+    from seleniumlibraries.browser import Browser
+    from seleniumlibraries.devtools import Message
+
+__all__ = ["Tab", "load_in_tabs"]
+
+
+class Tab:
+    """Tab of Browser.
+
+    Tabs share one Chrome, which costs far less memory than launching Chrome for each page.
+    WebDriver only acts on one tab at a time, so methods switch to the tab and back while holding the lock of the
+    browser.
+    Navigation goes through DevTools Protocol without switching, so that pages in many tabs load at once.
+
+    Create it by Browser.open_tab().
+    """
+
+    def __init__(self, browser: Browser, handle: str) -> None:
+        self.browser = browser
+        self.handle = handle
+        self.loader_id: str | None = None
+        self.loaded_loader_ids: set[str] = set()
+        self.session = browser.devtools.attach(handle)
+        self.session.add_listener("Page.lifecycleEvent", self._on_lifecycle_event)
+        self.session.execute("Page.enable")
+        self.session.execute("Page.setLifecycleEventsEnabled", {"enabled": True})
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        """Switches WebDriver to this tab while the block runs, then back to the previous tab."""
+        with self.browser.lock:
+            handle_previous = self.browser.driver.current_window_handle
+            if handle_previous == self.handle:
+                yield
+                return
+            self.browser.driver.switch_to.window(self.handle)
+            try:
+                yield
+            finally:
+                self.browser.driver.switch_to.window(handle_previous)
+
+    def navigate(self, url: str) -> None:
+        """Starts loading the page without waiting for the load event.
+
+        Raises WebDriverException when the page can't be reached.
+        """
+        result = self.session.execute("Page.navigate", {"url": url})
+        if result.get("errorText"):
+            msg = f"Failed to navigate to {url}: {result['errorText']}"
+            raise WebDriverException(msg)
+        with self.browser.tab_loaded:
+            self.loader_id = result.get("loaderId")
+            # Reason: The load event may have been dispatched before the result arrives.
+            self.loaded_loader_ids &= {self.loader_id}
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the page which navigate() started has fired the load event."""
+        with self.browser.tab_loaded:
+            return self.loader_id is None or self.loader_id in self.loaded_loader_ids
+
+    def wait_for_load(self, timeout: float) -> None:
+        """Waits for the load event of the page which navigate() started."""
+        deadline = time.monotonic() + timeout
+        with self.browser.tab_loaded:
+            while not self.is_loaded:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    msg = "Timeout waiting for loading page."
+                    raise TimeoutError(msg)
+                self.browser.tab_loaded.wait(remaining)
+
+    def get(self, url: str) -> None:
+        with self.activate():
+            self.browser.driver.get(url)
+
+    def wait_for(
+        self,
+        by: str,
+        value: str,
+        *,
+        timeout: float | None = None,
+        observe: bool = True,
+        poll_frequency: float = POLL_FREQUENCY,
+    ) -> WebElement:
+        with self.activate():
+            return self.browser.wait_for(by, value, timeout=timeout, observe=observe, poll_frequency=poll_frequency)
+
+    def get_texts(self, by: str, value: str) -> list[str]:
+        with self.activate():
+            return self.browser.get_texts(by, value)
+
+    def scroll_and_click(self, by: str, value: str) -> None:
+        with self.activate():
+            self.browser.scroll_and_click(by, value)
+
+    def save_as_pdf(self, path: Path, *, options: dict[str, Any] | None = None) -> Path:
+        with self.activate():
+            return self.browser.save_as_pdf(path, options=options)
+
+    def close(self) -> None:
+        """Closes the tab.
+
+        WebDriver switches back to the previous tab, or to the first tab when this tab was the current one.
+        """
+        self.session.remove_listener("Page.lifecycleEvent", self._on_lifecycle_event)
+        self.session.detach()
+        driver = self.browser.driver
+        with self.browser.lock:
+            handle_previous = driver.current_window_handle
+            driver.switch_to.window(self.handle)
+            driver.close()
+            driver.switch_to.window(handle_previous if handle_previous != self.handle else driver.window_handles[0])
+
+    def _on_lifecycle_event(self, params: Message) -> None:
+        if params["name"] != "load":
+            return
+        with self.browser.tab_loaded:
+            self.loaded_loader_ids.add(params["loaderId"])
+            self.browser.tab_loaded.notify_all()
+
+
+def load_in_tabs(
+    browser: Browser,
+    urls: Iterable[str],
+    *,
+    tabs: int = 4,
+    timeout: float = 30.0,
+) -> Iterator[tuple[Tab, str]]:
+    """Loads pages in tabs at once and yields each tab in the order of completion of loading.
+
+    The page stays in the tab until the next iteration, then the tab starts loading the next URL,
+    so that network waits of the pages overlap.
+
+    Usage:
+        for tab, url in load_in_tabs(browser, urls):
+            texts[url] = tab.get_texts(By.CSS_SELECTOR, "h1")
+
+    Args:
+        browser: The browser to open tabs in. The tabs are closed at the end.
+        urls: The URLs of the pages.
+        tabs: How many tabs load pages at once.
+        timeout: How many seconds to wait until any page finishes loading.
+    """
+    iterator = iter(urls)
+    opened: list[Tab] = []
+    try:
+        loading: dict[Tab, str] = {}
+        # Reason: Opens no more tabs than URLs.
+        for url in itertools.islice(iterator, tabs):
+            tab = browser.open_tab()
+            opened.append(tab)
+            tab.navigate(url)
+            loading[tab] = url
+        while loading:
+            tab = wait_for_any(browser, list(loading), timeout)
+            yield tab, loading.pop(tab)
+            url_next = next(iterator, None)
+            if url_next is not None:
+                tab.navigate(url_next)
+                loading[tab] = url_next
+    finally:
+        for tab in opened:
+            tab.close()
+
+
+def wait_for_any(browser: Browser, tabs: list[Tab], timeout: float) -> Tab:
+    deadline = time.monotonic() + timeout
+    with browser.tab_loaded:
+        while True:
+            for tab in tabs:
+                if tab.is_loaded:
+                    return tab
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                msg = "Timeout waiting for loading page."
+                raise TimeoutError(msg)
+            browser.tab_loaded.wait(remaining)
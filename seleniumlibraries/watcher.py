@@ -0,0 +1,179 @@
+"""The module about watching files in directory."""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC
+from abc import abstractmethod
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+__all__: list[str] = []
+
+
+class DirectoryWatcher(ABC):
+    """Keeps names of the files in the directory up to date."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.names: set[str] = set()
+
+    def scan(self) -> None:
+        self.names = {path.name for path in self.directory.iterdir()}
+
+    def start(self) -> None:
+        self.scan()
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Releases the resources."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def wait(self, timeout: float) -> None:
+        """Waits until the files in the directory may have changed or timeout (in seconds) elapses."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def wait_async(self, timeout: float) -> None:
+        """Awaitable version of wait() which doesn't block the event loop."""
+        raise NotImplementedError
+
+
+class PollingWatcher(DirectoryWatcher):
+    """Rescans the directory periodically."""
+
+    INTERVAL = 0.5
+
+    def stop(self) -> None:
+        """Nothing to release."""
+
+    def wait(self, timeout: float) -> None:
+        time.sleep(min(self.INTERVAL, timeout))
+        self.scan()
+
+    async def wait_async(self, timeout: float) -> None:
+        await asyncio.sleep(min(self.INTERVAL, timeout))
+        self.scan()
+
+
+class InotifyWatcher(DirectoryWatcher):
+    """Wakes up as soon as the kernel reports changes in the directory.
+
+    - inotify(7) - Linux manual page
+      https://man7.org/linux/man-pages/man7/inotify.7.html
+    """
+
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    MASK = IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    HEADER = struct.Struct("iIII")
+
+    def __init__(self, directory: Path) -> None:
+        super().__init__(directory)
+        self.file_descriptor: int | None = None
+
+    @staticmethod
+    def load_libc() -> ctypes.CDLL | None:
+        if not sys.platform.startswith("linux"):
+            return None
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        return libc if hasattr(libc, "inotify_init1") else None
+
+    def start(self) -> None:
+        libc = self.load_libc()
+        if libc is None:
+            msg = "inotify is not available on this platform."
+            raise OSError(msg)
+        file_descriptor = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if file_descriptor < 0:
+            error_number = ctypes.get_errno()
+            raise OSError(error_number, os.strerror(error_number))
+        self.file_descriptor = file_descriptor
+        # Reason: Watches before scanning so that no change is missed between them.
+        if libc.inotify_add_watch(file_descriptor, os.fsencode(self.directory), self.MASK) < 0:
+            error_number = ctypes.get_errno()
+            self.stop()
+            raise OSError(error_number, os.strerror(error_number), str(self.directory))
+        super().start()
+
+    def stop(self) -> None:
+        if self.file_descriptor is not None:
+            os.close(self.file_descriptor)
+            self.file_descriptor = None
+
+    def wait(self, timeout: float) -> None:
+        file_descriptor = self.get_file_descriptor()
+        readable, _, _ = select.select([file_descriptor], [], [], timeout)
+        if readable:
+            self.read_events(file_descriptor)
+
+    async def wait_async(self, timeout: float) -> None:
+        file_descriptor = self.get_file_descriptor()
+        loop = asyncio.get_running_loop()
+        readable = asyncio.Event()
+        loop.add_reader(file_descriptor, readable.set)
+        try:
+            await asyncio.wait_for(readable.wait(), timeout)
+        except asyncio.TimeoutError:
+            return
+        finally:
+            loop.remove_reader(file_descriptor)
+        self.read_events(file_descriptor)
+
+    def get_file_descriptor(self) -> int:
+        if self.file_descriptor is None:
+            msg = "The watcher is not started."
+            raise RuntimeError(msg)
+        return self.file_descriptor
+
+    def read_events(self, file_descriptor: int) -> None:
+        while True:
+            try:
+                buffer = os.read(file_descriptor, 64 * 1024)
+            except BlockingIOError:
+                return
+            self.apply(buffer)
+
+    def apply(self, buffer: bytes) -> None:
+        offset = 0
+        while offset < len(buffer):
+            _, mask, _, length = self.HEADER.unpack_from(buffer, offset)
+            offset += self.HEADER.size
+            name = os.fsdecode(buffer[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & self.IN_Q_OVERFLOW:
+                self.scan()
+            elif mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                self.names.add(name)
+            elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                self.names.discard(name)
+
+
+@contextmanager
+def watch(directory: Path) -> Iterator[DirectoryWatcher]:
+    """Watches the directory with inotify when available, otherwise with polling."""
+    watcher: DirectoryWatcher = InotifyWatcher(directory)
+    try:
+        watcher.start()
+    except OSError:
+        watcher = PollingWatcher(directory)
+        watcher.start()
+    try:
+        yield watcher
+    finally:
+        watcher.stop()
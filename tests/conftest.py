@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 from unittest.mock import Mock
 
 import pytest
@@ -14,9 +16,47 @@ from seleniumlibraries.browser import DownloadWaiter
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from seleniumlibraries.devtools import Listener
+    from seleniumlibraries.devtools import Message
+
 collect_ignore = ["setup.py"]
 
 
+class FakeSession:
+    """Session or connection of DevTools Protocol which lets tests emit events.
+
+    Test modules override respond() to return results of the commands they use.
+    """
+
+    def __init__(self) -> None:
+        self.listeners: dict[str, Listener] = {}
+        self.execute = Mock(side_effect=self.respond)
+        self.detach = Mock()
+
+    def add_listener(self, method: str, listener: Listener) -> None:
+        self.listeners[method] = listener
+
+    def remove_listener(self, method: str, _listener: Listener) -> None:
+        del self.listeners[method]
+
+    def respond(self, _method: str, _params: Message | None = None) -> Message:
+        return {}
+
+    def emit(self, method: str, params: Message, *, later: float = 0) -> None:
+        if later:
+            threading.Timer(later, self.listeners[method], (params,)).start()
+        else:
+            self.listeners[method](params)
+
+
+def create_mock_browser(**_kwargs: object) -> MagicMock:
+    """Create a mock Browser whose driver is also a mock, test modules set up the methods they use."""
+    browser = MagicMock(spec=Browser)
+    browser.driver = MagicMock()
+    browser.timeout = 10
+    return browser
+
+
 @pytest.fixture
 def fixture_browser() -> Generator[Browser]:
     """Create a real Browser for testing.
@@ -0,0 +1,172 @@
+"""Tests for asynchronous.py ."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING
+from typing import cast
+from unittest.mock import MagicMock
+from unittest.mock import PropertyMock
+from unittest.mock import patch
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from seleniumlibraries.asynchronous import AsyncBrowser
+from seleniumlibraries.browser import TabWaiter
+from seleniumlibraries.interaction import Step
+from tests.conftest import create_mock_browser
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from seleniumlibraries.devtools import Listener
+    from seleniumlibraries.interaction import StepResult
+
+
+def get_driver(browser: AsyncBrowser) -> MagicMock:
+    return cast("MagicMock", browser.browser.driver)
+
+
+@pytest.fixture
+def mock_browser_class() -> Generator[MagicMock]:
+    with patch("seleniumlibraries.asynchronous.Browser", side_effect=create_mock_browser) as browser_class:
+        yield browser_class
+
+
+@pytest.mark.usefixtures("mock_browser_class")
+class TestAsyncBrowser:
+    """Test cases for AsyncBrowser class."""
+
+    def test_context_manager(self, mock_browser_class: MagicMock, tmp_path: Path) -> None:
+        """Test AsyncBrowser starts Browser with the arguments and quits it on exit."""
+
+        async def run() -> MagicMock:
+            async with AsyncBrowser(directory_download=tmp_path) as browser:
+                await browser.get("https://example.com/")
+                return cast("MagicMock", browser.browser)
+
+        browser = asyncio.run(run())
+
+        mock_browser_class.assert_called_once_with(directory_download=tmp_path)
+        browser.driver.get.assert_called_once_with("https://example.com/")
+        browser.__exit__.assert_called_once_with(None, None, None)
+
+    def test_concurrency(self) -> None:
+        """Test calls of different sessions run concurrently while calls of one session run one by one."""
+        delay = 0.2
+
+        async def run() -> float:
+            async with AsyncBrowser() as browser1, AsyncBrowser() as browser2:
+                for browser in (browser1, browser2):
+                    get_driver(browser).get.side_effect = lambda _url: time.sleep(delay)
+                start = time.monotonic()
+                await asyncio.gather(
+                    browser1.get("https://example.com/1"),
+                    browser1.get("https://example.com/2"),
+                    browser2.get("https://example.com/3"),
+                )
+                return time.monotonic() - start
+
+        elapsed = asyncio.run(run())
+
+        assert delay * 2 <= elapsed < delay * 3
+
+    def test_not_started(self) -> None:
+        """Test calls before start are rejected."""
+        with pytest.raises(RuntimeError, match="not started"):
+            asyncio.run(AsyncBrowser().get("https://example.com/"))
+
+    def test_wait_for(self) -> None:
+        """Test wait_for finds elements with short commands until the element appears."""
+
+        async def run() -> None:
+            async with AsyncBrowser() as browser:
+                element = MagicMock(spec=WebElement)
+                get_driver(browser).find_elements.side_effect = [[], [], [element]]
+                assert await browser.wait_for(By.ID, "delayed", poll_frequency=0.01) is element
+                get_driver(browser).find_elements.side_effect = None
+                get_driver(browser).find_elements.return_value = []
+                with pytest.raises(TimeoutException, match="Timeout waiting for element: id=missing"):
+                    await browser.wait_for(By.ID, "missing", timeout=0.05, poll_frequency=0.01)
+
+        asyncio.run(run())
+
+    def test_run_steps(self) -> None:
+        """Test run_steps runs again from the step whose element is missing."""
+        steps = [Step.fill(By.ID, "name", "Alice"), Step.click(By.ID, "submit", trusted=False)]
+
+        async def run() -> list[StepResult]:
+            async with AsyncBrowser() as browser:
+                get_driver(browser).execute_async_script.side_effect = [
+                    {"errors": [None, "Error: Timeout waiting for element: id=submit"], "element": None},
+                    {"errors": [None], "element": None},
+                ]
+                results = await browser.run_steps(steps, poll_frequency=0.01)
+                first, second = get_driver(browser).execute_async_script.call_args_list
+                assert first.args[1:] == ([list(step) for step in steps], 0)
+                assert second.args[1:] == ([list(steps[1])], 0)
+                return results
+
+        results = asyncio.run(run())
+
+        assert [result.step for result in results] == steps
+        assert all(result.succeeded for result in results)
+
+    def test_wait_for_closing_tab(self) -> None:
+        """Test wait_for_closing_tab wakes up on the event of DevTools Protocol from another thread."""
+        handles = ["1", "2"]
+
+        def close(listener: Listener) -> None:
+            handles.remove("2")
+            listener({"targetInfo": {"type": "page"}})
+
+        def add_listener(method: str, listener: Listener) -> None:
+            if method == "Target.targetDestroyed":
+                threading.Timer(0.1, close, (listener,)).start()
+
+        async def run() -> float:
+            async with AsyncBrowser() as browser:
+                mock_browser = cast("MagicMock", browser.browser)
+                type(mock_browser.driver).window_handles = PropertyMock(side_effect=lambda: list(handles))
+                mock_browser.devtools.add_listener.side_effect = add_listener
+                start = time.monotonic()
+                await browser.wait_for_closing_tab(1, 5)
+                get_driver(browser).close.assert_not_called()
+                return time.monotonic() - start
+
+        assert asyncio.run(run()) < TabWaiter.INTERVAL_CHECK
+
+    def test_wait_for_closing_tab_timeout(self) -> None:
+        """Test wait_for_closing_tab closes the tab on timeout and raises TimeoutError if it still remains."""
+
+        async def run() -> None:
+            async with AsyncBrowser() as browser:
+                type(get_driver(browser)).window_handles = PropertyMock(return_value=["1", "2"])
+                with pytest.raises(TimeoutError, match="Timeout waiting for closing tab"):
+                    await browser.wait_for_closing_tab(1, 0.1)
+                get_driver(browser).close.assert_called_once_with()
+
+        asyncio.run(run())
+
+    def test_wrappers(self, tmp_path: Path) -> None:
+        """Test wrappers pass arguments to Browser and return its results."""
+
+        async def run() -> None:
+            async with AsyncBrowser() as browser:
+                mock_browser = cast("MagicMock", browser.browser)
+                mock_browser.recycle.return_value = True
+
+                assert await browser.recycle()
+                await browser.restart()
+                await browser.save_profile(tmp_path)
+
+                mock_browser.restart.assert_called_once_with()
+                mock_browser.save_profile.assert_called_once_with(tmp_path)
+
+        asyncio.run(run())
@@ -0,0 +1,86 @@
+"""Tests for batch.py ."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from selenium.common.exceptions import WebDriverException
+
+from seleniumlibraries.batch import PdfJob
+from seleniumlibraries.batch import render_pdfs
+from seleniumlibraries.pool import BrowserPool
+from tests.conftest import create_mock_browser
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    import pytest
+
+
+def create_pdf_browser() -> MagicMock:
+    browser = create_mock_browser()
+    browser.save_as_pdf.side_effect = lambda path, **_kwargs: path
+    return browser
+
+
+class TestRenderPdfs:
+    """Test cases for render_pdfs function."""
+
+    def test_render(self, tmp_path: Path) -> None:
+        """Test render_pdfs renders all jobs across browsers."""
+        jobs = [(f"https://example.com/{number}", tmp_path / f"{number}.pdf") for number in range(10)]
+        with BrowserPool(max_size=3, factory=create_pdf_browser) as pool:
+            results = list(render_pdfs(jobs, concurrency=3, pool=pool))
+            expected_max_size = 3
+            assert pool.size <= expected_max_size
+
+        assert sorted(result.path for result in results if result.path) == sorted(path for _, path in jobs)
+        assert all(result.succeeded and result.attempts == 1 for result in results)
+
+    def test_relative_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the relative path is resolved against the current directory, not the download directory."""
+        monkeypatch.chdir(tmp_path)
+        browser = create_pdf_browser()
+        with BrowserPool(max_size=1, factory=lambda: browser) as pool:
+            (result,) = render_pdfs([("https://example.com/", Path("example.pdf"))], pool=pool)
+
+        assert result.path == tmp_path / "example.pdf"
+        assert result.job.path == tmp_path / "example.pdf"
+        browser.save_as_pdf.assert_called_once_with(tmp_path / "example.pdf", options=None)
+
+    def test_retry(self, tmp_path: Path) -> None:
+        """Test render_pdfs retries the failed job."""
+        browser = create_pdf_browser()
+        browser.driver.get.side_effect = [WebDriverException("net::ERR_CONNECTION_RESET"), None]
+        job = PdfJob("https://example.com/", tmp_path / "example.pdf", {"landscape": True})
+        with BrowserPool(max_size=1, factory=lambda: browser) as pool:
+            (result,) = render_pdfs([job], pool=pool)
+
+        assert result.succeeded
+        expected_attempts = 2
+        assert result.attempts == expected_attempts
+        browser.save_as_pdf.assert_called_once_with(job.path, options={"landscape": True})
+
+    def test_failure(self, tmp_path: Path) -> None:
+        """Test render_pdfs reports the job which fails after retries."""
+        browser = create_pdf_browser()
+        browser.driver.get.side_effect = WebDriverException("net::ERR_NAME_NOT_RESOLVED")
+        job = PdfJob("https://example.invalid/", tmp_path / "example.pdf")
+        with BrowserPool(max_size=1, factory=lambda: browser) as pool:
+            (result,) = render_pdfs([job], retries=1, pool=pool)
+
+        assert not result.succeeded
+        assert result.path is None
+        assert isinstance(result.error, WebDriverException)
+        expected_attempts = 2
+        assert result.attempts == expected_attempts
+
+    def test_real_browser(self, resource_path_root: Path, tmp_path: Path) -> None:
+        """Test render_pdfs with real browsers."""
+        url = f"file://{resource_path_root / 'test_browser/test_browser_save_as_pdf.html'}"
+        jobs = [(url, tmp_path / f"{number}.pdf") for number in range(3)]
+
+        results = list(render_pdfs(jobs, concurrency=2))
+
+        assert all(result.path and result.path.read_bytes().startswith(b"%PDF-") for result in results)
@@ -0,0 +1,33 @@
+"""Tests for blocking.py ."""
+
+from __future__ import annotations
+
+from seleniumlibraries.blocking import ResourceBlocking
+
+
+class TestResourceBlocking:
+    """Test cases for ResourceBlocking class."""
+
+    def test_default(self) -> None:
+        """Test ResourceBlocking blocks all kinds of resources by default."""
+        blocking = ResourceBlocking()
+        patterns = blocking.patterns()
+
+        assert blocking.prefs() == {"profile.managed_default_content_settings.images": 2}
+        assert "*.woff2" in patterns
+        assert "*.woff2?*" in patterns
+        assert "*.mp4" in patterns
+        assert "*://*.google-analytics.com/*" in patterns
+
+    def test_url_patterns_only(self) -> None:
+        """Test ResourceBlocking blocks only the specified URL patterns."""
+        blocking = ResourceBlocking(
+            images=False,
+            fonts=False,
+            media=False,
+            trackers=False,
+            url_patterns=("*/ads/*",),
+        )
+
+        assert blocking.prefs() == {}
+        assert blocking.patterns() == ["*/ads/*"]
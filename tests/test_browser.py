@@ -2,20 +2,63 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import functools
+import tempfile
+import threading
+import time
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import cast
 from unittest.mock import Mock
 from unittest.mock import PropertyMock
 from unittest.mock import patch
 
 import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 
+from seleniumlibraries.blocking import ResourceBlocking
 from seleniumlibraries.browser import Browser
 from seleniumlibraries.browser import DownloadWaiter
+from seleniumlibraries.browser import TabWaiter
+from seleniumlibraries.profiles import save_profile
+from seleniumlibraries.watcher import InotifyWatcher
+from seleniumlibraries.watcher import PollingWatcher
+from tests.conftest import FakeSession
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
 
+    from seleniumlibraries.watcher import DirectoryWatcher
+
+
+class FakeDriver:
+    """Driver whose window handles tests change."""
+
+    def __init__(self, window_handles: list[str]) -> None:
+        self.window_handles = window_handles
+
+
+def create_tab_waiter(driver: FakeDriver, connection: FakeSession) -> TabWaiter:
+    # Reason: Duck typing for test.
+    return TabWaiter(driver, connection)  # type: ignore[arg-type]
+
+
+@pytest.fixture(params=[InotifyWatcher, PollingWatcher])
+def watcher_class(request: pytest.FixtureRequest) -> Generator[type[DirectoryWatcher]]:
+    """Runs the test with each implementation of the watcher."""
+    watcher_class = request.param
+    with patch("seleniumlibraries.watcher.InotifyWatcher", watcher_class):
+        yield watcher_class
+
+
+@pytest.mark.usefixtures("watcher_class")
 class TestDownloadWaiter:
     """Test cases for DownloadWaiter class."""
 
@@ -25,7 +68,6 @@ class TestDownloadWaiter:
         expected_files = 5
         waiter = DownloadWaiter(test_dir, expected_files)
 
-        assert waiter.seconds == 0
         assert waiter.waiting is True
         assert waiter.directory_download == test_dir
         assert waiter.nfiles == expected_files
@@ -35,51 +77,46 @@ class TestDownloadWaiter:
         test_dir = tmp_path
         waiter = DownloadWaiter(test_dir)
 
-        assert waiter.seconds == 0
         assert waiter.waiting is True
         assert waiter.directory_download == test_dir
         assert waiter.nfiles is None
 
-    @patch("time.sleep")
-    def test_download_waiter_wait_timeout(self, mock_sleep: Mock, tmp_path: Path) -> None:
-        """Test DownloadWaiter times out correctly."""
+    def test_download_waiter_wait_timeout(self, tmp_path: Path) -> None:
+        """Test DownloadWaiter times out after the requested seconds."""
         test_dir = tmp_path
         waiter = DownloadWaiter(test_dir)
 
-        waiter.wait(1)
+        timeout = 0.2
+        start = time.monotonic()
+        assert waiter.wait(timeout) == []
 
-        assert waiter.seconds >= 1
-        mock_sleep.assert_called_with(0.5)
+        assert time.monotonic() - start >= timeout
+        assert waiter.waiting is True
 
-    @patch("time.sleep")
-    def test_download_waiter_wait_with_crdownload_file(self, mock_sleep: Mock, tmp_path: Path) -> None:
+    def test_download_waiter_wait_with_crdownload_file(self, tmp_path: Path) -> None:
         """Test DownloadWaiter waits for .crdownload files to finish."""
         test_dir = tmp_path
+        (test_dir / "complete.pdf").touch()
         crdownload_file = test_dir / "test.crdownload"
         crdownload_file.touch()
 
         waiter = DownloadWaiter(test_dir)
-        expected_timeout = 2
-        waiter.wait(expected_timeout)
 
-        assert waiter.seconds >= expected_timeout
-        mock_sleep.assert_called_with(0.5)
+        assert waiter.wait(0.2) == [test_dir / "complete.pdf"]
+        assert waiter.waiting is True
 
-    @patch("time.sleep")
-    def test_download_waiter_wait_for_expected_files(self, mock_sleep: Mock, tmp_path: Path) -> None:
+    def test_download_waiter_wait_for_expected_files(self, tmp_path: Path) -> None:
         """Test DownloadWaiter waits for expected number of files."""
         test_dir = tmp_path
+        (test_dir / "file1.txt").touch()
 
         expected_files = 2
-        expected_timeout = 2
         waiter = DownloadWaiter(test_dir, expected_files)
-        waiter.wait(expected_timeout)
 
-        assert waiter.seconds >= expected_timeout
-        mock_sleep.assert_called_with(0.5)
+        assert waiter.wait(0.2) == [test_dir / "file1.txt"]
+        assert waiter.waiting is True
 
-    @patch("time.sleep")
-    def test_download_waiter_stops_when_conditions_met(self, mock_sleep: Mock, tmp_path: Path) -> None:
+    def test_download_waiter_stops_when_conditions_met(self, tmp_path: Path) -> None:
         """Test DownloadWaiter stops when all conditions are met."""
         test_dir = tmp_path
         # Create expected number of files
@@ -89,12 +126,108 @@ class TestDownloadWaiter:
         expected_files = 2
         max_timeout = 10
         waiter = DownloadWaiter(test_dir, expected_files)
-        waiter.wait(max_timeout)
+        start = time.monotonic()
+
+        assert waiter.wait(max_timeout) == [test_dir / "file1.txt", test_dir / "file2.txt"]
 
         # Should stop quickly since conditions are met
-        assert waiter.seconds < max_timeout
+        assert time.monotonic() - start < 1
         assert waiter.waiting is False
-        mock_sleep.assert_called_with(0.5)
+
+    def test_download_waiter_wakes_up_when_download_completes(
+        self,
+        tmp_path: Path,
+        watcher_class: type[DirectoryWatcher],
+    ) -> None:
+        """Test DownloadWaiter returns soon after .crdownload file is renamed."""
+        test_dir = tmp_path
+        crdownload_file = test_dir / "test.pdf.crdownload"
+        crdownload_file.touch()
+        timer = threading.Timer(0.1, crdownload_file.rename, args=(test_dir / "test.pdf",))
+        timer.start()
+
+        waiter = DownloadWaiter(test_dir)
+        start = time.monotonic()
+
+        assert waiter.wait(10) == [test_dir / "test.pdf"]
+
+        timer.join()
+        assert waiter.waiting is False
+        # The polling watcher may notice the change one interval later.
+        margin = 0.3 if watcher_class is InotifyWatcher else PollingWatcher.INTERVAL + 0.3
+        assert time.monotonic() - start < 0.1 + margin
+
+    def test_download_waiter_wait_async(self, tmp_path: Path, watcher_class: type[DirectoryWatcher]) -> None:
+        """Test DownloadWaiter awaits on the event loop until .crdownload file is renamed."""
+        crdownload_file = tmp_path / "test.pdf.crdownload"
+        crdownload_file.touch()
+
+        async def download() -> list[Path]:
+            asyncio.get_running_loop().call_later(0.1, crdownload_file.rename, tmp_path / "test.pdf")
+            return await DownloadWaiter(tmp_path).wait_async(10)
+
+        start = time.monotonic()
+
+        assert asyncio.run(download()) == [tmp_path / "test.pdf"]
+
+        margin = 0.3 if watcher_class is InotifyWatcher else PollingWatcher.INTERVAL + 0.3
+        assert time.monotonic() - start < 0.1 + margin
+
+
+class TestTabWaiter:
+    """Test cases for TabWaiter class."""
+
+    def test_wait_already_satisfied(self) -> None:
+        """Test wait returns immediately without listening to events when the condition is already met."""
+        connection = FakeSession()
+        waiter = create_tab_waiter(FakeDriver(["handle1"]), connection)
+
+        assert waiter.wait(lambda handles: len(handles) <= 1, 5) == ["handle1"]
+        connection.execute.assert_not_called()
+
+    def test_wait_wakes_up_on_event(self) -> None:
+        """Test wait returns as soon as the target is destroyed."""
+        connection = FakeSession()
+        driver = FakeDriver(["handle1", "handle2"])
+        waiter = create_tab_waiter(driver, connection)
+
+        def close_tab() -> None:
+            driver.window_handles = ["handle1"]
+            connection.emit("Target.targetDestroyed", {"targetId": "handle2"})
+
+        threading.Timer(0.1, close_tab).start()
+        start = time.monotonic()
+
+        assert waiter.wait(lambda handles: len(handles) <= 1, 5) == ["handle1"]
+        assert time.monotonic() - start < TabWaiter.INTERVAL_CHECK
+        connection.execute.assert_called_once_with("Target.setDiscoverTargets", {"discover": True})
+        assert connection.listeners == {}
+
+    def test_wait_timeout(self) -> None:
+        """Test wait returns None at the deadline, not after counting intervals."""
+        connection = FakeSession()
+        waiter = create_tab_waiter(FakeDriver(["handle1", "handle2"]), connection)
+        timeout = 0.2
+        start = time.monotonic()
+
+        assert waiter.wait(lambda handles: len(handles) <= 1, timeout) is None
+        assert timeout <= time.monotonic() - start < timeout + TabWaiter.INTERVAL_CHECK
+        assert connection.listeners == {}
+
+
+@pytest.fixture
+def http_server(tmp_path: Path) -> Generator[str]:
+    """Serves tmp_path over HTTP so that requests go through the network stack, yields the base URL."""
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(tmp_path))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
 
 
 class TestBrowser:
@@ -107,6 +240,31 @@ class TestBrowser:
             assert browser.driver is not None
             assert browser.wait is not None
 
+    def test_resource_blocking(self) -> None:
+        """Test Browser blocks resources and applies page load strategy."""
+        resource_blocking = ResourceBlocking(url_patterns=("*/blocked/*",))
+        with Browser(resource_blocking=resource_blocking, page_load_strategy="eager") as browser:
+            assert browser.driver.capabilities["pageLoadStrategy"] == "eager"
+            browser.driver.get("data:text/html,<img id='image' src='https://example.com/blocked/image.png'>")
+            image = browser.wait_for(By.ID, "image")
+            assert browser.driver.execute_script("return arguments[0].naturalWidth;", image) == 0
+
+    def test_resource_blocking_url_patterns(self, tmp_path: Path, http_server: str) -> None:
+        """Test URL patterns block scripts and XHR, which the content setting of images doesn't cover."""
+        (tmp_path / "blocked").mkdir()
+        (tmp_path / "allowed.js").write_text("window.allowed = true;")
+        (tmp_path / "blocked" / "script.js").write_text("window.blocked = true;")
+        html = "<script src='allowed.js'></script><script src='blocked/script.js'></script>"
+        (tmp_path / "index.html").write_text(html)
+        resource_blocking = ResourceBlocking(images=False, url_patterns=("*/blocked/*",))
+        with Browser(resource_blocking=resource_blocking) as browser:
+            browser.driver.get(f"{http_server}index.html")
+            loaded = browser.driver.execute_script("return [window.allowed === true, window.blocked === true];")
+            assert loaded == [True, False]
+            script = "fetch(arguments[0]).then((r) => arguments[1](r.status), (e) => arguments[1](e.name));"
+            assert browser.driver.execute_async_script(script, f"{http_server}allowed.js") == HTTPStatus.OK
+            assert browser.driver.execute_async_script(script, f"{http_server}blocked/script.js") == "TypeError"
+
     @patch("getpass.getuser")
     def test_browser_raises_error_for_root_user(self, mock_getuser: Mock) -> None:
         """Test Browser raises RuntimeError when run as root."""
@@ -124,9 +282,92 @@ class TestBrowser:
             assert hasattr(browser, "driver")
             assert hasattr(browser, "wait")
 
-    def test_browser_directory_download_constant(self) -> None:
-        """Test Browser has correct download directory."""
-        assert Path("/workspace/downloads") == Browser.DIRECTORY_DOWNLOAD
+    def test_browser_isolated_directories(self) -> None:
+        """Test each Browser has its own directories which are removed on exit."""
+        with Browser() as browser1, Browser() as browser2:
+            assert browser1.directory_download != browser2.directory_download
+            assert browser1.directory_profile != browser2.directory_profile
+            assert browser1.debugger_address != browser2.debugger_address
+            assert browser1.directory_download.is_dir()
+        assert not browser1.directory_download.exists()
+        assert not browser1.directory_profile.exists()
+
+    def test_browser_directory_download_specified(self, tmp_path: Path) -> None:
+        """Test Browser keeps the specified download directory on exit."""
+        with Browser(directory_download=tmp_path) as browser:
+            assert browser.directory_download == tmp_path
+        assert tmp_path.is_dir()
+
+    def test_browser_profile_template(self, tmp_path: Path) -> None:
+        """Test Browser starts from the saved profile with its cookies."""
+        template = tmp_path / "template"
+        cookie = {"name": "session", "value": "secret", "domain": "example.com", "path": "/"}
+        with Browser() as browser:
+            browser.driver.execute_cdp_cmd("Network.setCookie", cookie)
+            browser.save_profile(template)
+
+        with Browser(profile_template=template) as browser:
+            cookies = browser.driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+            assert browser.directory_profile != template
+
+        assert [(cookie["name"], cookie["value"]) for cookie in cookies] == [("session", "secret")]
+
+    @patch("getpass.getuser", Mock(return_value="user"))
+    def test_browser_profile_template_missing(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test Browser removes its temporary directories when failing to copy the profile template."""
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        with patch("seleniumlibraries.browser.Chrome") as chrome, pytest.raises(FileNotFoundError):
+            Browser(profile_template=tmp_path / "missing")
+
+        chrome.assert_not_called()
+        assert list(tmp_path.iterdir()) == []
+
+    @patch("getpass.getuser", Mock(return_value="user"))
+    def test_browser_restore_cookies_failure(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test Browser quits Chrome and removes its temporary directories when failing to restore cookies."""
+        template = tmp_path / "template"
+        (tmp_path / "profile").mkdir()
+        save_profile(tmp_path / "profile", template, [{"name": "session", "value": "secret"}])
+        directory_temporary = tmp_path / "tmp"
+        directory_temporary.mkdir()
+        monkeypatch.setattr(tempfile, "tempdir", str(directory_temporary))
+        with patch("seleniumlibraries.browser.Chrome") as chrome:
+            chrome.return_value.execute_cdp_cmd.side_effect = WebDriverException("Invalid cookie fields")
+            with pytest.raises(WebDriverException):
+                Browser(profile_template=template)
+
+        chrome.return_value.quit.assert_called_once_with()
+        assert list(directory_temporary.iterdir()) == []
+
+    def test_browser_memory_usage(self) -> None:
+        """Test Browser measures memory usage of Chrome."""
+        with Browser() as browser:
+            usage = browser.memory_usage()
+
+        assert usage.rss is None or usage.rss > 0
+        assert 0 < usage.js_heap_used <= usage.js_heap_total
+
+    @pytest.mark.parametrize("html_file", [Path("test_browser/wait_for_test.html")])
+    def test_browser_recycle(self, common_html_loaded_browser: Browser) -> None:
+        """Test Browser restarts Chrome over memory_limit, restoring the URL and cookies."""
+        browser = common_html_loaded_browser
+        cookie = {"name": "session", "value": "secret", "domain": "example.com", "path": "/"}
+        browser.driver.execute_cdp_cmd("Network.setCookie", cookie)
+        url = browser.driver.current_url
+        pid = browser.pid
+        navigations = browser.navigations
+        browser.memory_limit = 0
+        browser.memory_checked -= Browser.INTERVAL_MEMORY_CHECK
+
+        assert browser.recycle() is (pid is not None)
+        if pid is None:
+            return
+        assert browser.pid not in {None, pid}
+        assert browser.driver.current_url == url
+        assert browser.navigations > navigations
+        cookies = browser.driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        assert [(cookie["name"], cookie["value"]) for cookie in cookies] == [("session", "secret")]
+        assert browser.recycle() is False
 
     @pytest.mark.parametrize("html_file", [Path("test_browser/wait_for_test.html")])
     def test_browser_wait_for_with_custom_timeout(self, common_html_loaded_browser: Browser) -> None:
@@ -142,6 +383,42 @@ class TestBrowser:
         assert result is not None
         assert result.get_attribute("id") == "immediate-element"
 
+    @pytest.mark.parametrize("html_file", [Path("test_browser/wait_for_test.html")])
+    @pytest.mark.parametrize("observe", [True, False])
+    def test_browser_wait_for_delayed_element(self, common_html_loaded_browser: Browser, *, observe: bool) -> None:
+        """Test Browser wait_for method waits for the element which appears later."""
+        result = common_html_loaded_browser.wait_for(By.ID, "delayed-element", observe=observe, poll_frequency=0.1)
+        assert result.text == "This element appears after 2 seconds"
+
+    @pytest.mark.parametrize("html_file", [Path("test_browser/wait_for_test.html")])
+    @pytest.mark.parametrize(
+        ("by", "value"),
+        [
+            (By.CSS_SELECTOR, "div#immediate-element"),
+            (By.NAME, "immediate-name"),
+            (By.CLASS_NAME, "immediate-class"),
+            (By.TAG_NAME, "div"),
+            (By.XPATH, "//div[@id='immediate-element']"),
+            (By.LINK_TEXT, "Immediate link"),
+            (By.PARTIAL_LINK_TEXT, "Immediate"),
+        ],
+    )
+    def test_browser_wait_for_locator_strategies(
+        self,
+        common_html_loaded_browser: Browser,
+        by: str,
+        value: str,
+    ) -> None:
+        """Test Browser wait_for method supports all locator strategies when observing."""
+        expected = common_html_loaded_browser.driver.find_element(by, value)
+        assert common_html_loaded_browser.wait_for(by, value) == expected
+
+    @pytest.mark.parametrize("html_file", [Path("test_browser/wait_for_test.html")])
+    def test_browser_wait_for_timeout(self, common_html_loaded_browser: Browser) -> None:
+        """Test Browser wait_for method raises TimeoutException."""
+        with pytest.raises(TimeoutException):
+            common_html_loaded_browser.wait_for(By.ID, "missing-element", timeout=0.5)
+
     def test_scroll_and_click(self, html_loaded_browser: Browser) -> None:
         """Test Browser scroll_and_click method."""
         # Verify button exists and is not initially visible in viewport
@@ -151,48 +428,57 @@ class TestBrowser:
         html_loaded_browser.scroll_and_click(By.ID, "scroll-button")
 
     def test_browser_save_as_pdf_with_default_options(self, tmp_path: Path) -> None:
-        """Test Browser save_as_pdf method with default options."""
-        with Browser() as browser:
-            mock_pdf_data = base64.b64encode(b"fake pdf content").decode()
+        """Test Browser save_as_pdf method reads the stream in chunks with default options."""
+        with Browser(directory_download=tmp_path) as browser:
+            chunks = [b"fake pdf ", b"content"]
+            responses: dict[str, list[dict[str, object]]] = {
+                "Page.printToPDF": [{"stream": "stream-1"}],
+                "IO.read": [
+                    {"base64Encoded": True, "data": base64.b64encode(chunks[0]).decode(), "eof": False},
+                    {"base64Encoded": True, "data": base64.b64encode(chunks[1]).decode(), "eof": True},
+                ],
+                "IO.close": [{}],
+            }
             # Reason: To setup mock
-            browser.driver.execute_cdp_cmd = Mock(return_value={"data": mock_pdf_data})  # type: ignore[method-assign]
+            browser.driver.execute_cdp_cmd = Mock(  # type: ignore[method-assign]
+                side_effect=lambda cmd, _cmd_args: responses[cmd].pop(0),
+            )
 
-            # Temporarily change the download directory for testing
-            original_dir = Browser.DIRECTORY_DOWNLOAD
-            Browser.DIRECTORY_DOWNLOAD = tmp_path
+            test_path = Path("test.pdf")
+            assert browser.save_as_pdf(test_path) == tmp_path / test_path
 
-            try:
-                test_path = Path("test.pdf")
-                browser.save_as_pdf(test_path)
+            browser.driver.execute_cdp_cmd.assert_any_call("Page.printToPDF", {"transferMode": "ReturnAsStream"})
+            browser.driver.execute_cdp_cmd.assert_any_call(
+                "IO.read",
+                {"handle": "stream-1", "size": Browser.SIZE_CHUNK},
+            )
+            browser.driver.execute_cdp_cmd.assert_called_with("IO.close", {"handle": "stream-1"})
 
-                browser.driver.execute_cdp_cmd.assert_called_with("Page.printToPDF", {})
-
-                # Check file was written
-                written_file = tmp_path / test_path
-                assert written_file.exists()
-                assert written_file.read_bytes() == b"fake pdf content"
-            finally:
-                Browser.DIRECTORY_DOWNLOAD = original_dir
+            # Check file was written
+            written_file = tmp_path / test_path
+            assert written_file.exists()
+            assert written_file.read_bytes() == b"fake pdf content"
 
     def test_browser_save_as_pdf_with_custom_options(self, tmp_path: Path) -> None:
         """Test Browser save_as_pdf method with custom options."""
-        with Browser() as browser:
+        with Browser(directory_download=tmp_path) as browser:
             mock_pdf_data = base64.b64encode(b"fake pdf content").decode()
             # Reason: To setup mock
             browser.driver.execute_cdp_cmd = Mock(return_value={"data": mock_pdf_data})  # type: ignore[method-assign]
 
-            custom_options = {"landscape": True, "paperFormat": "A4"}
+            custom_options = {"landscape": True, "paperFormat": "A4", "transferMode": "ReturnAsBase64"}
 
-            original_dir = Browser.DIRECTORY_DOWNLOAD
-            Browser.DIRECTORY_DOWNLOAD = tmp_path
+            test_path = tmp_path / "absolute" / "test_custom.pdf"
+            test_path.parent.mkdir()
+            browser.save_as_pdf(test_path, options=custom_options)
 
-            try:
-                test_path = Path("test_custom.pdf")
-                browser.save_as_pdf(test_path, options=custom_options)
+            browser.driver.execute_cdp_cmd.assert_called_with("Page.printToPDF", custom_options)
+            assert test_path.read_bytes() == b"fake pdf content"
 
-                browser.driver.execute_cdp_cmd.assert_called_with("Page.printToPDF", custom_options)
-            finally:
-                Browser.DIRECTORY_DOWNLOAD = original_dir
+    def test_browser_save_as_pdf(self, html_loaded_browser: Browser, tmp_path: Path) -> None:
+        """Test Browser save_as_pdf method saves the real PDF."""
+        path = html_loaded_browser.save_as_pdf(tmp_path / "test.pdf")
+        assert path.read_bytes().startswith(b"%PDF-")
 
     def test_browser_wait_for_download(self, mock_download_waiter: DownloadWaiter) -> None:
         """Test Browser wait_for_download method."""
@@ -203,7 +489,7 @@ class TestBrowser:
             timeout = 30
             browser.wait_for_download(timeout, expected_files)
 
-            mock_waiter_class.assert_called_with(Browser.DIRECTORY_DOWNLOAD, expected_files)
+            mock_waiter_class.assert_called_with(browser.directory_download, expected_files)
             cast("Mock", mock_download_waiter.wait).assert_called_with(timeout)
 
     def test_browser_wait_for_download_without_file_count(self, mock_download_waiter: DownloadWaiter) -> None:
@@ -214,11 +500,10 @@ class TestBrowser:
             timeout = 30
             browser.wait_for_download(timeout)
 
-            mock_waiter_class.assert_called_with(Browser.DIRECTORY_DOWNLOAD, None)
+            mock_waiter_class.assert_called_with(browser.directory_download, None)
             cast("Mock", mock_download_waiter.wait).assert_called_with(timeout)
 
-    @patch("time.sleep")
-    def test_browser_wait_for_closing_tab_success(self, mock_sleep: Mock) -> None:
+    def test_browser_wait_for_closing_tab_success(self) -> None:
         """Test Browser wait_for_closing_tab method when tab closes successfully."""
         with Browser() as browser:
             # Mock window_handles as a PropertyMock that can change values
@@ -229,20 +514,14 @@ class TestBrowser:
 
             with patch.object(type(browser.driver), "window_handles", new_callable=PropertyMock) as mock_handles:
                 mock_handles.side_effect = side_effect
-                mock_sleep.side_effect = lambda _: None
+                start = time.monotonic()
 
                 browser.wait_for_closing_tab(1, 5)
 
-                mock_sleep.assert_called_with(0.5)
+                assert time.monotonic() - start < TabWaiter.INTERVAL_CHECK
 
-    def test_browser_wait_for_closing_tab_calls_close_at_timeout(self) -> None:
-        """Test that wait_for_closing_tab calls driver.close() when seconds equals timeout."""
-        # Test removed - timing behavior complexity not worth the coverage effort.
-        # Method is functionally tested in other test cases.
-
-    @patch("time.sleep")
-    def test_browser_wait_for_closing_tab_timeout_error(self, mock_sleep: Mock) -> None:
-        """Test Browser wait_for_closing_tab method raises TimeoutError."""
+    def test_browser_wait_for_closing_tab_timeout_error(self) -> None:
+        """Test Browser wait_for_closing_tab method closes the tab at timeout, then raises TimeoutError."""
         with Browser() as browser:
             # Reason: To setup mock
             browser.driver.close = Mock()  # type: ignore[method-assign]
@@ -250,9 +529,22 @@ class TestBrowser:
             # Mock window_handles to always return 2 handles (never closes)
             with patch.object(type(browser.driver), "window_handles", new_callable=PropertyMock) as mock_handles:
                 mock_handles.return_value = ["handle1", "handle2"]
-                mock_sleep.side_effect = lambda _: None
 
                 with pytest.raises(TimeoutError) as exc_info:
-                    browser.wait_for_closing_tab(1, 1)
+                    browser.wait_for_closing_tab(1, 0.1)
 
                 assert "Timeout waiting for closing tab." in str(exc_info.value)
+                browser.driver.close.assert_called_once_with()
+
+    def test_browser_wait_for_new_tab(self) -> None:
+        """Test Browser wait_for_new_tab method returns the handle of the tab opened by the page."""
+        with Browser() as browser:
+            known_handles = browser.driver.window_handles
+            browser.driver.execute_script("window.open('about:blank')")
+
+            handle = browser.wait_for_new_tab(known_handles, 5)
+
+            assert handle not in known_handles
+            assert handle in browser.driver.window_handles
+            with pytest.raises(TimeoutError, match="Timeout waiting for new tab"):
+                browser.wait_for_new_tab(browser.driver.window_handles, 0.1)
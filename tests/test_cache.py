@@ -0,0 +1,202 @@
+"""Tests for cache.py ."""
+
+from __future__ import annotations
+
+import base64
+from typing import TYPE_CHECKING
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from seleniumlibraries.cache import CachedResponse
+from seleniumlibraries.cache import HttpCache
+from seleniumlibraries.cache import HttpCacheInterceptor
+from tests.conftest import FakeSession
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from seleniumlibraries.devtools import Message
+
+URL = "https://example.com/"
+HEADERS = [{"name": "Content-Type", "value": "text/html"}]
+
+
+class FetchSession(FakeSession):
+    """Session which responds bodies of paused responses."""
+
+    def respond(self, method: str, _params: Message | None = None) -> Message:
+        if method == "Fetch.getResponseBody":
+            return {"body": base64.b64encode(b"<html></html>").decode(), "base64Encoded": True}
+        return {}
+
+    def emit_request(self, request_id: str, **kwargs: Any) -> None:  # noqa: ANN401
+        self.emit("Fetch.requestPaused", {"requestId": request_id, "request": {"url": URL, "method": "GET"}, **kwargs})
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> HttpCache:
+    return HttpCache(tmp_path)
+
+
+@pytest.fixture
+def session() -> FetchSession:
+    return FetchSession()
+
+
+def create_interceptor(session: FetchSession, cache: HttpCache, mode: str) -> HttpCacheInterceptor:
+    # Reason: Duck typing for test.
+    return HttpCacheInterceptor(session, cache, mode)  # type: ignore[arg-type]
+
+
+class TestHttpCache:
+    """Test cases for HttpCache class."""
+
+    def test_get(self, cache: HttpCache) -> None:
+        """Test get returns the stored response only for the same request."""
+        cache.put("POST", URL, b"a=1", CachedResponse(200, HEADERS, b"body"))
+
+        assert cache.get("POST", URL, b"a=1") == CachedResponse(200, HEADERS, b"body")
+        assert cache.get("POST", URL, b"a=2") is None
+        assert cache.get("GET", URL) is None
+
+    def test_persistence(self, cache: HttpCache, tmp_path: Path) -> None:
+        """Test responses are kept across instances."""
+        cache.put("GET", URL, None, CachedResponse(200, HEADERS, b"body"))
+        cache.save()
+
+        assert HttpCache(tmp_path).get("GET", URL) == CachedResponse(200, HEADERS, b"body")
+
+    def test_journal(self, cache: HttpCache, tmp_path: Path) -> None:
+        """Test put appends to the journal without rewriting the index, and save merges the journal."""
+        cache.put("GET", f"{URL}1", None, CachedResponse(200, HEADERS, b"1"))
+        cache.put("GET", f"{URL}2", None, CachedResponse(200, HEADERS, b"2"))
+
+        assert not (tmp_path / HttpCache.NAME_INDEX).exists()
+        with (tmp_path / HttpCache.NAME_JOURNAL).open("a", encoding="utf-8") as file:
+            file.write('["interrupted", {"meth')
+        assert HttpCache(tmp_path).get("GET", f"{URL}2") == CachedResponse(200, HEADERS, b"2")
+        cache.save()
+
+        assert not (tmp_path / HttpCache.NAME_JOURNAL).exists()
+        assert HttpCache(tmp_path).get("GET", f"{URL}1") == CachedResponse(200, HEADERS, b"1")
+
+    def test_evict(self, tmp_path: Path) -> None:
+        """Test the least recently used response is evicted when exceeding max_bytes."""
+        cache = HttpCache(tmp_path, max_bytes=10)
+        cache.put("GET", f"{URL}1", None, CachedResponse(200, [], b"1234"))
+        cache.put("GET", f"{URL}2", None, CachedResponse(200, [], b"1234"))
+        cache.get("GET", f"{URL}1")
+        cache.put("GET", f"{URL}3", None, CachedResponse(200, [], b"1234"))
+
+        assert cache.get("GET", f"{URL}1") is not None
+        assert cache.get("GET", f"{URL}2") is None
+        assert cache.get("GET", f"{URL}3") is not None
+        assert not (tmp_path / cache.create_key("GET", f"{URL}2")).exists()
+        assert HttpCache(tmp_path).get("GET", f"{URL}2") is None
+
+
+class TestHttpCacheInterceptor:
+    """Test cases for HttpCacheInterceptor class."""
+
+    def test_record(self, session: FetchSession, cache: HttpCache) -> None:
+        """Test responses are recorded without encoding headers."""
+        with create_interceptor(session, cache, "record"):
+            session.emit_request("1")
+            session.emit_request(
+                "1",
+                responseStatusCode=200,
+                responseHeaders=[*HEADERS, {"name": "Content-Encoding", "value": "gzip"}],
+            )
+
+        assert cache.get("GET", URL) == CachedResponse(200, HEADERS, b"<html></html>")
+        session.execute.assert_any_call("Fetch.continueRequest", {"requestId": "1"})
+        assert "Fetch.requestPaused" not in session.listeners
+
+    def test_record_failure(self, session: FetchSession, cache: HttpCache) -> None:
+        """Test the request is continued even when failing to get the body."""
+
+        def respond(method: str, _params: Message | None = None) -> Message:
+            if method == "Fetch.getResponseBody":
+                msg = "No resource with given identifier found"
+                raise WebDriverException(msg)
+            return {}
+
+        session.execute.side_effect = respond
+        with create_interceptor(session, cache, "record"):
+            session.emit_request("1", responseStatusCode=200, responseHeaders=HEADERS)
+
+        assert cache.get("GET", URL) is None
+        session.execute.assert_any_call("Fetch.continueRequest", {"requestId": "1"})
+
+    @pytest.mark.parametrize(
+        ("mode", "method", "params"),
+        [
+            ("auto", "Fetch.continueRequest", {"requestId": "1"}),
+            ("replay", "Fetch.failRequest", {"requestId": "1", "errorReason": "InternetDisconnected"}),
+        ],
+    )
+    def test_replay_failure(
+        self,
+        session: FetchSession,
+        cache: HttpCache,
+        mode: str,
+        method: str,
+        params: Message,
+    ) -> None:
+        """Test the request is continued, or failed in replay mode, even when failing to read the cache."""
+        interceptor = create_interceptor(session, cache, mode)
+        with patch.object(cache, "get", side_effect=OSError("Input/output error")), interceptor:
+            session.emit_request("1")
+
+        session.execute.assert_any_call(method, params)
+
+    def test_replay(self, session: FetchSession, cache: HttpCache) -> None:
+        """Test recorded responses are fulfilled without network."""
+        cache.put("GET", URL, None, CachedResponse(200, HEADERS, b"<html></html>"))
+        with create_interceptor(session, cache, "replay"):
+            session.emit_request("1")
+
+        session.execute.assert_any_call(
+            "Fetch.fulfillRequest",
+            {
+                "requestId": "1",
+                "responseCode": 200,
+                "responseHeaders": HEADERS,
+                "body": base64.b64encode(b"<html></html>").decode(),
+            },
+        )
+
+    def test_replay_miss(self, session: FetchSession, cache: HttpCache) -> None:
+        """Test requests which aren't recorded fail in replay mode."""
+        with create_interceptor(session, cache, "replay"):
+            session.emit_request("1")
+
+        session.execute.assert_any_call(
+            "Fetch.failRequest",
+            {"requestId": "1", "errorReason": "InternetDisconnected"},
+        )
+
+    def test_auto(self, session: FetchSession, cache: HttpCache) -> None:
+        """Test the missed response is loaded and recorded, then replayed."""
+        with create_interceptor(session, cache, "auto"):
+            session.emit_request("1")
+            session.emit_request("1", responseStatusCode=200, responseHeaders=HEADERS)
+            session.emit_request("2")
+
+        methods = [call.args[0] for call in session.execute.call_args_list]
+        assert methods == [
+            "Fetch.enable",
+            "Fetch.continueRequest",
+            "Fetch.getResponseBody",
+            "Fetch.continueRequest",
+            "Fetch.fulfillRequest",
+            "Fetch.disable",
+        ]
+
+    def test_unsupported_mode(self, session: FetchSession, cache: HttpCache) -> None:
+        """Test unsupported mode is rejected."""
+        with pytest.raises(ValueError, match="Unsupported mode"):
+            create_interceptor(session, cache, "offline")
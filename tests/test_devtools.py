@@ -0,0 +1,66 @@
+"""Tests for devtools.py ."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from seleniumlibraries.devtools import DevToolsConnection
+from seleniumlibraries.instrumentation import Instrumentation
+from seleniumlibraries.instrumentation import Measurement
+
+if TYPE_CHECKING:
+    from seleniumlibraries.browser import Browser
+    from seleniumlibraries.devtools import Message
+
+
+class TestDevToolsConnection:
+    """Test cases for DevToolsConnection class."""
+
+    def test_execute(self, fixture_browser: Browser) -> None:
+        """Test DevToolsConnection executes commands of the browser target."""
+        result = fixture_browser.devtools.execute("Browser.getVersion")
+        assert "Chrome" in result["product"]
+
+    def test_instrumentation(self) -> None:
+        """Test DevToolsConnection measures commands when instrumentation is provided."""
+        measurements: list[Measurement] = []
+        # Reason: To skip connecting to Chrome.
+        connection = DevToolsConnection.__new__(DevToolsConnection)
+        connection.instrumentation = Instrumentation(hooks=[measurements.append])
+        # Reason: To skip sending commands to Chrome.
+        connection._execute = Mock(  # type: ignore[method-assign]  # noqa: SLF001
+            side_effect=[{"data": "JVBERi0="}, WebDriverException("Unknown.method: 'Unknown.method' wasn't found")],
+        )
+
+        assert connection.execute("Page.printToPDF") == {"data": "JVBERi0="}
+        with pytest.raises(WebDriverException):
+            connection.execute("Unknown.method")
+
+        assert [(item.operation, item.size, item.failed) for item in measurements] == [
+            ("devtools.Page.printToPDF", 8, False),
+            ("devtools.Unknown.method", 0, True),
+        ]
+
+    def test_execute_error(self, fixture_browser: Browser) -> None:
+        """Test DevToolsConnection raises WebDriverException when the command fails."""
+        with pytest.raises(WebDriverException, match=r"Unknown\.method"):
+            fixture_browser.devtools.execute("Unknown.method")
+
+    def test_session_events(self, fixture_browser: Browser) -> None:
+        """Test DevToolsSession receives events of the attached tab."""
+        session = fixture_browser.devtools.attach(fixture_browser.driver.current_window_handle)
+        fired = threading.Event()
+
+        def listener(_params: Message) -> None:
+            fired.set()
+
+        session.add_listener("Page.loadEventFired", listener)
+        session.execute("Page.enable")
+        fixture_browser.driver.get("about:blank")
+        assert fired.wait(10)
+        session.remove_listener("Page.loadEventFired", listener)
@@ -0,0 +1,115 @@
+"""Tests for download.py ."""
+
+from __future__ import annotations
+
+from concurrent.futures import CancelledError
+from typing import TYPE_CHECKING
+
+import pytest
+
+from seleniumlibraries.download import DownloadTracker
+from tests.conftest import FakeSession
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class DownloadConnection(FakeSession):
+    """Connection which lets tests emit events of downloads."""
+
+    def emit_will_begin(self, guid: str, suggested_filename: str) -> None:
+        self.emit(
+            "Browser.downloadWillBegin",
+            {
+                "guid": guid,
+                "url": f"https://example.com/{suggested_filename}",
+                "suggestedFilename": suggested_filename,
+            },
+        )
+
+    def emit_progress(self, guid: str, received_bytes: int, state: str) -> None:
+        self.emit(
+            "Browser.downloadProgress",
+            {"guid": guid, "totalBytes": 10, "receivedBytes": received_bytes, "state": state},
+        )
+
+
+@pytest.fixture
+def connection() -> DownloadConnection:
+    return DownloadConnection()
+
+
+@pytest.fixture
+def tracker(connection: DownloadConnection, tmp_path: Path) -> DownloadTracker:
+    # Reason: Duck typing for test.
+    return DownloadTracker(connection, tmp_path)  # type: ignore[arg-type]
+
+
+class TestDownloadTracker:
+    """Test cases for DownloadTracker class."""
+
+    def test_start_and_stop(self, tracker: DownloadTracker, connection: DownloadConnection, tmp_path: Path) -> None:
+        """Test DownloadTracker enables events of downloads while tracking."""
+        with tracker:
+            connection.execute.assert_called_with(
+                "Browser.setDownloadBehavior",
+                {"behavior": "allowAndName", "downloadPath": str(tmp_path), "eventsEnabled": True},
+            )
+            assert set(connection.listeners) == {"Browser.downloadWillBegin", "Browser.downloadProgress"}
+        connection.execute.assert_called_with(
+            "Browser.setDownloadBehavior",
+            {"behavior": "allow", "downloadPath": str(tmp_path), "eventsEnabled": False},
+        )
+        assert connection.listeners == {}
+
+    def test_completed(self, tracker: DownloadTracker, connection: DownloadConnection, tmp_path: Path) -> None:
+        """Test DownloadTracker resolves the download with the file renamed to the suggested filename."""
+        with tracker:
+            connection.emit_will_begin("guid-1", "report.pdf")
+            download = tracker.wait_for_begin(timeout=0)
+            assert download.guid == "guid-1"
+            assert download.suggested_filename == "report.pdf"
+
+            received_bytes = 5
+            connection.emit_progress("guid-1", received_bytes, "inProgress")
+            assert download.received_bytes == received_bytes
+            assert not download.future.done()
+
+            (tmp_path / "guid-1").write_bytes(b"0123456789")
+            connection.emit_progress("guid-1", 10, "completed")
+            assert download.state == "completed"
+            assert download.wait(timeout=0) == tmp_path / "report.pdf"
+            assert (tmp_path / "report.pdf").read_bytes() == b"0123456789"
+
+    def test_same_filename(self, tracker: DownloadTracker, connection: DownloadConnection, tmp_path: Path) -> None:
+        """Test DownloadTracker keeps concurrent downloads of the same filename apart."""
+        with tracker:
+            connection.emit_will_begin("guid-1", "report.pdf")
+            connection.emit_will_begin("guid-2", "report.pdf")
+            (tmp_path / "guid-1").touch()
+            (tmp_path / "guid-2").touch()
+            connection.emit_progress("guid-2", 10, "completed")
+            connection.emit_progress("guid-1", 10, "completed")
+            assert tracker.wait_all(timeout=0) == [tmp_path / "report (1).pdf", tmp_path / "report.pdf"]
+
+    def test_rename_failure(self, tracker: DownloadTracker, connection: DownloadConnection, tmp_path: Path) -> None:
+        """Test the error of renaming is raised from wait instead of blocking forever."""
+        with tracker:
+            connection.emit_will_begin("guid-1", "report.pdf")
+            connection.emit_progress("guid-1", 10, "completed")
+            with pytest.raises(FileNotFoundError):
+                tracker.wait_for_begin(timeout=0).wait()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_canceled(self, tracker: DownloadTracker, connection: DownloadConnection) -> None:
+        """Test DownloadTracker cancels the future of the canceled download."""
+        with tracker:
+            connection.emit_will_begin("guid-1", "report.pdf")
+            connection.emit_progress("guid-1", 0, "canceled")
+            with pytest.raises(CancelledError):
+                tracker.wait_for_begin(timeout=0).wait(timeout=0)
+
+    def test_wait_for_begin_timeout(self, tracker: DownloadTracker) -> None:
+        """Test DownloadTracker raises TimeoutError when no download begins."""
+        with tracker, pytest.raises(TimeoutError):
+            tracker.wait_for_begin(timeout=0.1)
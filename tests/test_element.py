@@ -3,16 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
+from unittest.mock import Mock
 
 import pytest
 from selenium.webdriver.common.by import By
 
 from seleniumlibraries.element import get_text
+from seleniumlibraries.element import get_texts
 
 if TYPE_CHECKING:
-    from unittest.mock import Mock
-
     from seleniumlibraries.browser import Browser
 
 
@@ -121,3 +122,36 @@ class TestGetText:
         # Test nested text
         nested_element = browser.driver.find_element(By.ID, "nested-text")
         assert get_text(nested_element) == "Inner Text"
+
+
+class TestGetTexts:
+    """Test cases for get_texts function."""
+
+    def test_empty(self) -> None:
+        """Test get_texts returns empty list without round trip."""
+        assert get_texts([]) == []
+
+    def test_one_round_trip(self) -> None:
+        """Test get_texts executes one script for all elements."""
+        driver = Mock()
+        driver.execute_script.return_value = ["a", "b"]
+        elements = [SimpleNamespace(parent=driver), SimpleNamespace(parent=driver)]
+
+        # Reason: Duck typing for test.
+        assert get_texts(elements) == ["a", "b"]  # type: ignore[arg-type]
+
+        driver.execute_script.assert_called_once()
+        assert driver.execute_script.call_args.args[1] == elements
+
+    def test(self, html_loaded_browser: Browser) -> None:
+        """Test get_texts returns the same texts as get_text."""
+        elements = html_loaded_browser.driver.find_elements(By.TAG_NAME, "div")
+
+        assert get_texts(elements) == [get_text(element) for element in elements]
+        assert html_loaded_browser.get_texts(By.TAG_NAME, "div") == [get_text(element) for element in elements]
+
+    def test_parity(self, html_loaded_browser: Browser) -> None:
+        """Test get_texts matches get_text on spaces, line breaks and elements which WebDriver treats as hidden."""
+        elements = html_loaded_browser.driver.find_elements(By.TAG_NAME, "div")
+
+        assert get_texts(elements) == [get_text(element) for element in elements]
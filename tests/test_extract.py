@@ -0,0 +1,83 @@
+"""Tests for extract.py ."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from seleniumlibraries.extract import Column
+from seleniumlibraries.extract import extract_rows
+from seleniumlibraries.extract import iter_rows
+
+if TYPE_CHECKING:
+    from seleniumlibraries.browser import Browser
+
+
+def create_container(rows: list[list[Any]]) -> Any:  # noqa: ANN401
+    """Creates the container whose script returns the slice of rows."""
+
+    def execute_script(_script: str, *arguments: Any) -> list[list[Any]]:  # noqa: ANN401
+        offset, limit = arguments[-2:]
+        return rows[offset:] if limit is None else rows[offset : offset + limit]
+
+    return SimpleNamespace(parent=SimpleNamespace(execute_script=Mock(side_effect=execute_script)))
+
+
+class TestIterRows:
+    """Test cases for iter_rows function."""
+
+    def test_chunks(self) -> None:
+        """Test iter_rows takes one round trip per chunk."""
+        container = create_container([["1"], ["2"], ["3"], ["4"], ["5"]])
+
+        chunks = list(iter_rows(container, "tr", ["td"], chunk_size=2))
+
+        assert chunks == [[("1",), ("2",)], [("3",), ("4",)], [("5",)]]
+        expected_call_count = 3
+        assert container.parent.execute_script.call_count == expected_call_count
+
+    def test_empty(self) -> None:
+        """Test iter_rows yields nothing for empty table."""
+        assert list(iter_rows(create_container([]), "tr", ["td"])) == []
+
+    @pytest.mark.parametrize("chunk_size", [0, -1])
+    def test_invalid_chunk_size(self, chunk_size: int) -> None:
+        """Test iter_rows rejects chunk sizes which would never advance."""
+        container = create_container([["1"]])
+
+        with pytest.raises(ValueError, match="Invalid chunk size"):
+            next(iter_rows(container, "tr", ["td"], chunk_size=chunk_size))
+
+        container.parent.execute_script.assert_not_called()
+
+
+@pytest.mark.parametrize("html_file", [Path("test_extract/table.html")])
+class TestExtractRows:
+    """Test cases for extract_rows function."""
+
+    def test_dicts(self, common_html_loaded_browser: Browser) -> None:
+        """Test extract_rows returns dicts when columns is a mapping."""
+        container = common_html_loaded_browser.wait_for(By.ID, "orders")
+
+        rows = extract_rows(
+            container,
+            "tbody > tr",
+            {"date": "td:nth-child(1)", "amount": "td:nth-child(2)", "link": Column("a", "href")},
+        )
+
+        assert rows[0] == {"date": "2025-01-01", "amount": "100", "link": "file:///orders/1"}
+        assert rows[2] == {"date": "2025-01-03", "amount": "300", "link": None}
+
+    def test_tuples(self, common_html_loaded_browser: Browser) -> None:
+        """Test extract_rows returns tuples when columns is a sequence."""
+        container = common_html_loaded_browser.wait_for(By.ID, "orders")
+
+        rows = extract_rows(container, "tbody > tr", ["td:nth-child(2)", Column("a", "href")])
+
+        assert rows == [("100", "file:///orders/1"), ("200", "file:///orders/2"), ("300", None)]
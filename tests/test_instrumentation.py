@@ -0,0 +1,126 @@
+"""Tests for instrumentation.py ."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from seleniumlibraries.instrumentation import Instrumentation
+from seleniumlibraries.instrumentation import Measurement
+from seleniumlibraries.instrumentation import Statistics
+from seleniumlibraries.instrumentation import measured
+from seleniumlibraries.page import WebPage
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class Component:
+    """Object with instrumentation like Browser."""
+
+    def __init__(self, instrumentation: Instrumentation | None) -> None:
+        self.instrumentation = instrumentation
+        self.driver = MagicMock()
+
+    @measured("Component.run")
+    def run(self, value: int) -> int:
+        self.driver.execute("get", {"url": "https://example.com/"})
+        return value
+
+
+class ExamplePage(WebPage):
+    """Page which runs the component."""
+
+    def open(self, component: Component) -> int:
+        return component.run(1)
+
+
+class TestInstrumentation:
+    """Test cases for Instrumentation class."""
+
+    def test_wrap_driver(self) -> None:
+        """Test commands of WebDriver are recorded with sizes of responses, and hooks receive them."""
+        measurements: list[Measurement] = []
+        instrumentation = Instrumentation(hooks=[measurements.append])
+        driver = MagicMock()
+        driver.execute.side_effect = [
+            {"value": {"data": "JVBERi0=", "stream": None}},
+            WebDriverException("no such element"),
+        ]
+        instrumentation.wrap_driver(driver)
+
+        driver.execute("executeCdpCommand", {"cmd": "Page.printToPDF", "params": {}})
+        with pytest.raises(WebDriverException):
+            driver.execute("findElement", {"using": "css selector", "value": "#missing"})
+
+        assert [(item.operation, item.page, item.size, item.failed) for item in measurements] == [
+            ("cdp.Page.printToPDF", None, 8, False),
+            ("driver.findElement", None, 0, True),
+        ]
+
+    def test_measured(self) -> None:
+        """Test the decorated method is measured only when the instance has instrumentation."""
+        instrumentation = Instrumentation()
+        expected = 3
+
+        assert Component(None).run(expected) == expected
+        assert Component(instrumentation).run(expected) == expected
+
+        summary = instrumentation.summary()
+        assert list(summary["operations"]) == ["Component.run"]
+        assert summary["operations"]["Component.run"]["count"] == 1
+
+    def test_page(self) -> None:
+        """Test operations in methods of WebPage subclass are attributed to the subclass."""
+        instrumentation = Instrumentation()
+        component = Component(instrumentation)
+        page = ExamplePage(MagicMock())
+
+        page.open(component)
+        component.run(1)
+
+        pages = instrumentation.summary()["pages"]
+        assert pages["ExamplePage"]["Component.run"]["count"] == 1
+        assert pages[""]["Component.run"]["count"] == 1
+        assert ExamplePage.open.__name__ == "open"
+
+    def test_summary(self, tmp_path: Path) -> None:
+        """Test summary aggregates percentiles by nearest-rank method, and dump writes it as JSON."""
+        instrumentation = Instrumentation()
+        for number in range(1, 101):
+            instrumentation.record("driver.get", number / 100, size=10, failed=number == 1)
+
+        path = tmp_path / "summary.json"
+        instrumentation.dump(path)
+
+        stats: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))["operations"]["driver.get"]
+        assert stats == {
+            "count": 100,
+            "failures": 1,
+            "total": pytest.approx(50.5),
+            "min": 0.01,
+            "max": 1.0,
+            "p50": 0.5,
+            "p95": 0.95,
+            "p99": 0.99,
+            "size": 1000,
+        }
+
+    def test_bounded(self) -> None:
+        """Test memory stays bounded while counts and extremes stay exact."""
+        instrumentation = Instrumentation()
+        count = Statistics.SIZE_RESERVOIR * 4
+        for number in range(count):
+            instrumentation.record("driver.get", number / count)
+
+        statistics = instrumentation.operations["driver.get"]
+        assert len(statistics.samples) == Statistics.SIZE_RESERVOIR
+        stats = instrumentation.summary()["operations"]["driver.get"]
+        assert stats["count"] == count
+        assert (stats["min"], stats["max"]) == (0, (count - 1) / count)
+        assert stats["p50"] == pytest.approx(0.5, abs=0.1)
@@ -0,0 +1,135 @@
+"""Tests for interaction.py ."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import ElementClickInterceptedException
+from selenium.common.exceptions import JavascriptException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+from seleniumlibraries.interaction import ERROR_SKIPPED
+from seleniumlibraries.interaction import Step
+from seleniumlibraries.interaction import run_steps
+
+if TYPE_CHECKING:
+    from seleniumlibraries.browser import Browser
+
+STEPS = [
+    Step.fill(By.ID, "name", "Alice"),
+    Step.select(By.ID, "plan", "Pro"),
+    Step.click(By.ID, "agree"),
+    Step.click(By.ID, "submit", trusted=False),
+]
+
+
+class TestRunSteps:
+    """Test cases for run_steps function."""
+
+    def test_run(self) -> None:
+        """Test steps run in one script, then the script continues after the click through W3C Actions."""
+        driver = MagicMock()
+        driver.execute_async_script.side_effect = [
+            {"errors": [None, None], "element": MagicMock(spec=WebElement)},
+            {"errors": [None], "element": None},
+        ]
+
+        results = run_steps(driver, STEPS, timeout=10)
+
+        assert [result.step for result in results] == STEPS
+        assert all(result.succeeded for result in results)
+        first, second = driver.execute_async_script.call_args_list
+        assert first.args[1] == [list(step) for step in STEPS]
+        assert second.args[1] == [["dispatch_click", By.ID, "submit", None]]
+        (call,) = driver.execute.call_args_list
+        assert call.args[0] == Command.W3C_ACTIONS
+
+    def test_failure(self) -> None:
+        """Test the failed step reports its error and the following steps are skipped."""
+        driver = MagicMock()
+        driver.execute_async_script.return_value = {
+            "errors": [None, "Error: No option to select: Pro"],
+            "element": None,
+        }
+
+        results = run_steps(driver, STEPS, timeout=10)
+
+        assert [result.error for result in results] == [None, "Error: No option to select: Pro", *[ERROR_SKIPPED] * 2]
+        driver.execute_async_script.assert_called_once()
+
+    def test_click_failure(self) -> None:
+        """Test the error of W3C Actions is reported as the error of the click."""
+        driver = MagicMock()
+        driver.execute_async_script.return_value = {"errors": [None, None], "element": MagicMock(spec=WebElement)}
+        driver.execute.side_effect = ElementClickInterceptedException("Other element would receive the click")
+
+        results = run_steps(driver, STEPS, timeout=10)
+
+        assert [result.error for result in results[:2]] == [None, None]
+        assert str(results[2].error).startswith("ElementClickInterceptedException: Other element would receive")
+        assert results[3].error == ERROR_SKIPPED
+
+    def test_script_failure(self) -> None:
+        """Test the error of the script is reported as the error of its first step and the results are kept."""
+        driver = MagicMock()
+        driver.execute_async_script.side_effect = [
+            {"errors": [None, None], "element": MagicMock(spec=WebElement)},
+            JavascriptException("javascript error: document unloaded while waiting for result"),
+        ]
+        steps = [*STEPS[:3], Step.fill(By.ID, "name", "Bob"), STEPS[3]]
+
+        results = run_steps(driver, steps, timeout=10)
+
+        assert [result.error for result in results[:3]] == [None, None, None]
+        assert str(results[3].error).startswith("JavascriptException: javascript error: document unloaded")
+        assert results[4].error == ERROR_SKIPPED
+
+    def test_unsupported_action(self) -> None:
+        """Test unsupported actions are rejected before running any step."""
+        driver = MagicMock()
+        with pytest.raises(ValueError, match="Unsupported action: hover"):
+            run_steps(driver, [Step("hover", By.ID, "name")], timeout=10)
+        driver.execute_async_script.assert_not_called()
+
+    @pytest.mark.parametrize("html_file", [Path("test_browser/test_run_steps.html")])
+    def test_real_browser(self, common_html_loaded_browser: Browser) -> None:
+        """Test the form is filled and submitted, and errors are reported per step."""
+        browser = common_html_loaded_browser
+        results = browser.run_steps(
+            [
+                Step.fill(By.ID, "name", "Alice"),
+                Step.fill(By.NAME, "email", "alice@example.com"),
+                Step.select(By.ID, "plan", "Pro"),
+                Step.fill(By.ID, "comment", "Hello"),
+                Step.click(By.ID, "submit"),
+                Step.wait_for(By.XPATH, "//div[@id='result' and text()]"),
+            ],
+        )
+
+        assert all(result.succeeded for result in results)
+        assert browser.driver.find_element(By.ID, "result").text == "Alice,alice@example.com,pro,Hello,true"
+        results = browser.run_steps(
+            [
+                Step.fill(By.ID, "code", "changed"),
+                Step.select(By.ID, "plan", "Enterprise"),
+                Step.scroll(By.ID, "name"),
+            ],
+            timeout=1,
+        )
+
+        assert [result.error for result in results] == [
+            "Error: Element is not editable: input",
+            ERROR_SKIPPED,
+            ERROR_SKIPPED,
+        ]
+        results = browser.run_steps(
+            [Step.select(By.ID, "plan", "Enterprise"), Step.wait_for(By.ID, "missing")],
+            timeout=1,
+        )
+
+        assert [result.error for result in results] == ["Error: No option to select: Enterprise", ERROR_SKIPPED]
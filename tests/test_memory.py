@@ -0,0 +1,69 @@
+"""Tests for memory.py ."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from seleniumlibraries.memory import DIRECTORY_PROC
+from seleniumlibraries.memory import find_browser_process
+from seleniumlibraries.memory import measure_rss
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+pytestmark = pytest.mark.skipif(not DIRECTORY_PROC.is_dir(), reason="/proc is only available on Linux.")
+
+ARGUMENT = "--user-data-dir=/tmp/seleniumlibraries-test-memory"
+# Starts the child with the same argument like Chrome, and waits for stdin.
+CODE_PARENT = """import subprocess, sys
+child = subprocess.Popen([sys.executable, "-c", "input()", sys.argv[1]], stdin=subprocess.PIPE)
+print(child.pid, flush=True)
+input()
+child.communicate(b"\\n")
+"""
+
+
+@pytest.fixture
+def parent() -> Generator[tuple[int, int]]:
+    """The process IDs of the parent and the child which both have ARGUMENT."""
+    # Reason: Runs the same interpreter. nosec B603
+    with subprocess.Popen(  # noqa: S603
+        [sys.executable, "-c", CODE_PARENT, ARGUMENT],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    ) as process:
+        assert process.stdout is not None
+        pid_child = int(process.stdout.readline())
+        yield process.pid, pid_child
+        process.communicate("\n")
+
+
+class TestMemory:
+    """Test cases for memory.py ."""
+
+    def test_find_browser_process(self, parent: tuple[int, int]) -> None:
+        """Test the root of the processes with the argument is found, not its child."""
+        pid_parent, _pid_child = parent
+
+        assert find_browser_process(ARGUMENT) == pid_parent
+        assert find_browser_process("--user-data-dir=/nonexistent") is None
+
+    def test_measure_rss(self, parent: tuple[int, int]) -> None:
+        """Test the resident set size includes the child process."""
+        pid_parent, pid_child = parent
+        rss_tree = measure_rss(pid_parent)
+        rss_child = measure_rss(pid_child)
+
+        assert rss_child is not None
+        assert rss_child > 0
+        assert rss_tree is not None
+        assert rss_tree > rss_child
+
+    def test_measure_rss_not_found(self) -> None:
+        """Test None is returned for the process which doesn't exist."""
+        assert measure_rss(2**22 + 1) is None
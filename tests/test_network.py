@@ -0,0 +1,121 @@
+"""Tests for network.py ."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from seleniumlibraries.network import NetworkMonitor
+from tests.conftest import FakeSession
+
+if TYPE_CHECKING:
+    from seleniumlibraries.browser import Browser
+    from seleniumlibraries.devtools import Message
+
+IDLE = 0.2
+
+
+class NetworkSession(FakeSession):
+    """Session which responds the ready state of the document."""
+
+    def __init__(self, ready_state: str = "complete") -> None:
+        self.ready_state = ready_state
+        super().__init__()
+
+    def respond(self, method: str, _params: Message | None = None) -> Message:
+        if method == "Runtime.evaluate":
+            return {"result": {"type": "string", "value": self.ready_state}}
+        return {}
+
+
+def create_monitor(session: NetworkSession) -> NetworkMonitor:
+    # Reason: Duck typing for test.
+    return NetworkMonitor(session)  # type: ignore[arg-type]
+
+
+class TestNetworkMonitor:
+    """Test cases for NetworkMonitor class."""
+
+    def test_wait_for_idle(self) -> None:
+        """Test waiting returns once no request has been in flight for the idle duration."""
+        session = NetworkSession()
+        with create_monitor(session) as monitor:
+            session.emit("Network.requestWillBeSent", {"requestId": "1"})
+            session.emit("Network.requestWillBeSent", {"requestId": "1"})
+            session.emit("Network.loadingFinished", {"requestId": "1"}, later=0.1)
+            start = time.monotonic()
+
+            monitor.wait_for_idle(IDLE, 0, timeout=5)
+
+            assert 0.1 + IDLE <= time.monotonic() - start < 0.1 + IDLE + 0.2
+        assert session.listeners == {}
+
+    def test_wait_for_idle_max_inflight(self) -> None:
+        """Test long-lived requests up to max_inflight don't block idle."""
+        session = NetworkSession()
+        with create_monitor(session) as monitor:
+            session.emit("Network.requestWillBeSent", {"requestId": "long-polling"})
+            session.emit("Network.requestWillBeSent", {"requestId": "1"})
+            session.emit("Network.loadingFailed", {"requestId": "1"})
+
+            monitor.wait_for_idle(IDLE, 1, timeout=5)
+            with pytest.raises(TimeoutError, match="Timeout waiting for network idle"):
+                monitor.wait_for_idle(IDLE, 0, timeout=IDLE * 2)
+
+    def test_wait_for_load_state(self) -> None:
+        """Test waiting returns at once when the document has reached the state, otherwise on the event."""
+        session = NetworkSession("interactive")
+        with create_monitor(session) as monitor:
+            start = time.monotonic()
+            monitor.wait_for_load_state("domcontentloaded", timeout=5)
+            assert time.monotonic() - start < IDLE
+
+            session.emit("Page.loadEventFired", {}, later=0.1)
+            monitor.wait_for_load_state("load", timeout=5)
+
+            session.emit("Page.frameNavigated", {"frame": {"id": "child", "parentId": "main"}})
+            monitor.wait_for_load_state("load", timeout=0)
+            session.emit("Page.frameNavigated", {"frame": {"id": "main"}})
+            with pytest.raises(TimeoutError, match="Timeout waiting for load state: domcontentloaded"):
+                monitor.wait_for_load_state("domcontentloaded", timeout=0.1)
+
+    def test_wait_async(self) -> None:
+        """Test awaitable waits wake up on events which the listener thread emits."""
+        session = NetworkSession("loading")
+
+        async def run() -> float:
+            with create_monitor(session) as monitor:
+                session.emit("Network.requestWillBeSent", {"requestId": "1"})
+                session.emit("Page.loadEventFired", {}, later=0.1)
+                session.emit("Network.loadingFinished", {"requestId": "1"}, later=0.1)
+                start = time.monotonic()
+                await monitor.wait_for_load_state_async("load", timeout=5)
+                await monitor.wait_for_idle_async(IDLE, 0, timeout=5)
+                elapsed = time.monotonic() - start
+                session.emit("Network.requestWillBeSent", {"requestId": "2"})
+                with pytest.raises(TimeoutError, match="Timeout waiting for network idle"):
+                    await monitor.wait_for_idle_async(IDLE, 0, timeout=0.1)
+                return elapsed
+
+        assert 0.1 + IDLE <= asyncio.run(run()) < 0.1 + IDLE + 0.2
+
+    def test_unsupported_state(self) -> None:
+        """Test unsupported load states are rejected."""
+        with create_monitor(NetworkSession()) as monitor, pytest.raises(ValueError, match="Unsupported load state"):
+            monitor.wait_for_load_state("networkidle", timeout=1)
+
+    @pytest.mark.parametrize("html_file", [Path("test_browser/wait_for_test.html")])
+    def test_real_browser(self, common_html_loaded_browser: Browser) -> None:
+        """Test Browser waits for the request which the page sends after loading."""
+        browser = common_html_loaded_browser
+        browser.monitor_network()
+        browser.driver.execute_script("setTimeout(() => fetch(location.href), 100);")
+
+        browser.wait_for_load_state("load")
+        browser.wait_for_network_idle(300)
+
+        assert browser.driver.execute_script("return performance.getEntriesByType('resource').length;") == 1
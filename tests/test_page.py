@@ -3,9 +3,21 @@
 from __future__ import annotations
 
 import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 
 from seleniumlibraries.browser import Browser
+from seleniumlibraries.page import Locator
 from seleniumlibraries.page import WebPage
+from tests.conftest import create_mock_browser
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
 
 
 class TestWebPage:
@@ -62,3 +74,101 @@ class TestWebPage:
         assert login_page.browser is fixture_browser
         assert hasattr(login_page, "logger")
         assert login_page.username_field == "username"
+
+
+# Reason: To setup mock pylint: disable=too-few-public-methods
+class LoginPage(WebPage):
+    username = Locator(By.ID, "username")
+    submit = Locator(By.CSS_SELECTOR, "button[type=submit]", timeout=1)
+
+
+def create_locating_browser() -> MagicMock:
+    browser = create_mock_browser()
+    browser.navigations = 0
+    browser.wait_for.side_effect = lambda by, value, **_kwargs: WebElement(browser.driver, f"{by}={value}")
+    return browser
+
+
+class TestLocator:
+    """Test cases for Locator class."""
+
+    def test_cache(self) -> None:
+        """Test the element is located once until the next navigation."""
+        browser = create_locating_browser()
+        page = LoginPage(browser)
+
+        assert page.username.id == "id=username"
+        assert page.username.id == "id=username"
+        browser.wait_for.assert_called_once_with(By.ID, "username", timeout=None)
+
+        browser.navigations += 1
+        assert page.username.id == "id=username"
+        expected_call_count = 2
+        assert browser.wait_for.call_count == expected_call_count
+
+    def test_stale(self) -> None:
+        """Test the stale element locates itself again."""
+        browser = create_locating_browser()
+        browser.driver.execute.side_effect = [
+            StaleElementReferenceException("stale element reference"),
+            {"value": "Log in"},
+        ]
+        page = LoginPage(browser)
+
+        assert page.submit.text == "Log in"
+
+        assert browser.wait_for.call_count == len(browser.driver.execute.call_args_list)
+        browser.wait_for.assert_called_with(By.CSS_SELECTOR, "button[type=submit]", timeout=1)
+
+    def test_locate_all(self) -> None:
+        """Test all locators are located in one script call and found elements are cached."""
+        browser = create_locating_browser()
+        browser.driver.execute_script.return_value = [WebElement(browser.driver, "1"), None]
+        page = LoginPage(browser)
+
+        elements = page.locate_all()
+
+        assert {name: element and element.id for name, element in elements.items()} == {
+            "username": "1",
+            "submit": None,
+        }
+        assert browser.driver.execute_script.call_args.args[1] == [
+            [By.ID, "username"],
+            [By.CSS_SELECTOR, "button[type=submit]"],
+        ]
+        assert page.username.id == "1"
+        browser.wait_for.assert_not_called()
+
+    @pytest.mark.parametrize("html_file", [Path("test_browser/wait_for_test.html")])
+    def test_real_browser(self, common_html_loaded_browser: Browser) -> None:
+        """Test cached elements are located again after navigation."""
+
+        # Reason: To setup page pylint: disable=too-few-public-methods
+        class WaitForPage(WebPage):
+            element = Locator(By.ID, "immediate-element")
+
+        page = WaitForPage(common_html_loaded_browser)
+        element = page.element
+        assert page.element is element
+
+        common_html_loaded_browser.driver.refresh()
+
+        assert page.element is not element
+        assert page.element.text == element.text
+
+    def test_recycle(self) -> None:
+        """Test Browser is recycled once before the outermost operation, not in the middle of it."""
+
+        # Reason: To setup page pylint: disable=too-few-public-methods
+        class FormPage(WebPage):
+            def submit(self) -> str:
+                return self.fill()
+
+            def fill(self) -> str:
+                return "filled"
+
+        browser = create_locating_browser()
+        page = FormPage(browser)
+
+        assert page.submit() == "filled"
+        browser.recycle.assert_called_once_with()
@@ -0,0 +1,154 @@
+"""Tests for pool.py ."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from seleniumlibraries.pool import BrowserPool
+from tests.conftest import create_mock_browser
+
+
+class TestBrowserPool:
+    """Test cases for BrowserPool class."""
+
+    def test_fill_on_enter(self) -> None:
+        """Test BrowserPool starts min_size browsers when entering."""
+        factory = Mock(side_effect=create_mock_browser)
+        with BrowserPool(min_size=2, max_size=3, factory=factory) as pool:
+            expected_size = 2
+            assert factory.call_count == expected_size
+            assert pool.size == expected_size
+            assert len(pool.idle) == expected_size
+
+    def test_reuse(self) -> None:
+        """Test BrowserPool reuses the warm browser after resetting it."""
+        factory = Mock(side_effect=create_mock_browser)
+        with BrowserPool(max_size=2, factory=factory) as pool:
+            with pool.checkout() as browser1:
+                pass
+            with pool.checkout() as browser2:
+                pass
+            assert browser1 is browser2
+            assert factory.call_count == 1
+            expected_reset_count = 2
+            assert cast_mock(browser1).reset.call_count == expected_reset_count
+
+    def test_recycle_after_max_uses(self) -> None:
+        """Test BrowserPool quits the browser used max_uses times."""
+        factory = Mock(side_effect=create_mock_browser)
+        with BrowserPool(min_size=1, max_size=1, max_uses=1, factory=factory) as pool:
+            with pool.checkout() as browser1:
+                pass
+            cast_mock(browser1).__exit__.assert_called_once()
+            with pool.checkout() as browser2:
+                assert browser2 is not browser1
+
+    def test_recycle_after_max_age(self) -> None:
+        """Test BrowserPool quits the browser older than max_age."""
+        factory = Mock(side_effect=create_mock_browser)
+        with BrowserPool(min_size=1, max_size=1, max_age=0, factory=factory) as pool:
+            browser_expired = pool.idle[0].browser
+            with pool.checkout() as browser:
+                assert browser is not browser_expired
+            cast_mock(browser_expired).__exit__.assert_called_once()
+
+    def test_discard_when_reset_fails(self) -> None:
+        """Test BrowserPool discards the browser which failed the health check."""
+        browser_dead = create_mock_browser()
+        browser_dead.reset.side_effect = WebDriverException("invalid session id")
+        factory = Mock(side_effect=[browser_dead, create_mock_browser()])
+        with BrowserPool(max_size=1, factory=factory) as pool:
+            with pool.checkout():
+                pass
+            browser_dead.__exit__.assert_called_once()
+            assert pool.size == 0
+            with pool.checkout() as browser:
+                assert browser is not browser_dead
+
+    def test_discard_when_reset_raises_os_error(self) -> None:
+        """Test BrowserPool frees the slot when resetting raises other than WebDriverException."""
+        browser_broken = create_mock_browser()
+        browser_broken.reset.side_effect = FileNotFoundError("file.bin.crdownload")
+        factory = Mock(side_effect=[browser_broken, create_mock_browser()])
+        with BrowserPool(max_size=1, factory=factory) as pool:
+            with pool.checkout():
+                pass
+            browser_broken.__exit__.assert_called_once()
+            assert pool.size == 0
+            with pool.checkout(block=False) as browser:
+                assert browser is not browser_broken
+
+    def test_quit_expired_without_condition(self) -> None:
+        """Test BrowserPool quits expired browsers after releasing the condition so that others can proceed."""
+        acquired_by_others: list[bool] = []
+
+        def try_acquire() -> None:
+            if pool.condition.acquire(timeout=1):
+                acquired_by_others.append(True)
+                pool.condition.release()
+
+        def quit_browser(*_args: object) -> None:
+            thread = threading.Thread(target=try_acquire)
+            thread.start()
+            thread.join()
+
+        pool = BrowserPool(min_size=1, max_size=1, max_age=0, factory=create_mock_browser)
+        with pool:
+            browser_expired = pool.idle[0].browser
+            cast_mock(browser_expired).__exit__.side_effect = quit_browser
+            with pool.checkout():
+                pass
+        assert acquired_by_others == [True]
+
+    def test_non_blocking_acquire(self) -> None:
+        """Test BrowserPool raises TimeoutError immediately when exhausted and block is False."""
+        pool = BrowserPool(max_size=1, factory=create_mock_browser)
+        with pool, pool.checkout(), pytest.raises(TimeoutError):
+            pool.acquire(block=False)
+
+    def test_acquire_timeout(self) -> None:
+        """Test BrowserPool raises TimeoutError when no browser is released within timeout."""
+        pool = BrowserPool(max_size=1, factory=create_mock_browser)
+        with pool, pool.checkout(), pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.1)
+
+    def test_blocking_acquire_waits_for_release(self) -> None:
+        """Test BrowserPool hands the released browser to the waiting thread."""
+        with BrowserPool(max_size=1, factory=create_mock_browser) as pool:
+            browser = pool.acquire()
+            timer = threading.Timer(0.1, pool.release, args=(browser,))
+            timer.start()
+            assert pool.acquire(timeout=5) is browser
+            timer.join()
+
+    def test_close(self) -> None:
+        """Test BrowserPool quits idle browsers and refuses new checkouts after closing."""
+        pool = BrowserPool(min_size=1, factory=create_mock_browser)
+        with pool:
+            browser = pool.idle[0].browser
+        cast_mock(browser).__exit__.assert_called_once()
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+
+    def test_invalid_size(self) -> None:
+        """Test BrowserPool rejects min_size greater than max_size."""
+        with pytest.raises(ValueError, match="Invalid pool size"):
+            BrowserPool(min_size=2, max_size=1)
+
+    def test_real_browser(self) -> None:
+        """Test BrowserPool with real browsers."""
+        with BrowserPool(max_size=1) as pool:
+            with pool.checkout() as browser1:
+                browser1.driver.execute_script("window.open('about:blank');")
+            with pool.checkout() as browser2:
+                assert browser2 is browser1
+                assert len(browser2.driver.window_handles) == 1
+
+
+def cast_mock(browser: object) -> Mock:
+    assert isinstance(browser, Mock)
+    return browser
@@ -0,0 +1,133 @@
+"""Tests for profiles.py ."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from seleniumlibraries.profiles import copy_profile
+from seleniumlibraries.profiles import load_cookies
+from seleniumlibraries.profiles import save_profile
+
+if TYPE_CHECKING:
+    import os
+
+COOKIE = {
+    "name": "session",
+    "value": "secret",
+    "domain": "example.com",
+    "path": "/",
+    "expires": 2000000000.0,
+    "size": 13,
+    "httpOnly": True,
+    "secure": True,
+    "session": False,
+    "sameSite": "Lax",
+    "priority": "Medium",
+    "sourceScheme": "Secure",
+    "sourcePort": 443,
+}
+
+
+def create_profile(directory: Path) -> Path:
+    (directory / "Default" / "Local Storage").mkdir(parents=True)
+    (directory / "Default" / "Cookies").write_bytes(b"cookies")
+    (directory / "Default" / "Local Storage" / "000003.log").write_bytes(b"storage")
+    (directory / "lockfile").touch()
+    (directory / "SingletonLock").symlink_to("host-12345")
+    return directory
+
+
+class TestCopyProfile:
+    """Test cases for copy_profile function."""
+
+    def test_copy(self, tmp_path: Path) -> None:
+        """Test copy_profile copies files except locks of running Chrome."""
+        source = create_profile(tmp_path / "source")
+        destination = tmp_path / "destination"
+
+        copy_profile(source, destination)
+
+        assert (destination / "Default" / "Cookies").read_bytes() == b"cookies"
+        assert (destination / "Default" / "Local Storage" / "000003.log").read_bytes() == b"storage"
+        assert not (destination / "lockfile").exists()
+        assert not (destination / "SingletonLock").is_symlink()
+
+    def test_copy_without_reflink(self, tmp_path: Path) -> None:
+        """Test copy_profile falls back to copying when the filesystem doesn't support reflink."""
+        source = create_profile(tmp_path / "source")
+        destination = tmp_path / "destination"
+
+        with patch("fcntl.ioctl", side_effect=OSError("Operation not supported")):
+            copy_profile(source, destination)
+
+        assert (destination / "Default" / "Cookies").read_bytes() == b"cookies"
+
+    def test_copy_is_independent(self, tmp_path: Path) -> None:
+        """Test writing into the copy doesn't change the source."""
+        source = create_profile(tmp_path / "source")
+        destination = tmp_path / "destination"
+
+        copy_profile(source, destination)
+        (destination / "Default" / "Cookies").write_bytes(b"changed")
+
+        assert (source / "Default" / "Cookies").read_bytes() == b"cookies"
+
+
+class TestSaveProfile:
+    """Test cases for save_profile and load_cookies functions."""
+
+    def test_save(self, tmp_path: Path) -> None:
+        """Test save_profile replaces the template and load_cookies returns parameters of Network.setCookies."""
+        template = tmp_path / "template"
+        (template / "Default").mkdir(parents=True)
+        (template / "Default" / "Stale").touch()
+        profile = create_profile(tmp_path / "profile")
+
+        save_profile(profile, template, [COOKIE, {**COOKIE, "name": "temporary", "session": True}])
+
+        assert (template / "Default" / "Cookies").read_bytes() == b"cookies"
+        assert not (template / "Default" / "Stale").exists()
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["profile", "template"]
+        expected = {
+            "name": "session",
+            "value": "secret",
+            "domain": "example.com",
+            "path": "/",
+            "secure": True,
+            "httpOnly": True,
+            "sameSite": "Lax",
+            "priority": "Medium",
+            "sourceScheme": "Secure",
+        }
+        assert load_cookies(template) == [
+            {**expected, "expires": 2000000000.0},
+            {**expected, "name": "temporary"},
+        ]
+
+    def test_save_restores_template(self, tmp_path: Path) -> None:
+        """Test save_profile restores the old template when the swap fails."""
+        template = tmp_path / "template"
+        (template / "Default").mkdir(parents=True)
+        (template / "Default" / "Stale").touch()
+        profile = create_profile(tmp_path / "profile")
+        replace = Path.replace
+
+        def replace_failing_staging(self: Path, target: str | os.PathLike[str]) -> Path:
+            if self.name.startswith(".template-") and Path(target) == template:
+                message = "Permission denied"
+                raise OSError(message)
+            return replace(self, target)
+
+        with patch.object(Path, "replace", replace_failing_staging), pytest.raises(OSError, match="Permission denied"):
+            save_profile(profile, template, [COOKIE])
+
+        assert (template / "Default" / "Stale").exists()
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["profile", "template"]
+
+    def test_load_cookies_without_saved_cookies(self, tmp_path: Path) -> None:
+        """Test load_cookies returns nothing for the profile which save_profile didn't create."""
+        assert load_cookies(create_profile(tmp_path)) == []
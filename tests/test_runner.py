@@ -0,0 +1,147 @@
+"""Tests for runner.py ."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from seleniumlibraries.runner import Checkpoint
+from seleniumlibraries.runner import run_jobs
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from seleniumlibraries.browser import Browser
+
+
+class FakeBrowser:
+    """Browser which doesn't start Chrome, created in worker processes."""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        pass
+
+
+def create_browser() -> Browser:
+    # Reason: Duck typing for test.
+    return FakeBrowser()  # type: ignore[return-value]
+
+
+def scrape(_browser: Browser, job: dict[str, Any]) -> Any:  # noqa: ANN401
+    """Doubles the value, or fails as the job specifies."""
+    if job.get("child"):
+        # Reason: To simulate chromedriver which the worker starts.
+        child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        Path(job["child"]).write_text(json.dumps([child.pid, tempfile.gettempdir()]), encoding="utf-8")
+    if job.get("sleep"):
+        time.sleep(job["sleep"])
+    if job.get("crash"):
+        # Reason: To simulate the crash of the worker.
+        os._exit(1)
+    if job.get("error"):
+        msg = "Failed to scrape."
+        raise ValueError(msg)
+    if job.get("unserializable"):
+        return {job["value"]}
+    return int(job["value"]) * 2
+
+
+def is_running(pid: int) -> bool:
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return False
+    # Reason: Zombies have exited.
+    return stat.rsplit(")", 1)[1].split()[0] != "Z"
+
+
+def run(path: Path, jobs: list[dict[str, Any]], **kwargs: Any) -> dict[int, Any]:  # noqa: ANN401
+    results = run_jobs(path, scrape, jobs, factory=create_browser, **kwargs)
+    return {result.job["value"]: result for result in results}
+
+
+class TestRunJobs:
+    """Test cases for run_jobs function."""
+
+    def test_run(self, tmp_path: Path) -> None:
+        """Test jobs run across workers, and completed jobs are skipped on resume."""
+        path = tmp_path / "checkpoint.sqlite3"
+        jobs = [{"value": value} for value in range(6)]
+
+        results = run(path, [*jobs, jobs[0]], workers=2)
+
+        assert {value: result.result for value, result in results.items()} == {value: value * 2 for value in range(6)}
+        assert all(result.succeeded and result.attempts == 1 for result in results.values())
+        resumed = run(path, [*jobs, {"value": 6}])
+
+        assert {value: result.result for value, result in resumed.items()} == {6: 12}
+        with Checkpoint(path) as checkpoint:
+            expected = 7
+            assert len(checkpoint.results()) == expected
+
+    def test_failures(self, tmp_path: Path) -> None:
+        """Test a hang, a crash and an error fail only their own jobs."""
+        jobs = [
+            {"value": 0, "sleep": 10},
+            {"value": 1, "crash": True},
+            {"value": 2, "error": True},
+            {"value": 3},
+            {"value": 4},
+            {"value": 5, "unserializable": True},
+        ]
+        start = time.monotonic()
+
+        results = run(tmp_path / "checkpoint.sqlite3", jobs, workers=2, timeout=1, retries=1)
+
+        assert time.monotonic() - start < jobs[0]["sleep"]
+        assert "Timeout after 1 seconds." in str(results[0].error)
+        assert "Worker exited with code 1." in str(results[1].error)
+        assert "ValueError: Failed to scrape." in str(results[2].error)
+        assert "TypeError: Object of type set is not JSON serializable" in str(results[5].error)
+        expected_attempts = 2
+        assert all(results[value].attempts == expected_attempts for value in range(3))
+        assert [results[value].result for value in (3, 4)] == [6, 8]
+
+    @pytest.mark.skipif(not Path("/proc").is_dir(), reason="Requires procfs.")
+    def test_kill(self, tmp_path: Path) -> None:
+        """Test the timeout kills processes which the worker started, and removes its temporary directory."""
+        path_child = tmp_path / "child.json"
+
+        (result,) = run(
+            tmp_path / "checkpoint.sqlite3",
+            [{"value": 0, "child": str(path_child), "sleep": 10}],
+            timeout=1,
+            retries=0,
+        ).values()
+
+        assert not result.succeeded
+        pid, directory = json.loads(path_child.read_text(encoding="utf-8"))
+        deadline = time.monotonic() + 5
+        while is_running(pid) and time.monotonic() < deadline:
+            time.sleep(0.1)
+        assert not is_running(pid)
+        assert Path(directory).name.startswith("seleniumlibraries-worker-")
+        assert not Path(directory).exists()
+
+    def test_invalid_workers(self, tmp_path: Path) -> None:
+        """Test the number of workers is validated."""
+        with pytest.raises(ValueError, match="Invalid number of workers"):
+            run(tmp_path / "checkpoint.sqlite3", [], workers=0)
@@ -0,0 +1,63 @@
+"""Tests for __init__.py ."""
+
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import seleniumlibraries
+
+# The cumulative microseconds to import the package, which is about 2 milliseconds on a laptop.
+BUDGET_IMPORT_TIME = 50_000
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    # Reason: Runs the same interpreter in a fresh process to measure import from scratch.
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )  # nosec B603
+
+
+class TestSeleniumLibraries:
+    """Test cases for the top-level package."""
+
+    @pytest.mark.parametrize("module", sorted(set(seleniumlibraries.MODULES.values())))
+    def test_modules(self, module: str) -> None:
+        """Test the attributes of the package match `__all__` of each module."""
+        expected = sorted(name for name, value in seleniumlibraries.MODULES.items() if value == module)
+
+        assert sorted(importlib.import_module(f"seleniumlibraries.{module}").__all__) == expected
+
+    def test_getattr(self) -> None:
+        """Test attributes and modules are resolved lazily, and unknown attributes raise AttributeError."""
+        from seleniumlibraries.browser import Browser  # noqa: PLC0415 pylint: disable=import-outside-toplevel
+
+        assert seleniumlibraries.Browser is Browser
+        assert seleniumlibraries.browser is importlib.import_module("seleniumlibraries.browser")
+        assert "Browser" in dir(seleniumlibraries)
+        with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+            _ = seleniumlibraries.Unknown
+
+    def test_lazy_import(self) -> None:
+        """Test importing the package and get_text doesn't load Selenium."""
+        code = (
+            "import sys\n"
+            "from seleniumlibraries import get_text\n"
+            "print(','.join(name for name in sys.modules if name.split('.')[0] == 'selenium'))\n"
+        )
+
+        assert run_python(code).stdout.strip() == ""
+
+    def test_import_time(self) -> None:
+        """Test importing the package fits in the budget."""
+        stderr = run_python("import seleniumlibraries", "-X", "importtime").stderr
+        (line,) = (line for line in stderr.splitlines() if line.endswith("| seleniumlibraries"))
+        cumulative = int(line.split("|")[1])
+
+        assert cumulative < BUDGET_IMPORT_TIME
@@ -0,0 +1,64 @@
+"""Tests for service.py ."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+from selenium.webdriver import ChromeOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from seleniumlibraries.browser import Browser
+from seleniumlibraries.service import DriverService
+from seleniumlibraries.service import SharedChrome
+
+URL = "http://localhost:9515"
+
+
+class TestDriverService:
+    """Test cases for DriverService class."""
+
+    def test_url(self) -> None:
+        """Test chromedriver already running is used as it is, and isn't stopped."""
+        with DriverService(URL) as service:
+            assert service.url == URL
+            assert service.service is None
+
+        assert service.url == URL
+
+    def test_not_started(self) -> None:
+        """Test the URL isn't available before starting."""
+        with pytest.raises(RuntimeError, match="The service is not started"):
+            _ = DriverService().url
+
+    def test_shared(self) -> None:
+        """Test browsers share one chromedriver which outlives them."""
+        with DriverService() as service:
+            assert service.service is not None
+            process = service.service.process
+            with Browser(service=service) as browser1, Browser(service=service) as browser2:
+                browser1.driver.get("about:blank")
+                browser2.driver.get("about:blank")
+                assert browser1.driver.session_id != browser2.driver.session_id
+            assert process.poll() is None
+
+        assert process.poll() is not None
+
+
+class TestSharedChrome:
+    """Test cases for SharedChrome class."""
+
+    @patch.object(WebDriver, "__init__", return_value=None)
+    @patch("seleniumlibraries.service.DriverFinder")
+    def test_binary_location(self, driver_finder: Mock, init: Mock) -> None:
+        """Test Chrome is located through DriverFinder same as Chrome() does."""
+        driver_finder.return_value.get_browser_path.return_value = "/opt/chrome/chrome"
+        options = ChromeOptions()
+        options.browser_version = "stable"
+
+        SharedChrome(URL, options)
+
+        assert options.binary_location == "/opt/chrome/chrome"
+        assert options.browser_version is None
+        assert init.call_args.kwargs["options"] is options
@@ -0,0 +1,134 @@
+"""Tests for snapshot.py ."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from seleniumlibraries.element import get_text
+from seleniumlibraries.snapshot import Snapshot
+
+if TYPE_CHECKING:
+    from seleniumlibraries.browser import Browser
+
+
+class NodesBuilder:
+    """Builds nodes in the format of JAVASCRIPT_SNAPSHOT in document order."""
+
+    def __init__(self) -> None:
+        self.nodes: list[list[Any]] = []
+
+    def element(
+        self,
+        parent: int | None,
+        tag: str,
+        attributes: dict[str, str] | None = None,
+        *,
+        visible: bool = True,
+        display: str = "block",
+    ) -> int:
+        self.nodes.append([parent, tag, attributes or {}, visible, display])
+        return len(self.nodes) - 1
+
+    def text(self, parent: int, data: str) -> None:
+        self.nodes.append([parent, None, data])
+
+
+@pytest.fixture
+def snapshot() -> Snapshot:
+    """The snapshot of a small document."""
+    builder = NodesBuilder()
+    html = builder.element(None, "html")
+    body = builder.element(html, "body")
+    main = builder.element(body, "div", {"id": "main", "class": "content box"})
+    h1 = builder.element(main, "h1")
+    builder.text(h1, "Title")
+    p = builder.element(main, "p", {"class": "note"})
+    builder.text(p, "\n  Hello\n  ")
+    a = builder.element(p, "a", {"href": "/next"}, display="inline")
+    builder.text(a, "Next page")
+    span = builder.element(p, "span", visible=False, display="none")
+    builder.text(span, "secret")
+    ul = builder.element(body, "ul")
+    for item in ("One", "Two", "Three"):
+        li = builder.element(ul, "li", {"data-item": item.lower()}, display="list-item")
+        builder.text(li, item)
+    builder.element(body, "input", {"name": "q", "value": "typed"}, display="inline-block")
+    return Snapshot(builder.nodes)
+
+
+class TestSnapshot:
+    """Test cases for Snapshot class."""
+
+    @pytest.mark.parametrize(
+        ("by", "value", "expected"),
+        [
+            (By.ID, "main", ["div"]),
+            (By.NAME, "q", ["input"]),
+            (By.CLASS_NAME, "box", ["div"]),
+            (By.TAG_NAME, "LI", ["li", "li", "li"]),
+            (By.LINK_TEXT, "Next page", ["a"]),
+            (By.PARTIAL_LINK_TEXT, "Next", ["a"]),
+            (By.CSS_SELECTOR, "div#main.content > p a[href^='/']", ["a"]),
+            (By.CSS_SELECTOR, "h1 + p, input", ["p", "input"]),
+            (By.CSS_SELECTOR, "div ~ ul > li[data-item$=o]", ["li"]),
+            (By.CSS_SELECTOR, "body > a", []),
+            (By.XPATH, "//ul/li[2]", ["li"]),
+            (By.XPATH, "/html/body/*[last()]", ["input"]),
+            (By.XPATH, "//li[@data-item='three']/..", ["ul"]),
+            (By.XPATH, "//p[contains(., 'secret')]/a[starts-with(@href, '/')]", ["a"]),
+            (By.XPATH, "//*[text()='Title']", ["h1"]),
+            (By.XPATH, '//li[@data-item="two"]', ["li"]),
+            (By.XPATH, "//div[@class]//span", ["span"]),
+        ],
+    )
+    def test_find_elements(self, snapshot: Snapshot, by: str, value: str, expected: list[str]) -> None:
+        """Test locator strategies select elements in document order."""
+        assert [element.tag_name for element in snapshot.find_elements(by, value)] == expected
+
+    def test_find_element(self, snapshot: Snapshot) -> None:
+        """Test queries relative to the element, and NoSuchElementException when not found."""
+        ul = snapshot.find_element(By.TAG_NAME, "ul")
+
+        assert ul.find_element(By.XPATH, "./li[3]").get_attribute("data-item") == "three"
+        assert ul.find_element(By.CSS_SELECTOR, "body li").text == "One"
+        with pytest.raises(NoSuchElementException):
+            ul.find_element(By.TAG_NAME, "h1")
+
+    def test_text(self, snapshot: Snapshot) -> None:
+        """Test texts approximate innerText of rendered elements and fall back to textContent."""
+        assert snapshot.find_element(By.ID, "main").text == "Title\nHello Next page"
+        assert snapshot.find_element(By.TAG_NAME, "ul").text == "One\nTwo\nThree"
+        assert snapshot.find_element(By.TAG_NAME, "span").text == "secret"
+        assert snapshot.find_element(By.NAME, "q").get_attribute("value") == "typed"
+
+    @pytest.mark.parametrize(
+        ("by", "value"),
+        [
+            (By.CSS_SELECTOR, "a:first-child"),
+            (By.CSS_SELECTOR, "div,"),
+            (By.CSS_SELECTOR, "ul >"),
+            (By.XPATH, "//a | //p"),
+            (By.XPATH, "//div[@class='content box' or @id='main']"),
+            (By.XPATH, "//*[contains(@class,'content') and contains(@class,'box')]"),
+        ],
+    )
+    def test_unsupported(self, snapshot: Snapshot, by: str, value: str) -> None:
+        """Test queries out of the subset are rejected instead of returning wrong elements."""
+        with pytest.raises(ValueError, match="Unsupported"):
+            snapshot.find_elements(by, value)
+
+    @pytest.mark.parametrize("html_file", [Path("test_browser/wait_for_test.html")])
+    def test_real_browser(self, common_html_loaded_browser: Browser) -> None:
+        """Test the snapshot answers the same as WebDriver."""
+        driver = common_html_loaded_browser.driver
+        snapshot = common_html_loaded_browser.snapshot()
+
+        for by, value in [(By.ID, "immediate-element"), (By.TAG_NAME, "div"), (By.XPATH, "//div[@id]")]:
+            expected = [get_text(element) for element in driver.find_elements(by, value)]
+            assert [element.text for element in snapshot.find_elements(by, value)] == expected
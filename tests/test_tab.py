@@ -0,0 +1,155 @@
+"""Tests for tab.py ."""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+from unittest.mock import call
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from seleniumlibraries.tab import Tab
+from seleniumlibraries.tab import load_in_tabs
+from tests.conftest import FakeSession
+from tests.conftest import create_mock_browser
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from seleniumlibraries.browser import Browser
+    from seleniumlibraries.devtools import Message
+
+
+class TabSession(FakeSession):
+    """Session of a tab which loads pages when tests tell it."""
+
+    def __init__(self) -> None:
+        self.loader_ids = (f"loader-{number}" for number in itertools.count())
+        self.navigated: list[tuple[str, str]] = []
+        super().__init__()
+
+    def respond(self, method: str, params: Message | None = None) -> Message:
+        if method != "Page.navigate" or params is None:
+            return {}
+        if params["url"].endswith(".invalid/"):
+            return {"frameId": "frame", "errorText": "net::ERR_NAME_NOT_RESOLVED"}
+        loader_id = next(self.loader_ids)
+        self.navigated.append((params["url"], loader_id))
+        return {"frameId": "frame", "loaderId": loader_id}
+
+    def load(self, url: str) -> None:
+        loader_id = next(loader_id for navigated, loader_id in self.navigated if navigated == url)
+        self.emit("Page.lifecycleEvent", {"frameId": "frame", "loaderId": loader_id, "name": "load"})
+
+
+@pytest.fixture
+def browser() -> MagicMock:
+    browser = create_mock_browser()
+    browser.driver.current_window_handle = "main"
+    browser.lock = threading.RLock()
+    browser.tab_loaded = threading.Condition()
+    browser.devtools.attach.side_effect = lambda _handle: TabSession()
+    browser.open_tab.side_effect = lambda: Tab(browser, "handle")
+    return browser
+
+
+def get_session(tab: Tab) -> TabSession:
+    # Reason: Created by the fixture.
+    return tab.session  # type: ignore[return-value]
+
+
+class TestTab:
+    """Test cases for Tab class."""
+
+    def test_navigate(self, browser: MagicMock) -> None:
+        """Test navigate doesn't wait for the load event, and wait_for_load does."""
+        tab = Tab(browser, "handle")
+        tab.navigate("https://example.com/")
+
+        assert not tab.is_loaded
+        with pytest.raises(TimeoutError, match="Timeout waiting for loading page"):
+            tab.wait_for_load(0.1)
+
+        threading.Timer(0.1, get_session(tab).load, args=("https://example.com/",)).start()
+        tab.wait_for_load(5)
+
+        assert tab.is_loaded
+
+    def test_navigate_failure(self, browser: MagicMock) -> None:
+        """Test navigate raises WebDriverException when the page can't be reached."""
+        tab = Tab(browser, "handle")
+        with pytest.raises(WebDriverException, match="ERR_NAME_NOT_RESOLVED"):
+            tab.navigate("https://example.invalid/")
+
+    def test_activate(self, browser: MagicMock) -> None:
+        """Test methods switch to the tab before acting and back to the previous tab after."""
+        tab = Tab(browser, "handle")
+        tab.get_texts(By.TAG_NAME, "h1")
+
+        assert browser.driver.switch_to.window.call_args_list == [call("handle"), call("main")]
+        browser.get_texts.assert_called_once_with(By.TAG_NAME, "h1")
+
+    def test_close(self, browser: MagicMock) -> None:
+        """Test close detaches the session, closes the tab and switches back to the previous tab."""
+        tab = Tab(browser, "handle")
+        session = get_session(tab)
+        tab.close()
+
+        session.detach.assert_called_once_with()
+        assert session.listeners == {}
+        browser.driver.close.assert_called_once_with()
+        assert browser.driver.switch_to.window.call_args_list == [call("handle"), call("main")]
+
+
+class TestLoadInTabs:
+    """Test cases for load_in_tabs function."""
+
+    def test_order_of_completion(self, browser: MagicMock) -> None:
+        """Test tabs are yielded in the order of completion of loading and reused for the rest of URLs."""
+        urls = [f"https://example.com/{number}" for number in range(3)]
+        tabs: list[Tab] = []
+
+        def open_tab() -> Tab:
+            tabs.append(Tab(browser, f"handle-{len(tabs)}"))
+            return tabs[-1]
+
+        browser.open_tab.side_effect = open_tab
+        iterator = load_in_tabs(browser, urls, tabs=2)
+
+        threading.Timer(0.1, lambda: get_session(tabs[1]).load(urls[1])).start()
+        first = next(iterator)
+        assert first == (tabs[1], urls[1])
+
+        threading.Timer(0.1, lambda: get_session(tabs[1]).load(urls[2])).start()
+        get_session(tabs[0]).load(urls[0])
+        second = next(iterator)
+        assert second == (tabs[0], urls[0])
+
+        third = next(iterator)
+        assert third == (tabs[1], urls[2])
+        assert next(iterator, None) is None
+        assert browser.driver.close.call_count == len(tabs)
+
+    def test_fewer_urls_than_tabs(self, browser: MagicMock) -> None:
+        """Test only as many tabs as URLs are opened."""
+        tab = Tab(browser, "handle")
+        browser.open_tab.side_effect = None
+        browser.open_tab.return_value = tab
+        iterator = load_in_tabs(browser, ["https://example.com/"], tabs=4)
+        threading.Timer(0.1, get_session(tab).load, args=("https://example.com/",)).start()
+
+        assert list(iterator) == [(tab, "https://example.com/")]
+        browser.open_tab.assert_called_once_with()
+
+    def test_real_browser(self, fixture_browser: Browser, resource_path_root: Path) -> None:
+        """Test load_in_tabs with real browser."""
+        url = f"file://{resource_path_root / 'test_element/test.html'}"
+
+        results = [(url, tab.get_texts(By.ID, "simple-text")) for tab, url in load_in_tabs(fixture_browser, [url] * 3)]
+
+        assert results == [(url, ["Hello World"])] * 3
+        assert len(fixture_browser.driver.window_handles) == 1